@@ -5,40 +5,58 @@
 # @brief Defines the logger class.
 #
 # @section description_logger Description
-# Defines the logger class, which render the logger gui, and allows you to send messages to it
+# Defines the logger class, which render the logger gui, and allows you to send messages to it.
+# The console logger writes the same messages to the terminal instead, without loading the gui.
 #
 # @section libraries_logger Libraries/Modules
 # - access to logger extension from gui library
 # - access to logging module
+# - standart sys library (https://docs.python.org/3/library/sys.html)
+# - access to lazy module imports
 #
 # @section author_logger Author(s)
 # - Created by mutedspectre.eth on 07/20/2023.
-# - Modified by mutedspectre.eth on 07/26/2023.
+# - Modified by mutedspectre.eth on 10/16/2026.
 
-from dearpygui.dearpygui import inspect
-from dearpygui_ext import logger
 import logging
+import sys
+from lazy_module import lazy_import
+
+# The gui library is loaded only when a logger window is rendered
+logger = lazy_import('dearpygui_ext.logger')
 
 class Logger:
     """ The logger base class."""
 
+    ## Window logger, None without gui.
+    logz = None
+
     def create_logger(self, logger_name):
         """ Render logger window in parent window."""
 
         # Create local logger
+        self.create_file_logger(logger_name, 'logs.log')
+
+        # Create window logger
+        self.logz = logger.mvLogger(parent='logger')
+
+    def create_file_logger(self, logger_name, log_file):
+        """ Create local logger writing to a file.
+
+        @param logger_name The name of the logger
+        @param log_file    The path to the log file
+        """
+
         self.logger_name = logger_name
         self.file_logger = logging.getLogger(self.logger_name)
         self.file_logger.setLevel(logging.INFO)
 
-        formatter = logging.Formatter('[%(asctime)s] [%(levelname)s] -> %(message)s')
+        self.formatter = logging.Formatter('[%(asctime)s] [%(levelname)s] -> %(message)s')
 
-        file_handler = logging.FileHandler('logs.log')
-        file_handler.setFormatter(formatter)
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(self.formatter)
 
         self.file_logger.addHandler(file_handler)
-
-        # Create window logger
-        self.logz = logger.mvLogger(parent='logger')
     
     def info_log(self, address, text):
         """ Send a log message to the info level.
@@ -49,7 +67,8 @@ class Logger:
 
         addr = address[:6] + '...' + address[-4:]
         self.file_logger.info(f"[{self.logger_name}] {addr} | {text}")
-        self.logz.log_info(f"{addr} | {text}\n")
+        if self.logz is not None:
+            self.logz.log_info(f"{addr} | {text}\n")
     
     def all_info_log(self, text):
         """ Send a log message to the info level without address.
@@ -58,7 +77,8 @@ class Logger:
         """
 
         self.file_logger.info(f"[{self.logger_name}] {text}")
-        self.logz.log_info(f"{text}\n")
+        if self.logz is not None:
+            self.logz.log_info(f"{text}\n")
 
     def warning_log(self, address, text):
         """ Send a log message to the warn level.
@@ -69,7 +89,8 @@ class Logger:
 
         addr = address[:6] + '...' + address[-4:]
         self.file_logger.warning(f"[{self.logger_name}] {addr} | {text}")
-        self.logz.log_warning(f"{addr} | {text}\n")
+        if self.logz is not None:
+            self.logz.log_warning(f"{addr} | {text}\n")
 
     def error_log(self, address, text):
         """ Send a log message to the error level.
@@ -80,7 +101,8 @@ class Logger:
 
         addr = address[:6] + '...' + address[-4:]
         self.file_logger.error(f"[{self.logger_name}] {addr} | {text}")
-        self.logz.log_error(f"{addr} | {text}\n")
+        if self.logz is not None:
+            self.logz.log_error(f"{addr} | {text}\n")
 
     def all_error_log(self, text):
         """ Send a log message to the error level.
@@ -89,4 +111,22 @@ class Logger:
         """
 
         self.file_logger.error(f"[{self.logger_name}] {text}")
-        self.logz.log_error(f"{text}\n")
\ No newline at end of file
+        if self.logz is not None:
+            self.logz.log_error(f"{text}\n")
+
+class ConsoleLogger(Logger):
+    """ The logger writing to the terminal and a file, without gui."""
+
+    def create_logger(self, logger_name, log_file='logs.log'):
+        """ Create logger writing to the terminal and a file.
+
+        @param logger_name The name of the logger
+        @param log_file    The path to the log file
+        """
+
+        self.create_file_logger(logger_name, log_file)
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(self.formatter)
+
+        self.file_logger.addHandler(console_handler)
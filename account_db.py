@@ -0,0 +1,308 @@
+"""! @brief Defines the SQLite account database."""
+##
+# @file account_db.py
+#
+# @brief Defines the SQLite account database.
+#
+# @section description_account_db Description
+# Defines the account database, an optional backend of the account store
+# for large account sets. Bridge and mint flags and tags are indexed, so
+# eligible accounts are selected by SQLite and streamed through a cursor
+# instead of loading every account, and each update is its own short
+# transaction. CSV stays the import and export format.
+#
+# @section libraries_account_db Libraries/Modules
+# - access to Any, Iterator and Optional types
+# - standart os library (https://docs.python.org/3/library/os.html)
+# - standart random library (https://docs.python.org/3/library/random.html)
+# - standart sqlite3 library (https://docs.python.org/3/library/sqlite3.html)
+# - standart threading library (https://docs.python.org/3/library/threading.html)
+# - access to pandas
+#
+# @section author_account_db Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, Iterator, Optional
+import os
+import random
+import sqlite3
+import threading
+import pandas as pd
+
+# Global constants
+## File of the account database.
+ACCOUNT_DATABASE_FILE = 'accounts.db'
+## Rows read from the cursor at once.
+FETCH_SIZE = 500
+## Rows read and shuffled together when accounts are read in random order.
+SHUFFLE_SIZE = 5000
+## Columns of an account.
+ACCOUNT_FIELDS = ('address', 'private_key', 'proxy', 'bridge', 'mint')
+## Columns of an account that are flags.
+ACCOUNT_FLAGS = ('bridge', 'mint')
+## Schema of the account database.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    id          INTEGER PRIMARY KEY,
+    address     TEXT,
+    private_key TEXT,
+    proxy       TEXT,
+    bridge      INTEGER NOT NULL DEFAULT 0,
+    mint        INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS accounts_bridge ON accounts (id) WHERE bridge = 1;
+CREATE INDEX IF NOT EXISTS accounts_mint ON accounts (id) WHERE mint = 1;
+CREATE TABLE IF NOT EXISTS account_tags (
+    account_id INTEGER NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+    tag        TEXT NOT NULL,
+    PRIMARY KEY (account_id, tag)
+);
+CREATE INDEX IF NOT EXISTS account_tags_tag ON account_tags (tag, account_id);
+"""
+
+class AccountRow(dict):
+    """ Account data by column, with the account id as name like a CSV row."""
+
+    def __init__(self, account: int, fields: dict[str, Any]):
+        """ Create account row.
+
+        @param account Account id
+        @param fields  Account data by column
+        """
+
+        super().__init__(fields)
+        self.name = account
+
+class AccountDatabase:
+    """ Accounts kept in a SQLite database."""
+
+    def __init__(self, path: str):
+        """ Open account database, creating it if needed.
+
+        @param path Path to the database file
+        """
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = self.connect()
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def connect(self) -> sqlite3.Connection:
+        """ Open a connection to the database.
+
+        @return Connection, usable from any thread
+        """
+
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        # Readers stream accounts while workers commit updates
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA synchronous = NORMAL')
+        connection.execute('PRAGMA foreign_keys = ON')
+        return connection
+
+    def is_empty(self) -> bool:
+        """ Check whether the database has no accounts.
+
+        @return True if there are no accounts
+        """
+
+        with self.lock:
+            return self.connection.execute('SELECT 1 FROM accounts LIMIT 1').fetchone() is None
+
+    def iter_accounts(self, status: Optional[str] = None, tag: Optional[str] = None, shuffled: bool = False) -> Iterator[AccountRow]:
+        """ Stream accounts through a cursor.
+
+        @param status   Only accounts with this flag on (bridge or mint)
+        @param tag      Only accounts with this tag
+        @param shuffled Random order within every batch read from the cursor, instead of account id order
+
+        @return Iterator over account rows
+        """
+
+        query = 'SELECT accounts.id, ' + ', '.join('accounts.' + field for field in ACCOUNT_FIELDS) + ' FROM accounts'
+        conditions = []
+        parameters = []
+
+        if tag is not None:
+            query += ' JOIN account_tags ON account_tags.account_id = accounts.id'
+            conditions.append('account_tags.tag = ?')
+            parameters.append(tag)
+        if status is not None:
+            if status not in ACCOUNT_FLAGS:
+                raise ValueError(f'Unknown account status: {status}')
+            conditions.append(f'accounts.{status} = 1')
+
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        # Sorting the whole table randomly would read it all before the first row
+        query += ' ORDER BY accounts.id'
+
+        # Own connection, so updates are not blocked while the cursor is open
+        connection = self.connect()
+        try:
+            cursor = connection.execute(query, parameters)
+            while rows := cursor.fetchmany(SHUFFLE_SIZE if shuffled else FETCH_SIZE):
+                if shuffled:
+                    random.shuffle(rows)
+                for row in rows:
+                    yield make_row(row)
+        finally:
+            connection.close()
+
+    def get_accounts(self) -> Iterator[AccountRow]:
+        """ Get accounts.
+
+        @return Rows with account data, the row name is the account id
+        """
+
+        return self.iter_accounts()
+
+    def get_shuffled_accounts(self) -> Iterator[AccountRow]:
+        """ Get accounts in random order.
+
+        @return Rows with account data, the row name is the account id
+        """
+
+        return self.iter_accounts(shuffled=True)
+
+    def get_eligible_accounts(self, status: str, shuffled: bool = False) -> Iterator[AccountRow]:
+        """ Get accounts with a flag on.
+
+        @param status   Flag of the account (bridge or mint)
+        @param shuffled Random order within batches of SHUFFLE_SIZE accounts, instead of account id order
+
+        @return Rows with account data, the row name is the account id
+        """
+
+        return self.iter_accounts(status=status, shuffled=shuffled)
+
+    def update(self, account: int, **fields: Any) -> None:
+        """ Update fields of an account in one transaction.
+
+        @param account Account id
+        @param fields  New values by column
+        """
+
+        for column in fields:
+            if column not in ACCOUNT_FIELDS:
+                raise ValueError(f'Unknown account column: {column}')
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                'UPDATE accounts SET ' + ', '.join(f'{column} = ?' for column in fields) + ' WHERE id = ?',
+                [to_database(column, value) for column, value in fields.items()] + [account]
+            )
+
+    def set_flag(self, account: int, address: str, status: str, enabled: bool) -> None:
+        """ Set a flag of an account.
+
+        @param account Account id
+        @param address Address of the account, ids of the database do not change
+        @param status  Flag of the account (bridge or mint)
+        @param enabled Flag value
+        """
+
+        if status not in ACCOUNT_FLAGS:
+            raise ValueError(f'Unknown account status: {status}')
+        self.update(account, **{status: enabled})
+
+    def add(self) -> None:
+        """ Add an empty account."""
+
+        with self.lock, self.connection:
+            self.connection.execute('INSERT INTO accounts (bridge, mint) VALUES (0, 0)')
+
+    def delete(self, account: int) -> None:
+        """ Delete an account with its tags.
+
+        @param account Account id
+        """
+
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM accounts WHERE id = ?', (account,))
+
+    def flush(self) -> None:
+        """ Nothing to write, every update is committed at once."""
+
+    def import_csv(self, path: str) -> int:
+        """ Add accounts from a CSV file in one transaction.
+
+        The optional tags column holds tags separated by commas.
+
+        @param path Path to the CSV file
+
+        @return Number of added accounts
+        """
+
+        count = 0
+        with self.lock, self.connection:
+            for chunk in pd.read_csv(path, chunksize=FETCH_SIZE):
+                for account in chunk.to_dict('records'):
+                    cursor = self.connection.execute(
+                        'INSERT INTO accounts (' + ', '.join(ACCOUNT_FIELDS) + ') VALUES (' + ', '.join('?' * len(ACCOUNT_FIELDS)) + ')',
+                        [to_database(field, account.get(field)) for field in ACCOUNT_FIELDS]
+                    )
+                    tags = account.get('tags')
+                    if isinstance(tags, str):
+                        self.connection.executemany(
+                            'INSERT OR IGNORE INTO account_tags (account_id, tag) VALUES (?, ?)',
+                            [(cursor.lastrowid, tag.strip()) for tag in tags.split(',') if tag.strip() != '']
+                        )
+                    count += 1
+        return count
+
+    def export_csv(self, path: str) -> int:
+        """ Write all accounts to a CSV file, replacing it at once.
+
+        @param path Path to the CSV file
+
+        @return Number of written accounts
+        """
+
+        tags: dict[int, list[str]] = {}
+        with self.lock:
+            for account, tag in self.connection.execute('SELECT account_id, tag FROM account_tags ORDER BY account_id, tag'):
+                tags.setdefault(account, []).append(tag)
+
+        columns = list(ACCOUNT_FIELDS) + (['tags'] if tags else [])
+        rows = []
+        for account in self.iter_accounts():
+            row = dict(account)
+            row['tags'] = ','.join(tags.get(account.name, []))
+            rows.append(row)
+
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        pd.DataFrame(rows, columns=columns).to_csv(temporary_path, index=False)
+        os.replace(temporary_path, path)
+        return len(rows)
+
+# Functions
+def to_database(column: str, value: Any) -> Any:
+    """ Convert a value of an account column for the database.
+
+    @param column Column of the value
+    @param value  Value from CSV or UI
+
+    @return Value to store
+    """
+
+    if column in ACCOUNT_FLAGS:
+        return 1 if value == True or str(value).lower() == 'true' else 0
+    if value is None or pd.isna(value):
+        return None
+    return str(value)
+
+def make_row(row: tuple[Any, ...]) -> AccountRow:
+    """ Make account row from a database row.
+
+    @param row Account id followed by the account columns
+
+    @return Account row
+    """
+
+    fields = dict(zip(ACCOUNT_FIELDS, row[1:]))
+    for flag in ACCOUNT_FLAGS:
+        fields[flag] = bool(fields[flag])
+    return AccountRow(row[0], fields)
@@ -0,0 +1,295 @@
+"""! @brief Defines the in-memory account store."""
+##
+# @file account_store.py
+#
+# @brief Defines the in-memory account store.
+#
+# @section description_account_store Description
+# Defines the account store, which loads accounts.csv once, applies status
+# updates of accounts in memory and writes them behind in batches. Every
+# write goes to a temporary file that replaces accounts.csv at once, and a
+# file changed by another run meanwhile is read again before the pending
+# updates are applied to it by account address, so no update is lost or
+# lands on another account when that run added or deleted rows. A file
+# changed between two runs is read again when the next run gets accounts. With the account_backend
+# setting set to sqlite, the store is the account database instead.
+#
+# @section libraries_account_store Libraries/Modules
+# - access to Any and Optional types
+# - standart atexit library (https://docs.python.org/3/library/atexit.html)
+# - standart os library (https://docs.python.org/3/library/os.html)
+# - standart threading library (https://docs.python.org/3/library/threading.html)
+# - access to pandas
+# - access to helpers
+# - access to SQLite account database
+#
+# @section author_account_store Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, Optional
+import atexit
+import os
+import threading
+import pandas as pd
+from helpers import get_settings, resource_path
+from account_db import ACCOUNT_DATABASE_FILE, AccountDatabase
+
+# Global constants
+## Seconds updates are collected before they are written.
+FLUSH_DELAY = 1.0
+## Columns every accounts.csv has, the file may hold more.
+ACCOUNT_COLUMNS = ['address', 'private_key', 'proxy', 'bridge', 'mint']
+
+## Account store of the application.
+account_store: Optional[Any] = None
+## Path to accounts.csv, None for the one next to the application.
+accounts_file: Optional[str] = None
+
+class AccountStore:
+    """ Accounts of accounts.csv, kept in memory."""
+
+    def __init__(self, path: str, flush_delay: float = FLUSH_DELAY):
+        """ Create account store.
+
+        @param path        Path to accounts.csv
+        @param flush_delay Seconds updates are collected before they are written
+        """
+
+        self.path = path
+        self.flush_delay = flush_delay
+        self.lock = threading.RLock()
+        self.frame: Optional[pd.DataFrame] = None
+        self.mtime: Optional[int] = None
+        self.file_addresses: Optional[pd.Series] = None
+        self.pending: dict[tuple[Any, str], Any] = {}
+        self.timer: Optional[threading.Timer] = None
+
+    def load(self) -> pd.DataFrame:
+        """ Load accounts from the file on first use.
+
+        @return Accounts
+        """
+
+        with self.lock:
+            if self.frame is None:
+                self.frame = pd.read_csv(self.path)
+                self.mtime = os.stat(self.path).st_mtime_ns
+                self.file_addresses = self.frame['address'].copy()
+            return self.frame
+
+    def get_accounts(self) -> Any:
+        """ Get accounts.
+
+        @return Rows with account data, the row name is the account id
+        """
+
+        with self.lock:
+            self.reload_if_changed()
+            return self.load().copy().iloc()
+
+    def get_shuffled_accounts(self) -> Any:
+        """ Get accounts in random order.
+
+        @return Rows with account data, the row name is the account id
+        """
+
+        with self.lock:
+            self.reload_if_changed()
+            return self.load().sample(frac=1).iloc()
+
+    def get_eligible_accounts(self, status: str, shuffled: bool = False) -> Any:
+        """ Get accounts with a flag on.
+
+        @param status   Flag of the account (bridge or mint)
+        @param shuffled Random order instead of account id order
+
+        @return Rows with account data, the row name is the account id
+        """
+
+        with self.lock:
+            # Accounts edited since the last run start from the file
+            self.reload_if_changed()
+            frame = self.load()
+            frame = frame[frame[status] == True]
+            if shuffled:
+                frame = frame.sample(frac=1)
+            return frame.copy().iloc()
+
+    def update(self, account: int, **fields: Any) -> None:
+        """ Update fields of an account shown in the accounts window, written to the file shortly after.
+
+        @param account Account id
+        @param fields  New values by column
+        """
+
+        with self.lock:
+            frame = self.load()
+            if account not in frame.index:
+                # Deleted meanwhile, a new row would be written
+                return
+            key = self.get_account_key(account)
+            for column, value in fields.items():
+                frame.loc[account, column] = value
+                self.pending[(key, column)] = value
+            self.schedule_flush()
+
+    def set_flag(self, account: int, address: str, status: str, enabled: bool) -> None:
+        """ Set a flag of an account, written to the file shortly after.
+
+        The account is found by address, the row id of a run may point at
+        another account once the file is changed.
+
+        @param account Account id, the account database finds accounts by it
+        @param address Address of the account
+        @param status  Flag of the account (bridge or mint)
+        @param enabled Flag value
+        """
+
+        with self.lock:
+            frame = self.load()
+            rows = get_rows(frame, address)
+            if len(rows) == 0:
+                # Deleted from the file meanwhile
+                return
+            frame.loc[rows, status] = enabled
+            self.pending[(address, status)] = enabled
+            self.schedule_flush()
+
+    def schedule_flush(self) -> None:
+        """ Write pending updates after the flush delay, unless a write is already scheduled."""
+
+        if self.timer is None:
+            self.timer = threading.Timer(self.flush_delay, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def add(self) -> None:
+        """ Add an empty account and write the file."""
+
+        with self.lock:
+            self.reload_if_changed()
+            frame = self.load()
+            frame.loc[len(frame.index)] = pd.Series({'bridge': False, 'mint': False})
+            self.write()
+
+    def delete(self, account: int) -> None:
+        """ Delete an account and write the file.
+
+        @param account Account id
+        """
+
+        with self.lock:
+            self.load()
+            key = self.get_account_key(account)
+            self.reload_if_changed()
+            frame = self.load()
+            rows = get_rows(frame, key)
+            self.frame = frame.drop([account] if account in rows else rows[:1]).reset_index(drop=True)
+            self.write()
+
+    def flush(self) -> None:
+        """ Write pending updates to the file."""
+
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.pending:
+                return
+
+            self.reload_if_changed()
+            self.write()
+
+    def reload_if_changed(self) -> None:
+        """ Read the file again if another run changed it, keeping pending updates."""
+
+        if self.frame is None or os.stat(self.path).st_mtime_ns == self.mtime:
+            return
+
+        self.frame = None
+        frame = self.load()
+        # Rows are found before any update, an update may change the address
+        rows = {key: get_rows(frame, key) for key, _ in self.pending}
+        for (key, column), value in self.pending.items():
+            frame.loc[rows[key], column] = value
+
+    def get_account_key(self, account: int) -> Any:
+        """ Get the key an account is found by in the file again.
+
+        @param account Account id
+
+        @return Address of the account in the file, or the account id if it has none yet
+        """
+
+        address = self.file_addresses.get(account) if self.file_addresses is not None else None
+        return address if isinstance(address, str) and address != '' else account
+
+    def write(self) -> None:
+        """ Replace the file with the accounts in memory."""
+
+        # Own temporary file, another run may be writing at the same time
+        temporary_path = f'{self.path}.{os.getpid()}.tmp'
+        # Every loaded column is kept, like the tags of accounts
+        self.frame.to_csv(temporary_path, index=False)
+        os.replace(temporary_path, self.path)
+        self.mtime = os.stat(self.path).st_mtime_ns
+        self.file_addresses = self.frame['address'].copy()
+        self.pending.clear()
+
+# Functions
+def get_rows(frame: pd.DataFrame, key: Any) -> Any:
+    """ Get the rows of an account in accounts read from the file.
+
+    @param frame Accounts
+    @param key   Address of the account, or the account id if it has no address
+
+    @return Account ids
+    """
+
+    if isinstance(key, str):
+        # Row ids shift when another run adds or deletes accounts
+        return frame.index[frame['address'].astype(str).str.lower() == key.lower()]
+    if key in frame.index and pd.isna(frame.loc[key, 'address']):
+        return frame.index[[frame.index.get_loc(key)]]
+    return frame.index[:0]
+
+def set_accounts_file(path: str) -> None:
+    """ Use another accounts.csv, before the account store is first used.
+
+    @param path Path to accounts.csv
+    """
+
+    global accounts_file
+    accounts_file = os.path.abspath(path)
+
+def uses_account_database() -> bool:
+    """ Check whether accounts are kept in the account database.
+
+    @return True if the account_backend setting is sqlite
+    """
+
+    return str(get_settings().get('account_backend', 'csv')).lower() == 'sqlite'
+
+def get_account_store() -> Any:
+    """ Get the account store shared by the whole application.
+
+    A new account database is filled from accounts.csv.
+
+    @return Account store of accounts.csv, or account database
+    """
+
+    global account_store
+    if account_store is not None:
+        return account_store
+
+    csv_path = accounts_file if accounts_file is not None else resource_path('accounts.csv')
+    if uses_account_database():
+        account_store = AccountDatabase(resource_path(ACCOUNT_DATABASE_FILE))
+        if account_store.is_empty() and os.path.exists(csv_path):
+            account_store.import_csv(csv_path)
+    else:
+        account_store = AccountStore(csv_path)
+        # Updates still collected when the application closes
+        atexit.register(account_store.flush)
+    return account_store
@@ -12,17 +12,27 @@
 # - access to GUI
 # - access to pandas
 # - access to helpers
+# - access to account store
+# - access to SQLite account database
+# - access to lazy module imports
 #
 # @section author_accounts Author(s)
 # - Created by mutedspectre.eth on 07/20/2023.
-# - Modified by mutedspectre.eth on 07/25/2023.
+# - Modified by mutedspectre.eth on 10/16/2026.
 
 # Imports
 from typing import Any
-import dearpygui.dearpygui as dpg
 import pandas as pd
-from helpers import get_accounts, resource_path
+from helpers import resource_path
+from account_store import get_account_store
+from account_db import AccountDatabase
+from lazy_module import lazy_import
 
+# The gui library is loaded only when the accounts window is rendered
+dpg = lazy_import('dearpygui.dearpygui')
+
+## Whether the accounts window was rendered, runs without gui only update the store.
+accounts_window_rendered = False
 
 # GUI callbacks
 def edit_account_callback(sender: Any, app_data: Any, user_data: Any) -> None:
@@ -42,9 +52,7 @@ def add_account_callback(sender, app_data) -> None:
     @param app_data  Data from the callback
     """
 
-    accounts_csv = pd.read_csv(resource_path('accounts.csv'))
-    accounts_csv.loc[len(accounts_csv.index) + 1] = [None, None, None, False, False]
-    accounts_csv.to_csv(resource_path('accounts.csv'), index=False)
+    get_account_store().add()
 
     refresh_accounts_window()
 
@@ -56,13 +64,16 @@ def save_account_callback(sender: Any, app_data: Any, user_data: Any) -> None:
     @param user_data User account
     """
 
-    accounts_csv = pd.read_csv(resource_path('accounts.csv'))
-    accounts_csv.loc[user_data, 'address'] = dpg.get_value('account_address')
-    accounts_csv.loc[user_data, 'private_key'] = dpg.get_value('account_private_key')
-    accounts_csv.loc[user_data, 'proxy'] = dpg.get_value('account_proxy')
-    accounts_csv.loc[user_data, 'bridge'] = dpg.get_value('account_bridge')
-    accounts_csv.loc[user_data, 'mint'] = dpg.get_value('account_mint')
-    accounts_csv.to_csv(resource_path('accounts.csv'), index=False)
+    account_store = get_account_store()
+    account_store.update(
+        user_data,
+        address=     dpg.get_value('account_address'),
+        private_key= dpg.get_value('account_private_key'),
+        proxy=       dpg.get_value('account_proxy'),
+        bridge=      dpg.get_value('account_bridge'),
+        mint=        dpg.get_value('account_mint')
+    )
+    account_store.flush()
 
     refresh_accounts_window()
 
@@ -77,12 +88,19 @@ def delete_account_callback(sender: Any, app_data: Any, user_data: Any) -> None:
     @param user_data User account
     """
 
-    accounts_csv = pd.read_csv(resource_path('accounts.csv'))
-    accounts_csv = accounts_csv.drop(user_data)
-    accounts_csv.to_csv(resource_path('accounts.csv'), index=False)
+    get_account_store().delete(user_data)
 
     refresh_accounts_window()
 
+def export_accounts_callback(sender: Any, app_data: Any) -> None:
+    """ Callback for exporting the account database to accounts.csv.
+
+    @param sender    Sender of the callback
+    @param app_data  Data from the callback
+    """
+
+    get_account_store().export_csv(resource_path('accounts.csv'))
+
 def cancel_account_callback(sender: Any, app_data: Any) -> None:
     """ Callback for canceling an account editing.
 
@@ -95,36 +113,54 @@ def cancel_account_callback(sender: Any, app_data: Any) -> None:
 
 
 # Functions
-def turn_off_account_bridge(account: int) -> None:
+def turn_off_account_bridge(account: int, address: str) -> None:
     """ Turn off bridge for account.
 
     @param account Account id
+    @param address Address of account, the account store finds it by address
     """
 
-    accounts_csv = pd.read_csv(resource_path('accounts.csv'))
-    accounts_csv.loc[account, 'bridge'] = False
-    accounts_csv.to_csv(resource_path('accounts.csv'), index=False)
-
-    refresh_accounts_window()
+    get_account_store().set_flag(account, str(address), 'bridge', False)
+    update_account_status(account, 'bridge', False)
 
-def turn_off_account_mint(account: int) -> None:
+def turn_off_account_mint(account: int, address: str) -> None:
     """ Turn off mint for account.
 
     @param account Account id
+    @param address Address of account, the account store finds it by address
     """
 
-    accounts_csv = pd.read_csv(resource_path('accounts.csv'))
-    accounts_csv.loc[account, 'mint'] = False
-    accounts_csv.to_csv(resource_path('accounts.csv'), index=False)
+    get_account_store().set_flag(account, str(address), 'mint', False)
+    update_account_status(account, 'mint', False)
 
-    refresh_accounts_window()
+def update_account_status(account: int, status: str, enabled: bool) -> None:
+    """ Update bridge or mint status in the row of an account.
+
+    @param account Account id
+    @param status  Status name (bridge or mint)
+    @param enabled Status value
+    """
+
+    tag = f'account_{status}_{account}'
+    if not accounts_window_rendered or not dpg.does_item_exist(tag):
+        return
+
+    if enabled:
+        dpg.set_value(tag, status.capitalize())
+        dpg.configure_item(tag, color=[0, 255, 0])
+    else:
+        dpg.set_value(tag, 'No ' + status)
+        dpg.configure_item(tag, color=[255, 0, 0])
 
 def account_child_window() -> None:
     """ Create accounts child window. """
 
+    global accounts_window_rendered
+    accounts_window_rendered = True
+
     with dpg.child_window(width=700, tag='accounts_window', border=False, parent='accounts_tab'):
         dpg.add_text('List of accounts:')
-        for account in get_accounts():
+        for account in get_account_store().get_accounts():
             dpg.add_spacer(height=10)
             with dpg.group(horizontal=True):
                 dpg.add_button(label="Edit", callback=edit_account_callback, user_data=account)
@@ -132,18 +168,16 @@ def account_child_window() -> None:
 
                 if not pd.isna(account['address']):
                     dpg.add_text(account['address'])
-                    if account['bridge']:
-                        dpg.add_text('Bridge', color=[0, 255, 0])
-                    else:
-                        dpg.add_text('No bridge', color=[255, 0, 0])
-                    if account['mint']:
-                        dpg.add_text('Mint', color=[0, 255, 0])
-                    else:
-                        dpg.add_text('No mint', color=[255, 0, 0])
+                    dpg.add_text(tag=f'account_bridge_{account.name}')
+                    dpg.add_text(tag=f'account_mint_{account.name}')
+                    update_account_status(account.name, 'bridge', account['bridge'])
+                    update_account_status(account.name, 'mint', account['mint'])
                 else: 
                     dpg.add_text('Edit this account...')
         dpg.add_spacer(height=20)
         dpg.add_button(label="Add new account", callback=add_account_callback)
+        if isinstance(get_account_store(), AccountDatabase):
+            dpg.add_button(label="Export to accounts.csv", callback=export_accounts_callback)
 
 def account_edit_window(account) -> None:
     """ Create account edit window.
@@ -0,0 +1,111 @@
+"""! @brief Defines the shared balance watcher."""
+##
+# @file balance_watcher.py
+#
+# @brief Defines the shared balance watcher.
+#
+# @section description_balance_watcher Description
+# Defines the balance watcher, which keeps every account waiting for funds
+# in one registry, refreshes all their balances with one Multicall3 call per
+# new block, and wakes each account as soon as its funds arrive.
+#
+# @section libraries_balance_watcher Libraries/Modules
+# - access to Optional type
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - access to web3
+# - access to helpers
+# - access to multicall methods
+# - access to Poller base class
+#
+# @section author_balance_watcher Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Optional
+import asyncio
+from web3 import Web3
+import helpers
+import multicall
+from poller import Poller
+
+# Global constants
+## Seconds between two block number requests.
+BLOCK_POLL_INTERVAL = 2
+
+## Balance watchers by RPC endpoint.
+balance_watchers: dict[str, 'BalanceWatcher'] = {}
+
+class BalanceWatcher(Poller):
+    """ Balances of accounts waiting for funds on one RPC endpoint."""
+
+    def __init__(self, rpc: str, interval: float = BLOCK_POLL_INTERVAL):
+        """ Create balance watcher.
+
+        @param rpc      URL of the RPC endpoint
+        @param interval Seconds between two block number requests
+        """
+
+        super().__init__(interval)
+        self.rpc = rpc
+        self.waiting: dict[str, list[tuple[int, asyncio.Future]]] = {}
+        self.last_block: Optional[int] = None
+
+    async def wait_for_balance(self, address: str, amount: int) -> int:
+        """ Wait until the balance of the address reaches the amount.
+
+        @param address Address of account
+        @param amount  Required balance in wei
+
+        @return Balance in wei that released the wait
+        """
+
+        address = Web3.to_checksum_address(address)
+        waiter = (amount, asyncio.get_running_loop().create_future())
+
+        self.waiting.setdefault(address, []).append(waiter)
+        try:
+            self.ensure_running()
+            return await waiter[1]
+        finally:
+            self.waiting[address].remove(waiter)
+            if not self.waiting[address]:
+                del self.waiting[address]
+
+    def reset(self) -> None:
+        self.last_block = None
+        self.w3 = helpers.get_async_web3(self.rpc)
+
+    async def poll(self) -> None:
+        block = await self.w3.eth.block_number
+        if block == self.last_block or not self.waiting:
+            return
+
+        balances = await multicall.get_eth_balances(self.w3, list(self.waiting), block)
+        self.last_block = block
+
+        for address, balance in balances.items():
+            for amount, future in self.waiting.get(address, []):
+                if balance >= amount and not future.done():
+                    future.set_result(balance)
+
+    async def fail(self, error: Exception) -> None:
+        for waiters in self.waiting.values():
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(error)
+
+    def is_idle(self) -> bool:
+        return not self.waiting
+
+# Functions
+def get_balance_watcher(rpc: str) -> BalanceWatcher:
+    """ Get the balance watcher shared by every account using an endpoint.
+
+    @param rpc URL of the RPC endpoint
+
+    @return Balance watcher for the endpoint
+    """
+
+    if rpc not in balance_watchers:
+        balance_watchers[rpc] = BalanceWatcher(rpc)
+    return balance_watchers[rpc]
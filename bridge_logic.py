@@ -11,29 +11,45 @@
 # @section libraries_balance_logic Libraries/Modules
 # - access to Any type
 # - access to web3
-# - standart time library (https://docs.python.org/3/library/time.html)
 # - access to Logger type
 # - access to abi necessary contracts
 # - stadart random library (https://docs.python.org/3/library/random.html)
 # - access to helpers
 # - access to accounts module
+# - access to account store
 # - access to ChecksumAddress type
+# - access to account runner
+# - access to per-endpoint RPC limits
+# - access to RPC client pool
+# - access to multi-endpoint RPC router
+# - access to shared gas oracle
+# - access to pre-flight snapshot
+# - access to nonce manager
+# - access to shared receipt tracker
 #
 # @section author_balance_logic Author(s)
 # - Created by mutedspectre.eth on 07/20/2023.
-# - Modified by mutedspectre.eth on 07/25/2023.
+# - Modified by mutedspectre.eth on 10/16/2026.
 
 # Imports
-from typing import Any
+from typing import Any, Iterable, Optional
 from ens.ens import ChecksumAddress
-from web3 import Web3
-import time
+from web3 import AsyncWeb3, Web3
 from web3.types import Wei
 from Logger import Logger
 from abi import bridge_abi
 import random
 import helpers
 from accounts import turn_off_account_bridge
+from account_store import get_account_store
+from runner import get_workers, run_accounts
+from rpc_limits import set_endpoint_limit
+from client_pool import ConnectionWarmer, run_with_clients, set_client_limits, set_read_batch
+from rpc_router import set_broadcast
+from gas_oracle import get_gas_oracle
+from preflight import Snapshot, stream_snapshots
+from nonce_manager import get_nonce_manager
+from receipt_tracker import get_receipt_tracker
 
 # Functions
 def start_bridge_callback(sender: Any, app_data: Any, user_data: Logger) -> None:
@@ -43,60 +59,130 @@ def start_bridge_callback(sender: Any, app_data: Any, user_data: Logger) -> None
     @param app_data  Data from the callback
     @param user_data User data from the callback
     """
-    logger_bridge = user_data
-    logger_bridge.all_info_log('Bridge! Bridge! Bridge!')
-
-    # Get accounts
-    for account in helpers.get_shuffled_accounts():
-        if bool(account['bridge']) == True:
-            try:
-                bridge_status = bridge_logic(account, helpers.get_settings(), logger_bridge)
-            except Exception as e:
-                logger_bridge.error_log(account['address'], e)
-                break
-
-            if bridge_status == True:
-                logger_bridge.info_log(account['address'], f'Bridge tx sended. Wait for bridge ~2 min.')
-                turn_off_account_bridge(account.name)
-                logger_bridge.info_log(account['address'], f'Account bridge turned off.')
-            else:
-                logger_bridge.error_log(account['address'], f'Bridge failed. Work at the address has stopped.')
-
-    logger_bridge.all_info_log('All wallets bridged.')
+    start_bridge(user_data)
+
+def start_bridge(logger: Logger, workers: Optional[int] = None) -> bool:
+    """ Run bridge for all eligible accounts.
+
+    @param logger  Logger object for push messages in logger window or terminal
+    @param workers Most accounts at once, the bridge_workers setting if None
+
+    @return True if the run finished, False if it stopped on an error
+    """
+
+    logger.all_info_log('Bridge! Bridge! Bridge!')
+
+    settings = helpers.get_settings()
+    if workers is not None:
+        settings = settings.with_values({'bridge_workers': workers})
+    set_endpoint_limit(settings.get('rpc_max_in_flight'))
+    set_client_limits(settings.get('connections_per_client'), settings.get('client_idle_timeout'))
+    set_read_batch(settings.get('rpc_batch_size'), settings.get('rpc_batch_window_ms'))
+    set_broadcast(settings.get('broadcast_transactions'))
+
+    # Get accounts, streamed to the jobs
+    accounts = get_account_store().get_eligible_accounts('bridge', shuffled=True)
+    try:
+        run_with_clients(run_bridge(accounts, settings, logger))
+    except Exception as e:
+        logger.all_error_log(f'Bridge stopped: {e}')
+        return False
+
+    logger.all_info_log('All wallets bridged.')
+    return True
+
+async def run_bridge(accounts: Iterable[Any], settings: Any, logger: Logger) -> None:
+    """ Run bridge for accounts on the running event loop.
+
+    @param accounts Rows from CSV with account data
+    @param settings Global settings provided from UI
+    @param logger   Logger object for push messages in logger window
+    """
+
+    # Each batch of accounts is read into the snapshot just before its jobs start
+    snapshot = Snapshot(None, None, {})
+
+    await run_accounts(
+        stream_snapshots(accounts, helpers.get_eth_rpc_for_bridge(), helpers.get_zora_rpc_for_bridge(), logger, snapshot),
+        lambda account: bridge_account(account, settings, logger, snapshot),
+        get_workers(settings, 'bridge_workers'),
+        logger
+    )
+
+async def bridge_account(account: Any, settings: Any, logger: Logger, snapshot: Optional[Snapshot] = None) -> bool:
+    """ Bridge job for a single account.
+
+    @param account  Row from CSV with account data
+    @param settings Global settings provided from UI
+    @param logger   Logger object for push messages in logger window
+    @param snapshot Pre-flight snapshot of accounts
+
+    @return Boolean value denoting the status of the balance logic
+    """
+
+    bridge_status = await async_bridge_logic(account, settings, logger, snapshot)
+
+    if bridge_status == True:
+        logger.info_log(account['address'], f'Bridge tx sended. Wait for bridge ~2 min.')
+        turn_off_account_bridge(account.name, account['address'])
+        logger.info_log(account['address'], f'Account bridge turned off.')
+    else:
+        logger.error_log(account['address'], f'Bridge failed. Work at the address has stopped.')
+
+    return bridge_status
 
 def bridge_logic(
     account: Any, 
     settings: Any, 
-    logger: Logger
+    logger: Logger,
+    snapshot: Optional[Snapshot] = None
+    ) -> bool:
+    """ Main balance logic method, runs async_bridge_logic on its own event loop.
+    
+    @param account  Row from CSV with account data
+    @param settings Global settings provided from UI
+    @param logger   Logger object for push messages in logger window
+    @param snapshot Pre-flight snapshot of accounts
+
+    @return Boolean value denoting the status of the balance logic
+    """
+
+    return run_with_clients(async_bridge_logic(account, settings, logger, snapshot))
+
+async def async_bridge_logic(
+    account: Any, 
+    settings: Any, 
+    logger: Logger,
+    snapshot: Optional[Snapshot] = None
     ) -> bool:
     """ Main balance logic method.
     
     @param account  Row from CSV with account data
     @param settings Global settings provided from UI
     @param logger   Logger object for push messages in logger window
+    @param snapshot Pre-flight snapshot of accounts, balance and nonce are read from it if present
 
     @return Boolean value denoting the status of the balance logic
     """
 
     # Web3 provider
-    if isinstance(account['proxy'], str) and account['proxy'] != '':
-        w3_eth = Web3(Web3.HTTPProvider(helpers.get_eth_rpc_for_bridge(), request_kwargs={'proxies':{'https': 'http://' + account['proxy'], 'http': 'http://' + account['proxy']}}))
-    else:
-        w3_eth = Web3(Web3.HTTPProvider(helpers.get_eth_rpc_for_bridge()))
+    w3_eth = helpers.get_async_web3(helpers.get_eth_rpc_for_bridge(), account['proxy'])
 
-    balance_eth_in_wei = w3_eth.eth.get_balance(Web3.to_checksum_address(account['address']))
+    address = Web3.to_checksum_address(account['address'])
+    state = snapshot.get(address) if snapshot is not None else None
+
+    if state is not None and state.eth_balance is not None:
+        balance_eth_in_wei = state.eth_balance
+    else:
+        balance_eth_in_wei = await w3_eth.eth.get_balance(address)
     logger.info_log(account['address'], f'Balance on Ethereum is {Web3.from_wei(balance_eth_in_wei, "ether")} eth.')
 
     logger.info_log(account['address'], f'Enough funds on Ethereum. Checking whether the transferred amount can be transferred.')
 
-    while True:
-        gas_price = w3_eth.from_wei(w3_eth.eth.gas_price, 'gwei')
-        logger.info_log(account['address'], f'Gas price is {gas_price} gwei')
-
-        if gas_price < float(settings['max_gas_in_gwei']):
-            logger.info_log(account['address'], f'Gas price is lower than {settings["max_gas_in_gwei"]} gwei from settings.')
-            break
-        time.sleep(5)
+    logger.info_log(account['address'], f'Waiting for gas price lower than {settings["max_gas_in_gwei"]} gwei from settings.')
+    async with ConnectionWarmer([(helpers.get_eth_rpc_for_bridge(), account['proxy'])]):
+        gas_price = await get_gas_oracle(helpers.get_eth_rpc_for_bridge()).wait_below(settings['max_gas_in_gwei'])
+    logger.info_log(account['address'], f'Gas price is {Web3.from_wei(gas_price, "gwei")} gwei, lower than {settings["max_gas_in_gwei"]} gwei from settings.')
 
     decimal_places_min = len(str(settings['min_amount_for_bridge']).split('.')[1])
     decimal_places_max = len(str(settings['max_amount_for_bridge']).split('.')[1])
@@ -109,13 +195,15 @@ def bridge_logic(
 
     # bridge bridge_amount_in_wei value
     logger.info_log(account['address'], f'Bridge amount is {Web3.from_wei(bridge_amount_in_wei, "ether")} eth.')
-    bridge_status = bridge_from_eth_to_zora(
-        address=       Web3.to_checksum_address(account['address']), 
+    bridge_status = await async_bridge_from_eth_to_zora(
+        address=       address, 
         private_key=   account['private_key'], 
         bridge_amount= bridge_amount_in_wei,
         w3_eth=        w3_eth,
         settings=      settings,
-        logger=        logger)
+        logger=        logger,
+        balance=       balance_eth_in_wei,
+        nonce=         state.eth_nonce if state is not None else None)
 
     return bridge_status
 
@@ -125,16 +213,52 @@ def bridge_from_eth_to_zora(
     bridge_amount: Wei, 
     w3_eth: Web3, 
     settings: Any, 
-    logger: Logger
+    logger: Logger,
+    proxy: Any = None
+)->bool:
+    """ Send bridge transaction from ethereum to zora, runs async_bridge_from_eth_to_zora on its own event loop.
+
+    @param address       Checksum address of account
+    @param private_key   Private key from account
+    @param bridge_amount Amount for bridge in Ethereum to Zora
+    @param w3_eth        Web3 provider for ethereum, its endpoint is used through the pooled async client
+    @param settings      Global settings provided from UI
+    @param logger        Logger object for push messages in logger window
+    @param proxy         Proxy from account (like login:password@ip:port), the proxy of w3_eth if None
+
+    @return Bridge tx status
+    """
+
+    if proxy is None:
+        proxy = get_provider_proxy(w3_eth)
+
+    async def bridge() -> bool:
+        # Pooled clients belong to the event loop they are used on
+        w3_eth_async = helpers.get_async_web3(str(w3_eth.provider.endpoint_uri), proxy)
+        return await async_bridge_from_eth_to_zora(address, private_key, bridge_amount, w3_eth_async, settings, logger)
+
+    return run_with_clients(bridge())
+
+async def async_bridge_from_eth_to_zora(
+    address: ChecksumAddress, 
+    private_key: str, 
+    bridge_amount: Wei, 
+    w3_eth: AsyncWeb3, 
+    settings: Any, 
+    logger: Logger,
+    balance: Optional[int] = None,
+    nonce: Optional[int] = None
 )->bool:
     """ Send bridge transaction from ethereum to zora
 
     @param address       Checksum address of account
     @param private_key   Private key from account
     @param bridge_amount Amount for bridge in Ethereum to Zora
-    @param w3_eth        Web3 provider for ethereum
+    @param w3_eth        Async Web3 provider for ethereum
     @param settings      Global settings provided from UI
     @param logger        Logger object for push messages in logger window
+    @param balance       Known balance of account in wei, read from network if None
+    @param nonce         Known nonce of account, handed out by the nonce manager if None
 
     @return Bridge tx status
     """
@@ -147,9 +271,12 @@ def bridge_from_eth_to_zora(
     #   bytes   _data // Data to trigger the recipient with.
     # )
     bridge_address = Web3.to_checksum_address(helpers.get_bridge_contract_address())
-    bridge_contract = w3_eth.eth.contract(address=bridge_address, abi=bridge_abi)
+    bridge_contract = helpers.get_contract(w3_eth, bridge_address, bridge_abi)
 
-    gas = bridge_contract.functions.depositTransaction(
+    if balance is None:
+        balance = await w3_eth.eth.get_balance(address)
+
+    gas = await bridge_contract.functions.depositTransaction(
         address,
         bridge_amount,
         100000,
@@ -157,36 +284,45 @@ def bridge_from_eth_to_zora(
         Web3.to_bytes(text='')
     ).estimate_gas({
         'from':  address, 
-        'value': bridge_amount, 
-        'nonce': w3_eth.eth.get_transaction_count(address)
+        'value': bridge_amount
     })
 
     gas = int(gas * 1.2) # take accuracy
 
-    if (gas + bridge_amount) > w3_eth.eth.get_balance(address):
+    if (gas + bridge_amount) > balance:
         logger.error_log(address, 'Insufficient funds including gas.')
         return False
 
-    tx_raw = bridge_contract.functions.depositTransaction(
-        address,
-        bridge_amount,
-        100000,
-        False,
-        Web3.to_bytes(text='')
-    ).build_transaction({
-        'from':     address,
-        'value':    bridge_amount,
-        'gas':      gas,
-        'gasPrice': w3_eth.eth.gas_price,
-        'nonce':    w3_eth.eth.get_transaction_count(address)
-    })
+    # Shared state of the endpoint the transaction goes through
+    rpc = str(w3_eth.provider.endpoint_uri)
+    nonce_manager = get_nonce_manager(rpc)
+    nonce = await nonce_manager.get_nonce(w3_eth, address, nonce)
+
+    try:
+        tx_raw = await bridge_contract.functions.depositTransaction(
+            address,
+            bridge_amount,
+            100000,
+            False,
+            Web3.to_bytes(text='')
+        ).build_transaction({
+            'from':     address,
+            'value':    bridge_amount,
+            'gas':      gas,
+            'gasPrice': await w3_eth.eth.gas_price,
+            'nonce':    nonce
+        })
 
-    logger.info_log(address, f'Sending a transaction for bridge.')
+        logger.info_log(address, f'Sending a transaction for bridge.')
 
-    account = w3_eth.eth.account.from_key(private_key)
-    signed_transaction = account.sign_transaction(tx_raw)
-    transaction_hash = w3_eth.eth.send_raw_transaction(signed_transaction.rawTransaction)
-    transaction_data = w3_eth.eth.wait_for_transaction_receipt(transaction_hash, timeout=600)
+        account = w3_eth.eth.account.from_key(private_key)
+        signed_transaction = account.sign_transaction(tx_raw)
+        transaction_hash = await w3_eth.eth.send_raw_transaction(signed_transaction.rawTransaction)
+        transaction_data = await get_receipt_tracker(rpc).wait_for_receipt(transaction_hash, timeout=600)
+    except Exception:
+        # The transaction was not sent, dropped or replaced
+        await nonce_manager.reconcile(w3_eth, address)
+        raise
 
     if transaction_data.get('status') != None and transaction_data.get('status') == 1:
         logger.info_log(address, f'Transaction hash on Ethereum: {transaction_hash.hex()}')
@@ -194,4 +330,20 @@ def bridge_from_eth_to_zora(
         return True
     else:
         logger.error_log(address, f'Transaction bridge failed. Work at the address has stopped.')
-        return False
\ No newline at end of file
+        return False
+
+def get_provider_proxy(w3: Any) -> Optional[str]:
+    """ Get the account proxy a Web3 provider sends its requests through.
+
+    @param w3 Web3 or async Web3 provider
+
+    @return Proxy (like login:password@ip:port), or None without proxy
+    """
+
+    # Pooled async providers keep the account proxy
+    proxy = getattr(w3.provider, 'proxy', None)
+    if proxy is None and hasattr(w3.provider, 'get_request_kwargs'):
+        proxies = dict(w3.provider.get_request_kwargs()).get('proxies') or {}
+        url = proxies.get('https') or proxies.get('http')
+        proxy = url.split('://', 1)[-1] if url else None
+    return proxy
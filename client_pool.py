@@ -0,0 +1,451 @@
+"""! @brief Defines the pool of RPC clients."""
+##
+# @file client_pool.py
+#
+# @brief Defines the pool of RPC clients.
+#
+# @section description_client_pool Description
+# Defines the client pool, which keeps one async Web3 provider and one
+# keep-alive HTTP session per RPC endpoint and proxy. Accounts sharing a
+# proxy, or running without one, reuse warm connections instead of paying
+# a TCP and TLS handshake on every call. Idle clients are closed after a
+# while, and the least recently used ones when the pool is full. While an
+# account waits for its trigger, its connections are kept warm.
+#
+# @section libraries_client_pool Libraries/Modules
+# - access to Any, Coroutine and Optional types
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - standart collections library (https://docs.python.org/3/library/collections.html)
+# - standart json library (https://docs.python.org/3/library/json.html)
+# - standart time library (https://docs.python.org/3/library/time.html)
+# - standart weakref library (https://docs.python.org/3/library/weakref.html)
+# - access to aiohttp (installed with web3)
+# - access to web3
+# - access to per-endpoint RPC limits
+# - access to read-through RPC cache
+# - access to endpoint health
+# - access to multi-endpoint RPC router
+#
+# @section author_client_pool Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, Coroutine, Optional
+import asyncio
+from collections import OrderedDict
+import json
+import time
+import weakref
+import aiohttp
+from web3 import AsyncWeb3
+from web3.providers.async_rpc import AsyncHTTPProvider
+from rpc_limits import get_endpoint_semaphore
+from rpc_cache import rpc_cache_middleware
+from endpoint_health import call_endpoint, is_rejected, is_retryable, with_retries
+from rpc_router import BROADCAST_METHOD, RpcRouter, get_broadcast_router, get_router, get_sent_response, is_already_known, is_read
+
+# Global constants
+## Default number of open connections of one client.
+DEFAULT_CONNECTIONS_PER_CLIENT = 10
+## Default seconds an unused client stays open.
+DEFAULT_CLIENT_IDLE_TIMEOUT = 300
+## Most clients kept open at once.
+MAX_CLIENTS = 1000
+## Seconds one request may take.
+REQUEST_TIMEOUT = 30
+## Seconds between two requests keeping connections warm, below common server keep-alive timeouts.
+KEEP_WARM_INTERVAL = 20
+## Default number of reads coalesced into one batch.
+DEFAULT_READ_BATCH_SIZE = 100
+## Default seconds a read waits for others to share its batch.
+DEFAULT_READ_BATCH_WINDOW = 0.005
+
+connections_per_client = DEFAULT_CONNECTIONS_PER_CLIENT
+client_idle_timeout = DEFAULT_CLIENT_IDLE_TIMEOUT
+read_batch_size = DEFAULT_READ_BATCH_SIZE
+read_batch_window = DEFAULT_READ_BATCH_WINDOW
+## Client pools, per event loop.
+client_pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+class PooledHTTPProvider(AsyncHTTPProvider):
+    """ Async HTTP provider sending requests through the pooled session of its endpoint and proxy."""
+
+    def __init__(self, endpoint_uri: str, proxy: Any = None):
+        """ Create provider.
+
+        @param endpoint_uri URL of the RPC endpoint
+        @param proxy        Proxy from account (like login:password@ip:port)
+        """
+
+        super().__init__(endpoint_uri)
+        self.proxy = proxy
+        self.batcher = ReadBatcher(self)
+
+    async def make_request(self, method: Any, params: Any) -> Any:
+        if is_read([method]):
+            # Coalesced with the concurrent reads of other accounts
+            return await self.batcher.request(method, params)
+
+        request_data = self.encode_rpc_request(method, params)
+
+        broadcast_router = get_broadcast_router(self.endpoint_uri) if method == BROADCAST_METHOD else None
+        if broadcast_router is not None:
+            return await with_retries(lambda: self.broadcast(broadcast_router, request_data, params), retryable=is_rejected)
+
+        response = self.decode_rpc_response(await self.send(request_data, [method]))
+        if method == BROADCAST_METHOD:
+            response = get_sent_response(response, params)
+        return response
+
+    async def send(self, request_data: bytes, methods: list[str]) -> bytes:
+        """ Send an encoded request or batch to the network, retrying transient failures.
+
+        @param request_data Encoded JSON-RPC request or batch
+        @param methods      JSON-RPC methods of the request
+
+        @return Raw response
+        """
+
+        # A write is sent again only if it surely never reached the node
+        retryable = is_retryable if is_read(methods) else is_rejected
+        router = get_router(self.endpoint_uri)
+        if router is None:
+            return await with_retries(lambda: call_endpoint(self.endpoint_uri, lambda: self.post(self.endpoint_uri, request_data)), retryable=retryable)
+        return await with_retries(lambda: router.request(lambda endpoint: self.post(endpoint, request_data), hedge=is_read(methods)), retryable=retryable)
+
+    async def broadcast(self, router: RpcRouter, request_data: bytes, params: Any) -> Any:
+        """ Send a signed transaction to every endpoint of the network.
+
+        @param router       Router of the network
+        @param request_data Encoded eth_sendRawTransaction request
+        @param params       Params of the request, the raw transaction
+
+        @return Response of the first endpoint that accepted the transaction
+        """
+
+        def accepted(raw_response: bytes) -> bool:
+            response = self.decode_rpc_response(raw_response)
+            return 'result' in response or is_already_known(response.get('error'))
+
+        # Another endpoint of the broadcast may have got it first
+        return get_sent_response(self.decode_rpc_response(await router.broadcast(lambda endpoint: self.post(endpoint, request_data), accepted)), params)
+
+    async def post(self, endpoint: str, request_data: bytes) -> bytes:
+        """ Post an encoded request to an endpoint.
+
+        @param endpoint     URL of the endpoint
+        @param request_data Encoded JSON-RPC request
+
+        @return Raw response
+        """
+
+        # Looked up on every request, so an evicted session is replaced by a new one
+        session, proxy = get_session(endpoint, self.proxy)
+        async with get_endpoint_semaphore(endpoint):
+            async with session.post(endpoint, data=request_data, proxy=proxy, **self.get_request_kwargs()) as response:
+                response.raise_for_status()
+                return await response.read()
+
+class ReadBatcher:
+    """ Coalesces concurrent reads of one endpoint and proxy into JSON-RPC batch arrays."""
+
+    def __init__(self, provider: PooledHTTPProvider):
+        """ Create read batcher.
+
+        @param provider Provider the batches are sent with
+        """
+
+        self.provider = provider
+        self.queue: list[tuple[str, Any, asyncio.Future]] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.batches: set[asyncio.Task] = set()
+
+    async def request(self, method: str, params: Any) -> dict[str, Any]:
+        """ Queue a read and wait for its response.
+
+        @param method JSON-RPC method
+        @param params Params of the request
+
+        @return Decoded JSON-RPC response
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.queue.append((method, params, future))
+
+        if len(self.queue) >= read_batch_size:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(read_batch_window, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        """ Send the queued reads as one batch."""
+
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+
+        chunk, self.queue = self.queue, []
+        if not chunk:
+            return
+        task = asyncio.ensure_future(self.send(chunk))
+        self.batches.add(task)
+        task.add_done_callback(self.batches.discard)
+
+    async def send(self, chunk: list[tuple[str, Any, asyncio.Future]]) -> None:
+        """ Send a batch of reads and hand every response to its waiter.
+
+        @param chunk List of (method, params, future) of the batch
+        """
+
+        # Encoded by web3 one by one, so every response keeps the id web3 gave its request
+        requests = [self.provider.encode_rpc_request(method, params) for method, params, _ in chunk]
+        request_data = requests[0] if len(requests) == 1 else b'[' + b','.join(requests) + b']'
+        try:
+            body = json.loads(await self.provider.send(request_data, [method for method, _, _ in chunk]))
+        except Exception as e:
+            for _, _, future in chunk:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Responses of a batch may come in any order, a batch-level error comes as one object
+        items = body if isinstance(body, list) else [body]
+        responses = {item.get('id'): item for item in items if isinstance(item, dict)}
+        error = body.get('error') if isinstance(body, dict) else None
+        for request, (_, _, future) in zip(requests, chunk):
+            request_id = json.loads(request)['id']
+            if not future.done():
+                future.set_result(responses.get(request_id, {'jsonrpc': '2.0', 'id': request_id, 'error': error or {'code': -32603, 'message': 'No response in batch'}}))
+
+class Client:
+    """ Web3 provider and HTTP session of one endpoint and proxy."""
+
+    def __init__(self, rpc: str, proxy: Any):
+        """ Create client.
+
+        @param rpc   URL of the RPC endpoint
+        @param proxy Proxy from account (like login:password@ip:port)
+        """
+
+        self.proxy = get_proxy_url(proxy)
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=connections_per_client, keepalive_timeout=client_idle_timeout),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        )
+        self.w3 = AsyncWeb3(PooledHTTPProvider(rpc, proxy))
+        self.w3.middleware_onion.add(rpc_cache_middleware, 'rpc_cache')
+        self.last_used = time.monotonic()
+
+class ClientPool:
+    """ Clients of one event loop by endpoint and proxy."""
+
+    def __init__(self):
+        """ Create client pool."""
+
+        self.clients: OrderedDict[tuple[str, Optional[str]], Client] = OrderedDict()
+        self.evicted: set[aiohttp.ClientSession] = set()
+
+    def get_client(self, rpc: str, proxy: Any = None) -> Client:
+        """ Get the client of an endpoint and proxy, creating it if needed.
+
+        @param rpc   URL of the RPC endpoint
+        @param proxy Proxy from account (like login:password@ip:port)
+
+        @return Client
+        """
+
+        key = (rpc, get_proxy_url(proxy))
+        client = self.clients.get(key)
+        if client is None or client.session.closed:
+            client = self.clients[key] = Client(rpc, proxy)
+
+        client.last_used = time.monotonic()
+        self.clients.move_to_end(key)
+        self.evict()
+        return client
+
+    def evict(self) -> None:
+        """ Close clients that were idle too long, and the oldest ones over the limit."""
+
+        now = time.monotonic()
+        while self.clients:
+            key, client = next(iter(self.clients.items()))
+            if len(self.clients) <= MAX_CLIENTS and now - client.last_used < client_idle_timeout:
+                break
+            del self.clients[key]
+            # Requests already sent through it still finish
+            self.evicted.add(client.session)
+            asyncio.get_running_loop().call_later(REQUEST_TIMEOUT, self.close_evicted, client.session)
+
+    def close_evicted(self, session: aiohttp.ClientSession) -> None:
+        """ Close the session of an evicted client.
+
+        @param session Session of the evicted client
+        """
+
+        if session in self.evicted:
+            self.evicted.discard(session)
+            asyncio.ensure_future(session.close())
+
+    async def close(self) -> None:
+        """ Close all clients."""
+
+        sessions = [client.session for client in self.clients.values()] + list(self.evicted)
+        self.clients.clear()
+        self.evicted.clear()
+        await asyncio.gather(*(session.close() for session in sessions))
+
+class ConnectionWarmer:
+    """ Keeps connections of endpoints and proxies open while an account waits.
+
+    Use as async context manager around the wait.
+    """
+
+    def __init__(self, endpoints: list[tuple[str, Any]], interval: float = KEEP_WARM_INTERVAL):
+        """ Create connection warmer.
+
+        @param endpoints List of (RPC URL, proxy from account) used after the wait
+        @param interval  Seconds between two requests on each connection
+        """
+
+        self.endpoints = endpoints
+        self.interval = interval
+        self.task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> 'ConnectionWarmer':
+        self.task = asyncio.create_task(self.run())
+        return self
+
+    async def __aexit__(self, *exception: Any) -> None:
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+    async def run(self) -> None:
+        """ Open the connections, then keep them from idling out."""
+
+        while True:
+            # A failed request only means the first real one pays the handshake
+            await asyncio.gather(*(warm_up(rpc, proxy) for rpc, proxy in self.endpoints), return_exceptions=True)
+            await asyncio.sleep(self.interval)
+
+# Functions
+def set_client_limits(connections: Any, idle_timeout: Any) -> None:
+    """ Set the size and idle timeout of new clients.
+
+    @param connections  Open connections of one client, invalid values fall back to default
+    @param idle_timeout Seconds an unused client stays open, invalid values fall back to default
+    """
+
+    global connections_per_client, client_idle_timeout
+
+    try:
+        connections_per_client = max(1, int(connections))
+    except (TypeError, ValueError):
+        connections_per_client = DEFAULT_CONNECTIONS_PER_CLIENT
+
+    try:
+        client_idle_timeout = max(1, int(idle_timeout))
+    except (TypeError, ValueError):
+        client_idle_timeout = DEFAULT_CLIENT_IDLE_TIMEOUT
+
+def set_read_batch(size: Any, window_ms: Any) -> None:
+    """ Set how concurrent reads are coalesced into batches.
+
+    @param size      Most reads in one batch, 1 sends every read alone, invalid values fall back to default
+    @param window_ms Milliseconds a read waits for others, invalid values fall back to default
+    """
+
+    global read_batch_size, read_batch_window
+
+    try:
+        read_batch_size = max(1, int(size))
+    except (TypeError, ValueError):
+        read_batch_size = DEFAULT_READ_BATCH_SIZE
+
+    try:
+        read_batch_window = max(0.0, float(window_ms) / 1000)
+    except (TypeError, ValueError):
+        read_batch_window = DEFAULT_READ_BATCH_WINDOW
+
+def get_proxy_url(proxy: Any) -> Optional[str]:
+    """ Get proxy URL from account proxy.
+
+    @param proxy Proxy from account (like login:password@ip:port)
+
+    @return Proxy URL, or None without proxy
+    """
+
+    return 'http://' + proxy if isinstance(proxy, str) and proxy != '' else None
+
+def get_client_pool() -> ClientPool:
+    """ Get the client pool of the running event loop.
+
+    @return Client pool
+    """
+
+    loop = asyncio.get_running_loop()
+    if loop not in client_pools:
+        client_pools[loop] = ClientPool()
+    return client_pools[loop]
+
+def get_web3(rpc: str, proxy: Any = None) -> AsyncWeb3:
+    """ Get the pooled async Web3 provider of an endpoint and proxy.
+
+    @param rpc   URL of the RPC endpoint
+    @param proxy Proxy from account (like login:password@ip:port)
+
+    @return Async Web3 provider limited by the requests in flight per endpoint
+    """
+
+    return get_client_pool().get_client(rpc, proxy).w3
+
+def get_session(rpc: str, proxy: Any = None) -> tuple[aiohttp.ClientSession, Optional[str]]:
+    """ Get the pooled HTTP session of an endpoint and proxy.
+
+    @param rpc   URL of the RPC endpoint
+    @param proxy Proxy from account (like login:password@ip:port)
+
+    @return Session and proxy URL to pass with each request
+    """
+
+    client = get_client_pool().get_client(rpc, proxy)
+    return client.session, client.proxy
+
+async def warm_up(rpc: str, proxy: Any = None) -> None:
+    """ Open or refresh the pooled connections of a network with a cheap request.
+
+    Sent outside of Web3, so request caches and endpoint limits do not apply.
+
+    @param rpc   URL of the RPC endpoint
+    @param proxy Proxy from account (like login:password@ip:port)
+    """
+
+    router = get_router(rpc)
+    endpoints = router.endpoints if router is not None else [rpc]
+
+    for endpoint in endpoints:
+        session, proxy_url = get_session(endpoint, proxy)
+        async with session.post(endpoint, json={'jsonrpc': '2.0', 'id': 0, 'method': 'eth_chainId', 'params': []}, proxy=proxy_url) as response:
+            await response.read()
+
+def run_with_clients(coroutine: Coroutine) -> Any:
+    """ Run a coroutine on a new event loop and close its clients at the end.
+
+    @param coroutine Coroutine to run
+
+    @return Result of the coroutine
+    """
+
+    async def run() -> Any:
+        try:
+            return await coroutine
+        finally:
+            await get_client_pool().close()
+
+    return asyncio.run(run())
@@ -0,0 +1,260 @@
+"""! @brief Defines the RPC endpoint health, retries and circuit breaker."""
+##
+# @file endpoint_health.py
+#
+# @brief Defines the RPC endpoint health, retries and circuit breaker.
+#
+# @section description_endpoint_health Description
+# Defines the health of every RPC endpoint: latency samples, error rate
+# and a circuit breaker that stops sending to an endpoint after several
+# failures in a row and lets one trial request through after a cooldown.
+# Rate limits (HTTP 429), server errors (5xx), timeouts and dropped
+# connections are retried with jittered exponential backoff. The recent
+# results of all endpoints drive the adaptive concurrency of the runners.
+#
+# @section libraries_endpoint_health Libraries/Modules
+# - access to Any, Awaitable, Callable, NamedTuple and Optional types
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - standart collections library (https://docs.python.org/3/library/collections.html)
+# - standart random library (https://docs.python.org/3/library/random.html)
+# - standart statistics library (https://docs.python.org/3/library/statistics.html)
+# - standart time library (https://docs.python.org/3/library/time.html)
+# - access to aiohttp (installed with web3)
+#
+# @section author_endpoint_health Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+import asyncio
+from collections import deque
+import random
+import statistics
+import time
+import aiohttp
+
+# Global constants
+## Latency samples kept per endpoint.
+LATENCY_SAMPLES = 100
+## Samples needed before a latency percentile is trusted.
+MIN_PERCENTILE_SAMPLES = 20
+## Weight of the latest result in the error rate.
+ERROR_RATE_WEIGHT = 0.2
+## Error rate above which an endpoint is unhealthy.
+MAX_ERROR_RATE = 0.5
+## Failures in a row that open the circuit of an endpoint.
+BREAKER_FAILURES = 5
+## Seconds an open circuit waits before a trial request.
+BREAKER_COOLDOWN = 30
+## Retries of a failed request.
+MAX_RETRIES = 4
+## Seconds of the first retry delay, doubled on every retry.
+RETRY_BASE_DELAY = 0.5
+## Most seconds of one retry delay.
+RETRY_MAX_DELAY = 10
+## Seconds of results the adaptive concurrency looks at.
+RECENT_WINDOW = 10
+## HTTP statuses worth a retry.
+RETRY_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+
+## Health of every endpoint.
+endpoint_healths: dict[str, 'EndpointHealth'] = {}
+## Recent results of all endpoints, as (time, latency, success).
+recent_results: deque[tuple[float, float, bool]] = deque(maxlen=10000)
+
+class CircuitOpenError(Exception):
+    """ The circuit of an endpoint is open, the request was not sent."""
+
+class RecentStats(NamedTuple):
+    """ Results of all endpoints in the recent window."""
+
+    requests: int
+    error_rate: float
+    p95_latency: Optional[float]
+
+class EndpointHealth:
+    """ Latency, error rate and circuit breaker of one endpoint."""
+
+    def __init__(self):
+        """ Create endpoint health."""
+
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.error_rate = 0.0
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial = False
+
+    def record(self, latency: float, success: bool) -> None:
+        """ Record the result of one request.
+
+        @param latency Seconds the request took
+        @param success Whether the endpoint answered
+        """
+
+        if success:
+            self.latencies.append(latency)
+            self.failures = 0
+            self.opened_at = None
+        else:
+            self.failures += 1
+            if self.failures >= BREAKER_FAILURES or self.trial:
+                self.opened_at = time.monotonic()
+        self.trial = False
+        self.error_rate += ERROR_RATE_WEIGHT * ((0.0 if success else 1.0) - self.error_rate)
+        recent_results.append((time.monotonic(), latency, success))
+
+    def allow_request(self) -> bool:
+        """ Check the circuit breaker before a request.
+
+        @return True if the request may be sent
+        """
+
+        if self.opened_at is None:
+            return True
+        if self.trial or time.monotonic() - self.opened_at < BREAKER_COOLDOWN:
+            return False
+        # Half-open, one trial request decides
+        self.trial = True
+        return True
+
+    def cancel_trial(self) -> None:
+        """ Give the trial back when its request was cancelled."""
+
+        self.trial = False
+
+    def is_open(self) -> bool:
+        return self.opened_at is not None and time.monotonic() - self.opened_at < BREAKER_COOLDOWN
+
+    def is_healthy(self) -> bool:
+        return self.error_rate <= MAX_ERROR_RATE and not self.is_open()
+
+    def median(self) -> float:
+        """ Get median latency, 0 without samples so a new endpoint is tried first.
+
+        @return Median latency in seconds
+        """
+
+        return statistics.median(self.latencies) if self.latencies else 0.0
+
+    def percentile(self, percentile: int) -> Optional[float]:
+        """ Get a latency percentile.
+
+        @param percentile Percentile from 1 to 99
+
+        @return Latency in seconds, or None with too few samples
+        """
+
+        if len(self.latencies) < MIN_PERCENTILE_SAMPLES:
+            return None
+        return statistics.quantiles(self.latencies, n=100)[percentile - 1]
+
+# Functions
+def get_health(endpoint: str) -> EndpointHealth:
+    """ Get the health of an endpoint.
+
+    @param endpoint URL of the endpoint
+
+    @return Endpoint health
+    """
+
+    if endpoint not in endpoint_healths:
+        endpoint_healths[endpoint] = EndpointHealth()
+    return endpoint_healths[endpoint]
+
+def is_retryable(error: BaseException) -> bool:
+    """ Check whether a failed request is worth a retry and counts against the endpoint.
+
+    @param error Error of the request
+
+    @return True for rate limits, server errors, timeouts and connection errors
+    """
+
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRY_STATUSES
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, CircuitOpenError))
+
+def is_rejected(error: BaseException) -> bool:
+    """ Check whether a failed request surely never reached the node, so a write may be sent again.
+
+    @param error Error of the request
+
+    @return True for rate limits, refused connections and open circuits
+    """
+
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429
+    # A timeout or server error may come after the node took the transaction
+    return isinstance(error, (aiohttp.ClientConnectorError, CircuitOpenError))
+
+async def call_endpoint(endpoint: str, send: Callable[[], Awaitable[Any]]) -> Any:
+    """ Send one request to an endpoint through its circuit breaker and record the result.
+
+    @param endpoint URL of the endpoint
+    @param send     Coroutine function sending the request
+
+    @return Response of the endpoint
+
+    @exception CircuitOpenError The circuit of the endpoint is open
+    """
+
+    health = get_health(endpoint)
+    if not health.allow_request():
+        raise CircuitOpenError(f'Circuit of {endpoint} is open')
+
+    start = time.monotonic()
+    try:
+        response = await send()
+    except asyncio.CancelledError:
+        health.cancel_trial()
+        raise
+    except Exception as e:
+        if is_retryable(e):
+            health.record(time.monotonic() - start, False)
+        else:
+            # The request itself was wrong, the endpoint answered
+            health.record(time.monotonic() - start, True)
+        raise
+
+    health.record(time.monotonic() - start, True)
+    return response
+
+async def with_retries(
+    send: Callable[[], Awaitable[Any]],
+    retries: int = MAX_RETRIES,
+    retryable: Callable[[BaseException], bool] = is_retryable
+) -> Any:
+    """ Send a request, retrying transient failures with jittered exponential backoff.
+
+    @param send      Coroutine function sending the request
+    @param retries   Retries after the first attempt
+    @param retryable Check whether a failure is worth a retry, is_rejected for writes
+
+    @return Response
+    """
+
+    for attempt in range(retries + 1):
+        try:
+            return await send()
+        except Exception as e:
+            if attempt == retries or not retryable(e):
+                raise
+        # Full jitter, so throttled workers do not retry in step
+        await asyncio.sleep(random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)))
+
+def get_recent_stats(window: float = RECENT_WINDOW) -> RecentStats:
+    """ Get results of all endpoints in the recent window.
+
+    @param window Seconds to look back
+
+    @return Number of requests, error rate and p95 latency
+    """
+
+    since = time.monotonic() - window
+    results = [result for result in recent_results if result[0] >= since]
+    if not results:
+        return RecentStats(0, 0.0, None)
+
+    errors = sum(1 for _, _, success in results if not success)
+    latencies = [latency for _, latency, success in results if success]
+    p95_latency = statistics.quantiles(latencies, n=100)[94] if len(latencies) >= MIN_PERCENTILE_SAMPLES else None
+    return RecentStats(len(results), errors / len(results), p95_latency)
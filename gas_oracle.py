@@ -0,0 +1,139 @@
+"""! @brief Defines the shared gas price oracle."""
+##
+# @file gas_oracle.py
+#
+# @brief Defines the shared gas price oracle.
+#
+# @section description_gas_oracle Description
+# Defines the gas oracle, which polls the gas price of an RPC endpoint once
+# for the whole process and releases every waiting account together when
+# the gas price drops below its threshold.
+#
+# @section libraries_gas_oracle Libraries/Modules
+# - access to Callable and Optional types
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - access to web3
+# - access to helpers
+# - access to Poller base class
+#
+# @section author_gas_oracle Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Callable, Optional
+import asyncio
+from web3 import Web3
+import helpers
+from poller import Poller
+
+# Global constants
+## Seconds between two gas price requests.
+GAS_POLL_INTERVAL = 5
+
+## Gas oracles by RPC endpoint.
+gas_oracles: dict[str, 'GasOracle'] = {}
+
+class GasOracle(Poller):
+    """ Gas price of one RPC endpoint, polled while someone is waiting for it."""
+
+    def __init__(self, rpc: str, interval: float = GAS_POLL_INTERVAL):
+        """ Create gas oracle.
+
+        @param rpc      URL of the RPC endpoint
+        @param interval Seconds between two gas price requests
+        """
+
+        super().__init__(interval)
+        self.rpc = rpc
+        self.gas_price: Optional[int] = None
+        self.error: Optional[Exception] = None
+        self.waiters = 0
+        self.changed: Optional[asyncio.Condition] = None
+
+    async def get_gas_price(self) -> int:
+        """ Get the latest published gas price.
+
+        @return Gas price in wei
+
+        @exception PollError The gas price could not be read
+        """
+
+        self.waiters += 1
+        try:
+            self.ensure_running()
+            return await self.wait_for(lambda: self.gas_price is not None)
+        finally:
+            self.waiters -= 1
+
+    async def wait_below(self, max_gas_in_gwei: float, timeout: Optional[float] = None) -> int:
+        """ Wait until the gas price is lower than the threshold.
+
+        @param max_gas_in_gwei Threshold for the gas price in gwei
+        @param timeout         Seconds to wait, no limit if None
+
+        @return Gas price in wei that released the wait
+
+        @exception asyncio.TimeoutError The gas price stayed above the threshold for timeout seconds
+        @exception PollError            The gas price could not be read
+        """
+
+        threshold = Web3.to_wei(float(max_gas_in_gwei), 'gwei')
+
+        self.waiters += 1
+        try:
+            self.ensure_running()
+            return await asyncio.wait_for(self.wait_for(lambda: self.gas_price is not None and self.gas_price < threshold), timeout)
+        finally:
+            self.waiters -= 1
+
+    async def wait_for(self, predicate: Callable[[], bool]) -> int:
+        """ Wait until the gas price matches, or polling fails.
+
+        @param predicate Check of the published gas price
+
+        @return Gas price in wei
+
+        @exception PollError The gas price could not be read
+        """
+
+        async with self.changed:
+            await self.changed.wait_for(lambda: self.error is not None or predicate())
+            if self.error is not None:
+                raise self.error
+            return self.gas_price
+
+    def reset(self) -> None:
+        self.gas_price = None
+        self.error = None
+        self.changed = asyncio.Condition()
+        self.w3 = helpers.get_async_web3(self.rpc)
+
+    async def poll(self) -> None:
+        gas_price = await self.w3.eth.gas_price
+
+        async with self.changed:
+            self.gas_price = gas_price
+            self.error = None
+            self.changed.notify_all()
+
+    async def fail(self, error: Exception) -> None:
+        async with self.changed:
+            # Kept until a poll succeeds, so later waiters fail at once too
+            self.error = error
+            self.changed.notify_all()
+
+    def is_idle(self) -> bool:
+        return self.waiters == 0
+
+# Functions
+def get_gas_oracle(rpc: str) -> GasOracle:
+    """ Get the gas oracle shared by every account using an endpoint.
+
+    @param rpc URL of the RPC endpoint
+
+    @return Gas oracle for the endpoint
+    """
+
+    if rpc not in gas_oracles:
+        gas_oracles[rpc] = GasOracle(rpc)
+    return gas_oracles[rpc]
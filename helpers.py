@@ -5,41 +5,62 @@
 # @brief Helper functions for scripts.
 #
 # @section description_helpers Description
-# Contains helper functions
+# Contains helper functions. Web3 and the RPC modules are loaded on first
+# use, so reading settings at startup stays cheap.
 #
 # @section libraries_helpers Libraries/Modules
 # - access to os
+# - access to re
 # - access to sys
-# - access to pandas
+# - standart weakref library (https://docs.python.org/3/library/weakref.html)
+# - access to Any and TYPE_CHECKING types
+# - access to lazy module imports
 # - access to web3
+# - access to RPC client pool
+# - access to multi-endpoint RPC router
+# - access to cached settings
 #
 # @section author_helpers Author(s)
 # - Created by mutedspectre.eth on 07/20/2023.
-# - Modified by mutedspectre.eth on 07/25/2023.
+# - Modified by mutedspectre.eth on 10/16/2026.
 
 # Imports
 import os
+import re
 import sys
-import pandas as pd
-from web3 import Web3
+import weakref
+from typing import Any, TYPE_CHECKING
+from lazy_module import lazy_import
+from settings_store import Settings, load_settings, save_settings as store_settings
+
+if TYPE_CHECKING:
+    from web3 import AsyncWeb3
+    from web3.contract import AsyncContract
+
+web3 = lazy_import('web3')
+client_pool = lazy_import('client_pool')
+rpc_router = lazy_import('rpc_router')
+
+# Global constants
+## Contracts by address and ABI, per Web3 provider.
+contracts: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 # Functions
-def get_accounts():
-    """ Get accounts from accounts.csv"""
-    accounts = pd.read_csv(resource_path('accounts.csv')).iloc()
-    return accounts
+def get_settings() -> Settings:
+    """ Get settings from settings.csv, parsed again only if the file changed"""
+    return load_settings(resource_path('settings.csv'))
 
-def get_shuffled_accounts():
-    """ Get shuffled accounts from accounts.csv"""
+def save_settings(values: dict[str, Any]) -> Settings:
+    """ Save changed settings to settings.csv
 
-    accounts = pd.read_csv(resource_path('accounts.csv'))
-    accounts = accounts.sample(frac=1)
-    return accounts.iloc()
+    @param values Changed values by column
 
-def get_settings():
-    """ Get settings from settings.csv"""
-    settings = pd.read_csv(resource_path('settings.csv')).iloc[0]
-    return settings
+    @return Settings after the change
+
+    @exception ValueError A setting has a wrong value, nothing is saved
+    """
+
+    return store_settings(resource_path('settings.csv'), values)
 
 def resource_path(relative_path: str) -> str:
     """ Get absolute path to resource, works for dev and for PyInstaller 
@@ -50,11 +71,67 @@ def resource_path(relative_path: str) -> str:
     base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
     return os.path.join(base_path, relative_path)
 
+def get_async_web3(rpc: str, proxy: Any = None) -> 'AsyncWeb3':
+    """ Get async Web3 provider for rpc, optionally through account proxy
+
+    @param rpc   URL of the RPC endpoint
+    @param proxy Proxy from account (like login:password@ip:port)
+
+    @return Pooled async Web3 provider of the running event loop, limited by the requests in flight per endpoint
+    """
+
+    return client_pool.get_web3(rpc, proxy)
+
+def get_contract(w3: 'AsyncWeb3', address: str, abi: list[dict[str, Any]]) -> 'AsyncContract':
+    """ Get a contract of a Web3 provider, built once and shared by every account using the provider
+
+    @param w3      Async Web3 provider
+    @param address Checksum address of the contract
+    @param abi     ABI of the contract, one of the lists from abi module
+
+    @return Contract
+    """
+
+    provider_contracts = contracts.setdefault(w3, {})
+    key = (address, id(abi))
+    if key not in provider_contracts:
+        provider_contracts[key] = w3.eth.contract(address=address, abi=abi)
+    return provider_contracts[key]
+
+def parse_nft_url(nft_url: str) -> tuple[str, int]:
+    """ Get NFT contract address and token id from url
+
+    @param nft_url URL of the NFT on zora.co
+
+    @return Checksum address of the NFT contract and token id
+
+    @exception ValueError The url is not a Zora Network 1155 NFT url
+    """
+
+    ## Check if NFT is for sale on Zora Network
+    match = re.search(r'(zora|eth):([^/]+)', nft_url)
+    if match:
+        if match.group(1) == 'eth':
+            raise ValueError('NFT not found on Zora Network. It is for sale on Ethereum Network.')
+
+    ## Get NFT address and id
+    match = re.search(r'0x[^/]+', nft_url)
+    if match:
+        nft_address = web3.Web3.to_checksum_address(match.group(0))
+    else:
+        raise ValueError('NFT contract not found in url.')
+
+    nft_id = nft_url.rsplit('/', 1)[-1]
+    if nft_id.isdigit() == False:
+        raise ValueError('NFT id not found in url.')
+
+    return nft_address, int(nft_id)
+
 def calculate_zora_fee_in_wei(
     mint_price: int, 
     gas_price_for_mint: float, 
     gas_for_mint: int, 
-    w3_eth: Web3, 
+    l1_gas_price: int, 
     testnet: bool
     ) -> int:
     """ Calculate zora fee method
@@ -62,7 +139,7 @@ def calculate_zora_fee_in_wei(
     @param mint_price         Price for mint without default price (default Zora price is 0.000777 ETH)
     @param gas_price_for_mint Price for gas in Zora Network
     @param gas_for_mint       Gas amount for tx 'mint' (av. 130-160k)
-    @param w3_eth             Web3 provider for ethereum (needed for testnet)
+    @param l1_gas_price       Gas price on Ethereum in wei
     @param testnet            Use testnet, or no
 
     @return Required amount of eth for minting on Zora Network
@@ -71,58 +148,34 @@ def calculate_zora_fee_in_wei(
     # Calculate mint_price ETH to wei
     if testnet == False:
         # Calculate gas_price_for_mint gwei to wei * gas_for_mint + L1 gas price * 4000 * gas fee scalar
-        zora_gas_fee = Web3.to_wei(gas_price_for_mint, 'gwei') * int(gas_for_mint) + int(w3_eth.eth.gas_price * 4000 * 0.684)
+        zora_gas_fee = web3.Web3.to_wei(gas_price_for_mint, 'gwei') * int(gas_for_mint) + int(l1_gas_price * 4000 * 0.684)
     else:
         # testnet zora have 1:1 gas fee scalar
-        zora_gas_fee = Web3.to_wei(gas_price_for_mint, 'gwei') * int(gas_for_mint) + Web3.to_wei(4, 'gwei') * 7000
+        zora_gas_fee = web3.Web3.to_wei(gas_price_for_mint, 'gwei') * int(gas_for_mint) + web3.Web3.to_wei(4, 'gwei') * 7000
 
     return mint_price + zora_gas_fee
 
 def get_zora_rpc_for_bridge() -> str:
-    settings = get_settings()
-    if bool(settings['is_testnet_bridge']) == True:
-        return 'https://testnet.rpc.zora.energy'
-    else:
-        return 'https://rpc.zora.energy'
+    return rpc_router.register_endpoints(get_settings().zora_rpcs_for_bridge)
 
 def get_eth_rpc_for_bridge() -> str:
-    settings = get_settings()
-    if bool(settings['is_testnet_bridge']) == True:
-        return 'https://rpc.ankr.com/eth_goerli'
-    else:
-        return 'https://eth.llamarpc.com'
+    return rpc_router.register_endpoints(get_settings().eth_rpcs_for_bridge)
 
 def get_zora_rpc_for_mint() -> str:
-    settings = get_settings()
-    if bool(settings['is_testnet_mint']) == True:
-        return 'https://testnet.rpc.zora.energy'
-    else:
-        return 'https://rpc.zora.energy'
+    return rpc_router.register_endpoints(get_settings().zora_rpcs_for_mint)
 
 def get_eth_rpc_for_mint() -> str:
-    settings = get_settings()
-    if bool(settings['is_testnet_mint']) == True:
-        return 'https://rpc.ankr.com/eth_goerli'
-    else:
-        return 'https://eth.llamarpc.com'
+    return rpc_router.register_endpoints(get_settings().eth_rpcs_for_mint)
 
 def get_bridge_contract_address() -> str:
-    settings = get_settings()
-    if bool(settings['is_testnet_bridge']) == True:
-        return '0xDb9F51790365e7dc196e7D072728df39Be958ACe'
-    else:
-        return '0x1a0ad011913A150f69f6A19DF447A0CfD9551054'
+    return get_settings().bridge_contract_address
 
 def get_minter_address() -> str:
-    settings = get_settings()
-    if bool(settings['is_testnet_mint']) == True:
-        return '0xd81351363b7d80b06e4ec4de7989f0f91e41a846'
-    else:
-        return '0x169d9147dfc9409afa4e558df2c9abeebc020182'
+    return get_settings().minter_address
 
 def get_price_stategy_address() -> str:
-    settings = get_settings()
-    if bool(settings['is_testnet_mint']) == True:
-        return '0xd81351363b7d80b06E4Ec4De7989f0f91e41A846'
-    else:
-        return '0x169d9147dfc9409afa4e558df2c9abeebc020182'
\ No newline at end of file
+    return get_settings().price_strategy_address
+
+def get_multicall_address() -> str:
+    # Multicall3 has the same address on every network
+    return '0xcA11bde05977b3631167028862bE2a173976CA11'
@@ -0,0 +1,43 @@
+"""! @brief Defines lazy module imports."""
+##
+# @file lazy_module.py
+#
+# @brief Defines lazy module imports.
+#
+# @section description_lazy_module Description
+# Defines a lazy import, which returns a stand-in module right away and
+# imports the real module only when one of its attributes is first used,
+# so heavy or missing optional modules are not loaded before they are needed.
+#
+# @section libraries_lazy_module Libraries/Modules
+# - access to Any type
+# - standart importlib library (https://docs.python.org/3/library/importlib.html)
+# - access to ModuleType type
+#
+# @section author_lazy_module Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any
+import importlib
+from types import ModuleType
+
+class LazyModule(ModuleType):
+    """ Stand-in of a module, imported on first attribute access."""
+
+    def __getattr__(self, attribute: str) -> Any:
+        # Looked up every time, so globals the module reassigns stay current
+        return getattr(importlib.import_module(self.__name__), attribute)
+
+# Functions
+def lazy_import(name: str) -> ModuleType:
+    """ Import a module on first attribute access.
+
+    @param name Name of the module
+
+    @return Stand-in of the module
+
+    @exception ModuleNotFoundError On first attribute access, if there is no such module
+    """
+
+    return LazyModule(name)
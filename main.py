@@ -18,25 +18,33 @@
 # @section libraries_main Libraries/Modules
 # - balance logic module (local)
 # - mint logic module (local)
-# - pandas for csv
 # - logger module (local)
 # - work with gui
 # - access to resource path
-# - access to settings
+# - access to settings and saving them
 # - access to account child window
+# - pre-signed mint module (local)
+# - access to lazy module imports
+# - standart multiprocessing library (https://docs.python.org/3/library/multiprocessing.html)
+# - standart sys library (https://docs.python.org/3/library/sys.html)
 #
 # @section author_main Author(s)
 # - Created by mutedspectre.eth on 07/20/2023.
-# - Modified by mutedspectre.eth on 07/25/2023.
+# - Modified by mutedspectre.eth on 10/16/2026.
 
 # Imports
-import pandas as pd
 import dearpygui.dearpygui as dpg
 from Logger import Logger
 from accounts import account_child_window
-from helpers import resource_path, get_settings
-from bridge_logic import start_bridge_callback
-from mint_logic import start_mint_callback
+from helpers import resource_path, get_settings, save_settings
+from lazy_module import lazy_import
+import multiprocessing
+import sys
+
+# Web3 and the RPC stack load on the first click, not before the first frame
+bridge_logic = lazy_import('bridge_logic')
+mint_logic = lazy_import('mint_logic')
+presign = lazy_import('presign')
 
 # Global constants
 ## A class that draws a logging window, with functions to send messages to the window.
@@ -44,6 +52,42 @@ logger_mint = Logger()
 logger_bridge = Logger()
 
 # GUI callbacks
+def start_mint_callback(sender, app_data, user_data):
+    """ Callback called when mint starts, loads the mint logic on first use.
+
+    @param sender    Sender of the callback
+    @param app_data  Data from the callback
+    @param user_data Logger of the mint tab
+    """
+    mint_logic.start_mint_callback(sender, app_data, user_data)
+
+def start_bridge_callback(sender, app_data, user_data):
+    """ Callback called when bridge starts, loads the bridge logic on first use.
+
+    @param sender    Sender of the callback
+    @param app_data  Data from the callback
+    @param user_data Logger of the bridge tab
+    """
+    bridge_logic.start_bridge_callback(sender, app_data, user_data)
+
+def prepare_mint_callback(sender, app_data, user_data):
+    """ Callback called when mint transactions are prepared, loads the pre-signed mint on first use.
+
+    @param sender    Sender of the callback
+    @param app_data  Data from the callback
+    @param user_data Logger of the mint tab
+    """
+    presign.prepare_mint_callback(sender, app_data, user_data)
+
+def fire_mint_callback(sender, app_data, user_data):
+    """ Callback called when prepared mint transactions are fired, loads the pre-signed mint on first use.
+
+    @param sender    Sender of the callback
+    @param app_data  Data from the callback
+    @param user_data Logger of the mint tab
+    """
+    presign.fire_mint_callback(sender, app_data, user_data)
+
 def select_mint_csv_callback(sender, app_data):
     """ Callback called when a .csv file is selected.
 
@@ -64,21 +108,21 @@ def save_mint_settings_callback(sender, app_data):
     @param sender    Sender of the callback
     @param app_data  Data from the callback
     """
-    settings_csv = pd.read_csv(resource_path('settings.csv'))
-    settings_csv.loc[0,[
-        'nft_url',
-        'mint_price',
-        'gas_price_for_mint',
-        'gas_for_mint',
-        'is_testnet_mint'
-    ]] = [
-        dpg.get_value('NFT_URL'),
-        dpg.get_value('MINT_PRICE'),
-        dpg.get_value('GAS_PRICE_FOR_MINT'),
-        dpg.get_value('GAS_FOR_MINT'),
-        dpg.get_value('IS_TESTNET_MINT')
-    ]
-    settings_csv.to_csv(resource_path('settings.csv'), index=False)
+    try:
+        save_settings({
+            'nft_url':            dpg.get_value('NFT_URL'),
+            'mint_price':         dpg.get_value('MINT_PRICE'),
+            'gas_price_for_mint': dpg.get_value('GAS_PRICE_FOR_MINT'),
+            'gas_for_mint':       dpg.get_value('GAS_FOR_MINT'),
+            'is_testnet_mint':    dpg.get_value('IS_TESTNET_MINT'),
+            'mint_workers':       dpg.get_value('MINT_WORKERS'),
+            'mints_per_account':  dpg.get_value('MINTS_PER_ACCOUNT'),
+            'fire_at_block':      dpg.get_value('FIRE_AT_BLOCK'),
+            'fire_at_timestamp':  dpg.get_value('FIRE_AT_TIMESTAMP')
+        })
+    except ValueError as e:
+        logger_mint.all_error_log(f'Settings not saved: {e}')
+        return
     logger_mint.all_info_log('Settings saved!')
 
 def save_bridge_settings_callback(sender, app_data):
@@ -87,19 +131,18 @@ def save_bridge_settings_callback(sender, app_data):
     @param sender    Sender of the callback
     @param app_data  Data from the callback
     """
-    settings_csv = pd.read_csv(resource_path('settings.csv'))
-    settings_csv.loc[0,[
-        'max_gas_in_gwei',
-        'min_amount_for_bridge',
-        'max_amount_for_bridge',
-        'is_testnet_bridge'
-    ]] = [
-        dpg.get_value('MAX_GAS_IN_GWEI'),
-        dpg.get_value('MIN_AMOUNT_FOR_BRIDGE'),
-        dpg.get_value('MAX_AMOUNT_FOR_BRIDGE'),
-        dpg.get_value('IS_TESTNET_BRIDGE')
-    ]
-    settings_csv.to_csv(resource_path('settings.csv'), index=False)
+    try:
+        save_settings({
+            'max_gas_in_gwei':       dpg.get_value('MAX_GAS_IN_GWEI'),
+            'min_amount_for_bridge': dpg.get_value('MIN_AMOUNT_FOR_BRIDGE'),
+            'max_amount_for_bridge': dpg.get_value('MAX_AMOUNT_FOR_BRIDGE'),
+            'is_testnet_bridge':     dpg.get_value('IS_TESTNET_BRIDGE'),
+            'bridge_workers':        dpg.get_value('BRIDGE_WORKERS'),
+            'rpc_max_in_flight':     dpg.get_value('RPC_MAX_IN_FLIGHT')
+        })
+    except ValueError as e:
+        logger_bridge.all_error_log(f'Settings not saved: {e}')
+        return
     logger_bridge.all_info_log('Settings saved!')
 
 # Functions
@@ -149,6 +192,14 @@ $$___$__$$$$____$$___$$$$$__$$$$$___$$$$__$$_____$$$$$___$$$$____$$___$$__$$_$$$
                         dpg.add_input_text(tag='GAS_PRICE_FOR_MINT', default_value=settings['gas_price_for_mint'])
                         dpg.add_text('Gas for mint:')
                         dpg.add_input_text(tag='GAS_FOR_MINT', default_value=settings['gas_for_mint'])
+                        dpg.add_text('Accounts at once:')
+                        dpg.add_input_text(tag='MINT_WORKERS', default_value=settings['mint_workers'])
+                        dpg.add_text('Mints per account:')
+                        dpg.add_input_text(tag='MINTS_PER_ACCOUNT', default_value=settings['mints_per_account'])
+                        dpg.add_text('Fire at block (0 - right away):')
+                        dpg.add_input_text(tag='FIRE_AT_BLOCK', default_value=settings['fire_at_block'])
+                        dpg.add_text('Fire at unix time (0 - right away):')
+                        dpg.add_input_text(tag='FIRE_AT_TIMESTAMP', default_value=settings['fire_at_timestamp'])
 
                         dpg.add_spacer(height=20)
 
@@ -162,6 +213,11 @@ $$___$__$$$$____$$___$$$$$__$$$$$___$$$$__$$_____$$$$$___$$$$____$$___$$__$$_$$$
                         dpg.add_spacer(height=40)
                         dpg.add_button(label='Start Mint', callback=start_mint_callback, indent=100, user_data=logger_mint)
 
+                        dpg.add_spacer(height=20)
+                        with dpg.group(horizontal=True, indent=50):
+                            dpg.add_button(label='Prepare Mint', callback=prepare_mint_callback, user_data=logger_mint)
+                            dpg.add_button(label='Fire Mint', callback=fire_mint_callback, user_data=logger_mint)
+
                     # second child window with logger
                     with dpg.child_window(width=1068, tag='logger_mint', border=False):
                         logger_mint.create_logger('mint')
@@ -182,6 +238,10 @@ $$___$__$$$$____$$___$$$$$__$$$$$___$$$$__$$_____$$$$$___$$$$____$$___$$__$$_$$$
                         dpg.add_input_text(tag='MIN_AMOUNT_FOR_BRIDGE', default_value=settings['min_amount_for_bridge'])
                         dpg.add_text('Max amount for bridge (ETH):')
                         dpg.add_input_text(tag='MAX_AMOUNT_FOR_BRIDGE', default_value=settings['max_amount_for_bridge'])
+                        dpg.add_text('Accounts at once:')
+                        dpg.add_input_text(tag='BRIDGE_WORKERS', default_value=settings['bridge_workers'])
+                        dpg.add_text('Max requests in flight per RPC:')
+                        dpg.add_input_text(tag='RPC_MAX_IN_FLIGHT', default_value=settings['rpc_max_in_flight'])
 
                         dpg.add_spacer(height=20)
 
@@ -217,7 +277,11 @@ def load_gui():
 
     dpg.set_primary_window('Primary Window', True)
 
-    dpg.start_dearpygui()
+    if '--startup-benchmark' in sys.argv:
+        # Cold start is timed from outside the process: quit after the first rendered frame
+        dpg.render_dearpygui_frame()
+    else:
+        dpg.start_dearpygui()
 
     dpg.destroy_context()
 
@@ -225,4 +289,6 @@ settings = get_settings()
 
 # script entry point
 if __name__ == '__main__':
+    # Signing workers of the pre-signed mint in a frozen build
+    multiprocessing.freeze_support()
     load_gui()
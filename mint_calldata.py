@@ -0,0 +1,109 @@
+"""! @brief Defines the mint calldata templates."""
+##
+# @file mint_calldata.py
+#
+# @brief Defines the mint calldata templates.
+#
+# @section description_mint_calldata Description
+# Defines the calldata template of the 1155 mint call. The calldata of
+# mint(minter, tokenId, 1, minterArguments) differs between accounts only
+# in the recipient address at the end of minterArguments, so it is encoded
+# once per minter and token and filled in with the address of every account.
+# Mint transactions are then assembled from known fields without going
+# through the contract machinery of web3.
+#
+# @section libraries_mint_calldata Libraries/Modules
+# - access to Any type
+# - access to eth_abi encoder (installed with web3)
+# - access to web3
+#
+# @section author_mint_calldata Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any
+from eth_abi import encode
+from web3 import Web3
+
+# Global constants
+## Selector of mint(address,uint256,uint256,bytes).
+MINT_SELECTOR = Web3.keccak(text='mint(address,uint256,uint256,bytes)')[:4]
+## Hex digits of the recipient address at the end of the calldata.
+RECIPIENT_HEX_LENGTH = 40
+
+## Calldata templates by minter and token id.
+mint_templates: dict[tuple[str, int], 'MintCalldata'] = {}
+
+class MintCalldata:
+    """ Calldata of the mint of one token, without the recipient."""
+
+    def __init__(self, minter: str, token_id: int):
+        """ Create calldata template.
+
+        @param minter   Checksum address of the minter
+        @param token_id Id of the token
+        """
+
+        # minterArguments is one word holding the recipient, so it is the tail of the calldata
+        calldata = Web3.to_hex(MINT_SELECTOR + encode(
+            ['address', 'uint256', 'uint256', 'bytes'],
+            [minter, token_id, 1, b'\x00' * 32]
+        ))
+        self.prefix = calldata[:-RECIPIENT_HEX_LENGTH]
+
+    def for_recipient(self, address: str) -> str:
+        """ Get the mint calldata of a recipient.
+
+        @param address Address of the recipient
+
+        @return Calldata as hex string
+        """
+
+        return self.prefix + address[2:].lower()
+
+# Functions
+def get_mint_calldata(minter: str, token_id: int) -> MintCalldata:
+    """ Get the calldata template of a token, encoded on first use.
+
+    @param minter   Address of the minter
+    @param token_id Id of the token
+
+    @return Calldata template
+    """
+
+    key = (Web3.to_checksum_address(minter), token_id)
+    if key not in mint_templates:
+        mint_templates[key] = MintCalldata(*key)
+    return mint_templates[key]
+
+def build_mint_transaction(
+    nft_address: str,
+    calldata: str,
+    value: int,
+    gas: int,
+    gas_price: int,
+    nonce: int,
+    chain_id: int
+) -> dict[str, Any]:
+    """ Assemble a legacy mint transaction from known fields.
+
+    @param nft_address Checksum address of the NFT contract
+    @param calldata    Mint calldata of the account
+    @param value       Mint price in wei
+    @param gas         Gas limit
+    @param gas_price   Gas price in wei
+    @param nonce       Nonce of the account
+    @param chain_id    Chain id of the network
+
+    @return Transaction ready to sign
+    """
+
+    return {
+        'to':       nft_address,
+        'data':     calldata,
+        'value':    value,
+        'gas':      gas,
+        'gasPrice': gas_price,
+        'nonce':    nonce,
+        'chainId':  chain_id
+    }
@@ -10,26 +10,55 @@
 # @section libraries_mint_logic Libraries/Modules
 # - access to Any type
 # - access to web3
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
 # - standart time library (https://docs.python.org/3/library/time.html)
 # - access to Logger type
 # - access to helpers
 # - access to accounts module
-# - access to nft 1155 abi
+# - access to account store
+# - access to mint calldata templates
+# - access to mint target
+# - access to account runner
+# - access to per-endpoint RPC limits
+# - access to RPC client pool
+# - access to multi-endpoint RPC router
+# - access to shared gas oracle
+# - access to shared balance watcher
+# - access to pre-flight snapshot
+# - access to nonce manager
+# - access to shared receipt tracker
 #
 # @section author_mint_logic Author(s)
 # - Created by mutedspectre.eth on 07/20/2023.
-# - Modified by mutedspectre.eth on 07/25/2023.
+# - Modified by mutedspectre.eth on 10/16/2026.
 
 # Imports
-from typing import Any
+from typing import Any, Iterable, Optional
 from web3 import Web3
 from web3.types import Wei
 from Logger import Logger
 import helpers
+import asyncio
 import time
-from abi import nft_1155_abi
-import re
+from mint_calldata import build_mint_transaction
+from mint_target import MintTarget, SaleConfig, get_mint_target, get_sale_config
 from accounts import turn_off_account_mint
+from account_store import get_account_store
+from runner import get_workers, run_accounts
+from rpc_limits import set_endpoint_limit
+from client_pool import ConnectionWarmer, run_with_clients, set_client_limits, set_read_batch
+from rpc_router import set_broadcast
+from gas_oracle import get_gas_oracle
+from balance_watcher import get_balance_watcher
+from preflight import Snapshot, prepare_batch, stream_snapshots
+from nonce_manager import get_nonce_manager
+from receipt_tracker import get_receipt_tracker
+
+# Global constants
+## Accounts checked in one balanceOfBatch call.
+BALANCE_OF_BATCH_CHUNK_SIZE = 500
+## Selector of balanceOfBatch(address[],uint256[]).
+BALANCE_OF_BATCH_SELECTOR = Web3.keccak(text='balanceOfBatch(address[],uint256[])')[:4]
 
 #Functions
 def start_mint_callback(sender: Any, app_data: Any, user_data: Logger) -> None:
@@ -39,110 +68,365 @@ def start_mint_callback(sender: Any, app_data: Any, user_data: Logger) -> None:
     @param sender    Sender of the callback
     @param app_data  Data from the callback
     @param user_data User data from the callback"""
-    logger_mint = user_data
-    logger_mint.all_info_log('Mint! Mint! Mint!')
-
-    # Get accounts
-    for account in helpers.get_shuffled_accounts():
-        if account['mint'] == True:
-            try:
-                bridge_status = mint_logic(account, helpers.get_settings(), logger_mint)
-            except Exception as e:
-                logger_mint.error_log(account['address'], e)
-                break
-
-            if bridge_status == True:
-                turn_off_account_mint(account.name)
-                logger_mint.info_log(account['address'], f'Account mint turned off.')
-            else:
-                logger_mint.error_log(account['address'], f'Bridge failed. Work at the address has stopped.')
-
-    logger_mint.all_info_log('All wallets minted.')
+    start_mint(user_data)
+
+def start_mint(logger: Logger, workers: Optional[int] = None) -> bool:
+    """ Run mint for all eligible accounts.
+
+    @param logger  Logger object for push messages in logger window or terminal
+    @param workers Most accounts at once, the mint_workers setting if None
+
+    @return True if the run finished, False if it stopped on an error
+    """
+
+    logger.all_info_log('Mint! Mint! Mint!')
+
+    settings = helpers.get_settings()
+    if workers is not None:
+        settings = settings.with_values({'mint_workers': workers})
+    set_endpoint_limit(settings.get('rpc_max_in_flight'))
+    set_client_limits(settings.get('connections_per_client'), settings.get('client_idle_timeout'))
+    set_read_batch(settings.get('rpc_batch_size'), settings.get('rpc_batch_window_ms'))
+    set_broadcast(settings.get('broadcast_transactions'))
+
+    # Get accounts, streamed to the jobs unless the sale has yet to start
+    accounts = get_account_store().get_eligible_accounts('mint', shuffled=True)
+    try:
+        run_with_clients(run_mint(accounts, settings, logger))
+    except Exception as e:
+        logger.all_error_log(f'Mint stopped: {e}')
+        return False
+
+    logger.all_info_log('All wallets minted.')
+    return True
+
+async def run_mint(accounts: Iterable[Any], settings: Any, logger: Logger) -> None:
+    """ Run mint for accounts on the running event loop.
+
+    @param accounts Rows from CSV with account data
+    @param settings Global settings provided from UI
+    @param logger   Logger object for push messages in logger window
+    """
+
+    try:
+        target = await get_mint_target(settings['nft_url'], helpers.get_async_web3(helpers.get_zora_rpc_for_mint()))
+    except ValueError as e:
+        logger.all_error_log(str(e))
+        return
+    log_mint_target(target, logger)
+    if target.is_sold_out():
+        # Every mint would revert
+        logger.all_error_log('NFT is sold out.')
+        return
+    if not check_sale(target, settings, logger):
+        return
+
+    eth_rpc, zora_rpc = helpers.get_eth_rpc_for_mint(), helpers.get_zora_rpc_for_mint()
+    snapshot = Snapshot(None, None, {})
+    check_batch = lambda batch: skip_minted_accounts(batch, target, logger)
+
+    if target.sale is not None and target.sale.is_configured() and not target.sale.has_started():
+        # Pre-checks of every account run before the wait, so the sale opens with nothing left but sending
+        accounts = await prepare_batch(list(accounts), eth_rpc, zora_rpc, logger, snapshot, check_batch)
+        await wait_for_sale_start(target, logger)
+    else:
+        # Each batch of accounts is checked just before its jobs start
+        accounts = stream_snapshots(accounts, eth_rpc, zora_rpc, logger, snapshot, check_batch)
+
+    await run_accounts(
+        accounts,
+        lambda account: mint_account(account, settings, logger, snapshot, target),
+        get_workers(settings, 'mint_workers'),
+        logger
+    )
+
+def log_mint_target(target: MintTarget, logger: Logger) -> None:
+    """ Log what is known about the NFT before the accounts start.
+
+    @param target Mint target of the campaign
+    @param logger Logger object for push messages in logger window
+    """
+
+    logger.all_info_log(f'NFT contract {target.nft_address}, token {target.token_id}.')
+    if target.total_minted is not None:
+        logger.all_info_log(f'Minted {target.total_minted} of {target.max_supply or "unlimited"}.')
+    if target.mint_fee is not None:
+        logger.all_info_log(f'Zora mint fee: {format(Web3.from_wei(target.mint_fee, "ether"), "f")} ETH.')
+    if target.sale is not None and target.sale.is_configured():
+        logger.all_info_log(f'Sale price: {format(Web3.from_wei(target.sale.price_per_token, "ether"), "f")} ETH, limit per address: {target.sale.max_per_address or "unlimited"}.')
+
+def check_sale(target: MintTarget, settings: Any, logger: Logger) -> bool:
+    """ Check the sale config of the NFT before the accounts are prepared.
+
+    Without a readable sale config the mint goes on with the price from settings.
+
+    @param target   Mint target of the campaign
+    @param settings Global settings provided from UI
+    @param logger   Logger object for push messages in logger window
+
+    @return True if accounts can mint, False if the sale is over or missing
+    """
+
+    sale = target.sale
+    if sale is None:
+        logger.all_error_log(f'Sale config not received. Mint price from settings is used.')
+        return True
+    if not sale.is_configured():
+        # Every mint would revert
+        logger.all_error_log('NFT has no sale on the fixed price strategy.')
+        return False
+    if sale.has_ended():
+        logger.all_error_log('Sale has ended.')
+        return False
+
+    value = target.get_mint_value(sale, Web3.to_wei(settings['mint_price'], 'ether'))
+    if value != Web3.to_wei(settings['mint_price'], 'ether'):
+        logger.all_info_log(f'Mint price in settings differs from the contract. {format(Web3.from_wei(value, "ether"), "f")} ETH is used.')
+    return True
+
+async def wait_for_sale_start(target: MintTarget, logger: Logger) -> None:
+    """ Wait for the sale of the NFT to start.
+
+    @param target Mint target of the campaign
+    @param logger Logger object for push messages in logger window
+    """
+
+    sale = target.sale
+    if sale is None or not sale.is_configured() or sale.has_started():
+        return
+
+    logger.all_info_log(f'Sale starts in {int(sale.sale_start - time.time())} seconds. Waiting.')
+    await asyncio.sleep(sale.sale_start - time.time())
+
+async def skip_minted_accounts(accounts: list[Any], target: MintTarget, logger: Logger) -> list[Any]:
+    """ Leave out accounts that already hold the NFT, and turn their mint off.
+
+    Balances are read with chunked balanceOfBatch calls. If the check fails,
+    all accounts are kept.
+
+    @param accounts Rows from CSV with account data
+    @param target   Mint target of the campaign
+    @param logger   Logger object for push messages in logger window
+
+    @return Accounts that still have to mint
+    """
+
+    if not accounts:
+        return accounts
+
+    nft_address, nft_id = target.nft_address, target.token_id
+    w3_zora = helpers.get_async_web3(helpers.get_zora_rpc_for_mint())
+
+    # Rows with a bad address are kept, their own job fails without stopping the others
+    checked_accounts, addresses, eligible_accounts = [], [], []
+    for account in accounts:
+        try:
+            addresses.append(Web3.to_checksum_address(account['address']))
+            checked_accounts.append(account)
+        except Exception:
+            logger.error_log(str(account['address']), f'Invalid address. Minted NFT check skipped.')
+            eligible_accounts.append(account)
+
+    async def balance_of_batch(chunk: list[str]) -> list[int]:
+        data = BALANCE_OF_BATCH_SELECTOR + w3_zora.codec.encode(['address[]', 'uint256[]'], [chunk, [nft_id] * len(chunk)])
+        return_data = await w3_zora.eth.call({'to': nft_address, 'data': Web3.to_hex(data)})
+        return list(w3_zora.codec.decode(['uint256[]'], return_data)[0])
+
+    try:
+        chunks = await asyncio.gather(*(
+            balance_of_batch(addresses[start:start + BALANCE_OF_BATCH_CHUNK_SIZE])
+            for start in range(0, len(addresses), BALANCE_OF_BATCH_CHUNK_SIZE)
+        ))
+    except Exception as e:
+        logger.all_error_log(f'Minted NFT check failed: {e}')
+        return accounts
+
+    balances = [balance for chunk in chunks for balance in chunk]
+
+    for account, balance in zip(checked_accounts, balances):
+        if balance > 0:
+            turn_off_account_mint(account.name, account['address'])
+            logger.info_log(account['address'], f'NFT already minted. Account mint turned off.')
+        else:
+            eligible_accounts.append(account)
+
+    return eligible_accounts
+
+async def mint_account(
+    account: Any,
+    settings: Any,
+    logger: Logger,
+    snapshot: Optional[Snapshot] = None,
+    target: Optional[MintTarget] = None
+) -> bool:
+    """ Mint job for a single account.
+
+    @param account  Row from CSV with account data
+    @param settings Global settings provided from UI
+    @param logger   Logger object for push messages in logger window
+    @param snapshot Pre-flight snapshot of accounts
+    @param target   Mint target of the campaign
+
+    @return Boolean value denoting the status of the mint logic
+    """
+
+    mint_status = await async_mint_logic(account, settings, logger, snapshot, target)
+
+    if mint_status == True:
+        turn_off_account_mint(account.name, account['address'])
+        logger.info_log(account['address'], f'Account mint turned off.')
+    else:
+        logger.error_log(account['address'], f'Mint failed. Work at the address has stopped.')
+
+    return mint_status
 
 def mint_logic(
     account: Any, 
     settings: Any, 
-    logger: Logger
+    logger: Logger,
+    snapshot: Optional[Snapshot] = None
+)->bool:
+    """ Main mint logic method, runs async_mint_logic on its own event loop.
+    
+    @param account  Row from CSV with account data
+    @param settings Global settings provided from UI
+    @param logger   Logger object for push messages in logger window
+    @param snapshot Pre-flight snapshot of accounts
+
+    @return Boolean value denoting the status of the mint logic
+    """
+
+    return run_with_clients(async_mint_logic(account, settings, logger, snapshot))
+
+async def async_mint_logic(
+    account: Any, 
+    settings: Any, 
+    logger: Logger,
+    snapshot: Optional[Snapshot] = None,
+    target: Optional[MintTarget] = None
 )->bool:
     """ Main mint logic method.
     
     @param account  Row from CSV with account data
     @param settings Global settings provided from UI
     @param logger   Logger object for push messages in logger window
+    @param snapshot Pre-flight snapshot of accounts, balance and nonce are read from it if present
+    @param target   Mint target of the campaign, resolved from settings if None
 
     @return Boolean value denoting the status of the mint logic
     """
 
     # Web3 provider
-    if isinstance(account['proxy'], str) and account['proxy'] != '':
-        w3_zora = Web3(Web3.HTTPProvider(helpers.get_zora_rpc_for_mint(), request_kwargs={'proxies':{'https': 'http://' + account['proxy'], 'http': 'http://' + account['proxy']}}))
-        w3_eth = Web3(Web3.HTTPProvider(helpers.get_eth_rpc_for_mint(), request_kwargs={'proxies':{'https': 'http://' + account['proxy'], 'http': 'http://' + account['proxy']}}))
-    else:
-        w3_zora = Web3(Web3.HTTPProvider(helpers.get_zora_rpc_for_mint()))
-        w3_eth = Web3(Web3.HTTPProvider(helpers.get_eth_rpc_for_mint()))
+    w3_zora = helpers.get_async_web3(helpers.get_zora_rpc_for_mint(), account['proxy'])
 
     # Check balance
-    balance_zora = w3_zora.eth.get_balance(Web3.to_checksum_address(account['address']))
+    address = Web3.to_checksum_address(account['address'])
+    state = snapshot.get(address) if snapshot is not None else None
+
+    if state is not None and state.zora_balance is not None:
+        balance_zora = state.zora_balance
+    else:
+        balance_zora = await w3_zora.eth.get_balance(address)
+    known_nonce = state.zora_nonce if state is not None else None
     logger.info_log(account['address'], f'Balance on Zora: {w3_zora.from_wei(balance_zora, "ether")} ETH.')
 
     # Get NFT info from url
-    ## Check if NFT is for sale on Zora Network
-    match = re.search(r'(zora|eth):([^/]+)', settings['nft_url'])
-    if match:
-        if match.group(1) == 'eth':
-            logger.error_log(account['address'], f'NFT not found on Zora Network. It is for sale on Ethereum Network.')
+    if target is None:
+        try:
+            target = await get_mint_target(settings['nft_url'], w3_zora)
+        except ValueError as e:
+            logger.error_log(account['address'], str(e))
             return False
-    
-    ## Get NFT address and id
-    match = re.search(r'0x[^/]+', settings['nft_url'])
-    if match:
-        nft_address = Web3.to_checksum_address(match.group(0))
-    else:
-        logger.error_log(account['address'], f'NFT contract not found in url.')
-        return False
+    nft_address = target.nft_address
 
-    nft_id = settings['nft_url'].rsplit('/', 1)[-1]
-    if nft_id.isdigit() == False:
-        logger.error_log(account['address'], f'NFT id not found in url.')
+    # Shared between accounts through the RPC cache for a few blocks
+    sale = await get_sale_config(w3_zora, target)
+    if sale is not None and sale.is_configured() and sale.has_ended():
+        logger.error_log(account['address'], f'Sale has ended.')
         return False
+    value = target.get_mint_value(sale, Web3.to_wei(settings['mint_price'], 'ether'))
 
-    fee = helpers.calculate_zora_fee_in_wei(Web3.to_wei(settings['mint_price'], 'ether'), settings['gas_price_for_mint'], settings['gas_for_mint'], w3_eth, settings['is_testnet_mint'])
+    mint_count = get_mint_count(settings, sale)
+    fee = helpers.calculate_zora_fee_in_wei(value, settings['gas_price_for_mint'], settings['gas_for_mint'], await get_gas_oracle(helpers.get_eth_rpc_for_mint()).get_gas_price(), settings['is_testnet_mint'])
 
     logger.info_log(account['address'], f'NFT price with network fee: {format(w3_zora.from_wei(fee, "ether"), "f")} ETH.')
 
-    ## Check if balance is enough
-    while True:
-        balance_zora = w3_zora.eth.get_balance(Web3.to_checksum_address(account['address']))
-        if balance_zora >= fee:
-            break
-        logger.info_log(account['address'], f'Balance on Zora to low. Waiting for bridge confirmation on Zora Network. Re-verify after 30 seconds.')
-        time.sleep(30)
+    ## Check if balance is enough for all mints
+    nonce_manager = get_nonce_manager(helpers.get_zora_rpc_for_mint())
+    if balance_zora < fee * mint_count:
+        logger.info_log(account['address'], f'Balance on Zora to low. Waiting for bridge confirmation on Zora Network.')
+        async with ConnectionWarmer([(helpers.get_zora_rpc_for_mint(), account['proxy'])]):
+            balance_zora = await get_balance_watcher(helpers.get_zora_rpc_for_mint()).wait_for_balance(address, fee * mint_count)
+        # A bridge deposit is sent from the account itself, so it moves the Zora nonce too
+        nonce_manager.forget(address)
+        known_nonce = None
+        logger.info_log(account['address'], f'Balance on Zora: {w3_zora.from_wei(balance_zora, "ether")} ETH.')
 
     # Mint NFT
-    nft_contract = w3_zora.eth.contract(address=nft_address, abi=nft_1155_abi)
-    tx_raw = nft_contract.functions.mint(
-        Web3.to_checksum_address(helpers.get_minter_address()),
-        int(nft_id),
-        1,
-        Web3.to_hex(b'\x00' * 12 + Web3.to_bytes(hexstr=account['address']))
-    ).build_transaction({
-        'from': Web3.to_checksum_address(account['address']),
-        'value': Web3.to_wei(settings['mint_price'], 'ether'),
-        'gas': int(settings['gas_for_mint']),
-        'gasPrice': w3_zora.to_wei(settings['gas_price_for_mint'], 'gwei'),
-        'nonce': w3_zora.eth.get_transaction_count(Web3.to_checksum_address(account['address']))
-    })
-
-    logger.info_log(account['address'], f'Sending a transaction for minting.')
-
     account_web3 = w3_zora.eth.account.from_key(account['private_key'])
-    signed_transaction = account_web3.sign_transaction(tx_raw)
-    transaction_hash = w3_zora.eth.send_raw_transaction(signed_transaction.rawTransaction)
-    transaction_data = w3_zora.eth.wait_for_transaction_receipt(transaction_hash, timeout=600)
+    calldata = target.calldata.for_recipient(address)
+    chain_id = await w3_zora.eth.chain_id
+    transaction_hashes = []
 
-    if transaction_data.get('status') != None and transaction_data.get('status') == 1:
-        logger.info_log(account['address'], f'Transaction hash on Zora Network: {transaction_hash.hex()}')
-        return True
-    else:
-        logger.error_log(account['address'], f'Transaction failed on Zora Network.')
-        return False
+    ## Send all mints back to back, with nonces handed out locally
+    for _ in range(mint_count):
+        nonce = await nonce_manager.get_nonce(w3_zora, address, known_nonce)
+
+        try:
+            tx_raw = build_mint_transaction(
+                nft_address,
+                calldata,
+                value,
+                int(settings['gas_for_mint']),
+                w3_zora.to_wei(settings['gas_price_for_mint'], 'gwei'),
+                nonce,
+                chain_id
+            )
+
+            logger.info_log(account['address'], f'Sending a transaction for minting.')
+
+            signed_transaction = account_web3.sign_transaction(tx_raw)
+            transaction_hashes.append(await w3_zora.eth.send_raw_transaction(signed_transaction.rawTransaction))
+        except Exception:
+            # The transaction was not sent
+            await nonce_manager.reconcile(w3_zora, address)
+            raise
+
+    try:
+        receipt_tracker = get_receipt_tracker(helpers.get_zora_rpc_for_mint())
+        transactions_data = await asyncio.gather(*(
+            receipt_tracker.wait_for_receipt(transaction_hash, timeout=600)
+            for transaction_hash in transaction_hashes
+        ))
+    except Exception:
+        # A transaction was dropped or replaced
+        await nonce_manager.reconcile(w3_zora, address)
+        raise
+
+    mint_status = True
+    for transaction_hash, transaction_data in zip(transaction_hashes, transactions_data):
+        if transaction_data.get('status') != None and transaction_data.get('status') == 1:
+            logger.info_log(account['address'], f'Transaction hash on Zora Network: {transaction_hash.hex()}')
+        else:
+            logger.error_log(account['address'], f'Transaction failed on Zora Network.')
+            mint_status = False
+
+    return mint_status
+
+def get_mint_count(settings: Any, sale: Optional[SaleConfig] = None) -> int:
+    """ Get number of mints per account from settings.
+
+    @param settings Global settings provided from UI
+    @param sale     Sale config of the NFT, its limit per address caps the count
+
+    @return Number of mints, at least 1
+    """
+
+    try:
+        mint_count = max(1, int(settings.get('mints_per_account', 1)))
+    except (TypeError, ValueError):
+        mint_count = 1
+    if sale is not None and sale.max_per_address > 0:
+        # Mints over the limit revert
+        mint_count = min(mint_count, sale.max_per_address)
+    return mint_count
@@ -0,0 +1,207 @@
+"""! @brief Defines the mint target."""
+##
+# @file mint_target.py
+#
+# @brief Defines the mint target.
+#
+# @section description_mint_target Description
+# Defines the mint target, which resolves the NFT url of a campaign once
+# into the contract address, token id and calldata template, and reads the
+# mint fee, token info and sale config of the fixed price strategy in one
+# Multicall3 call, so every account starts from ready-made data. The sale
+# config is read again by accounts through the RPC cache, which keeps it
+# for a few blocks and shares it between accounts.
+#
+# @section libraries_mint_target Libraries/Modules
+# - access to Any, NamedTuple and Optional types
+# - standart time library (https://docs.python.org/3/library/time.html)
+# - access to web3
+# - access to helpers
+# - access to multicall methods
+# - access to mint calldata templates
+#
+# @section author_mint_target Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, NamedTuple, Optional
+import time
+from web3 import AsyncWeb3, Web3
+import helpers
+import multicall
+from mint_calldata import MintCalldata, get_mint_calldata
+
+# Global constants
+## Selector of mintFee().
+MINT_FEE_SELECTOR = Web3.keccak(text='mintFee()')[:4]
+## Selector of getTokenInfo(uint256).
+GET_TOKEN_INFO_SELECTOR = Web3.keccak(text='getTokenInfo(uint256)')[:4]
+## Selector of uri(uint256).
+URI_SELECTOR = Web3.keccak(text='uri(uint256)')[:4]
+## Selector of sale(address,uint256) of the fixed price strategy.
+SALE_SELECTOR = Web3.keccak(text='sale(address,uint256)')[:4]
+## ABI type of the sale config returned by the fixed price strategy.
+SALE_CONFIG_TYPE = '(uint64,uint64,uint64,uint96,address)'
+
+## Contract address and token id by NFT url.
+resolved_urls: dict[str, tuple[str, int]] = {}
+
+class SaleConfig(NamedTuple):
+    """ Sale of one token on the fixed price strategy."""
+
+    sale_start: int
+    sale_end: int
+    max_per_address: int
+    price_per_token: int
+    funds_recipient: str
+
+    def is_configured(self) -> bool:
+        # A token without a sale on the strategy reads as all zeros
+        return self.sale_end != 0
+
+    def has_started(self, timestamp: Optional[float] = None) -> bool:
+        return (time.time() if timestamp is None else timestamp) >= self.sale_start
+
+    def has_ended(self, timestamp: Optional[float] = None) -> bool:
+        return (time.time() if timestamp is None else timestamp) >= self.sale_end
+
+class MintTarget(NamedTuple):
+    """ NFT of a campaign, on-chain values are None if they could not be read."""
+
+    nft_url: str
+    nft_address: str
+    token_id: int
+    calldata: MintCalldata
+    mint_fee: Optional[int]
+    max_supply: Optional[int]
+    total_minted: Optional[int]
+    uri: Optional[str]
+    sale: Optional[SaleConfig]
+
+    def get_mint_value(self, sale: Optional[SaleConfig], fallback: int) -> int:
+        """ Get the value to send with one mint.
+
+        @param sale     Current sale config, the one read with the target if None
+        @param fallback Mint price from settings in wei, used without on-chain data
+
+        @return Price per token and mint fee in wei
+        """
+
+        sale = sale if sale is not None else self.sale
+        if sale is None or not sale.is_configured() or self.mint_fee is None:
+            return fallback
+        return sale.price_per_token + self.mint_fee
+
+    def is_sold_out(self) -> bool:
+        # Max supply 0 is an open edition
+        return bool(self.max_supply) and self.total_minted is not None and self.total_minted >= self.max_supply
+
+# Functions
+def resolve_nft_url(nft_url: str) -> tuple[str, int]:
+    """ Get NFT contract address and token id from url, parsed once per url.
+
+    @param nft_url URL of the NFT on zora.co
+
+    @return Checksum address of the NFT contract and token id
+
+    @exception ValueError The url is not a Zora Network 1155 NFT url
+    """
+
+    if nft_url not in resolved_urls:
+        resolved_urls[nft_url] = helpers.parse_nft_url(nft_url)
+    return resolved_urls[nft_url]
+
+async def get_mint_target(nft_url: str, w3: AsyncWeb3) -> MintTarget:
+    """ Resolve the NFT of a campaign and read its on-chain data.
+
+    If the read fails, the target is still returned without on-chain data.
+
+    @param nft_url URL of the NFT on zora.co
+    @param w3      Async Web3 provider of Zora Network
+
+    @return Mint target
+
+    @exception ValueError The url is not a Zora Network 1155 NFT url
+    """
+
+    nft_address, token_id = resolve_nft_url(nft_url)
+    token_word = token_id.to_bytes(32, 'big')
+
+    try:
+        fee_result, info_result, uri_result, sale_result = await multicall.aggregate(w3, [
+            (nft_address, MINT_FEE_SELECTOR),
+            (nft_address, GET_TOKEN_INFO_SELECTOR + token_word),
+            (nft_address, URI_SELECTOR + token_word),
+            (Web3.to_checksum_address(helpers.get_price_stategy_address()), get_sale_calldata(nft_address, token_id))
+        ])
+    except Exception:
+        fee_result = info_result = uri_result = sale_result = (False, b'')
+
+    mint_fee = decode_result(w3, 'uint256', fee_result)
+    _, max_supply, total_minted = decode_result(w3, '(string,uint256,uint256)', info_result) or (None, None, None)
+    uri = decode_result(w3, 'string', uri_result)
+    sale = decode_result(w3, SALE_CONFIG_TYPE, sale_result)
+
+    return MintTarget(
+        nft_url=      nft_url,
+        nft_address=  nft_address,
+        token_id=     token_id,
+        calldata=     get_mint_calldata(helpers.get_minter_address(), token_id),
+        mint_fee=     mint_fee,
+        max_supply=   max_supply,
+        total_minted= total_minted,
+        uri=          uri,
+        sale=         SaleConfig(*sale) if sale is not None else None
+    )
+
+async def get_sale_config(w3: AsyncWeb3, target: MintTarget) -> Optional[SaleConfig]:
+    """ Read the current sale config of the target from the fixed price strategy.
+
+    Accounts share the result through the RPC cache for a few blocks.
+
+    @param w3     Async Web3 provider of Zora Network
+    @param target Mint target of the campaign
+
+    @return Sale config, or the one read with the target if the read fails
+    """
+
+    try:
+        return_data = await w3.eth.call({
+            'to':   Web3.to_checksum_address(helpers.get_price_stategy_address()),
+            'data': Web3.to_hex(get_sale_calldata(target.nft_address, target.token_id))
+        })
+    except Exception:
+        return target.sale
+
+    sale = decode_result(w3, SALE_CONFIG_TYPE, (True, return_data))
+    return SaleConfig(*sale) if sale is not None else target.sale
+
+def get_sale_calldata(nft_address: str, token_id: int) -> bytes:
+    """ Get the calldata of sale(tokenContract, tokenId).
+
+    @param nft_address Checksum address of the NFT contract
+    @param token_id    Id of the token
+
+    @return Calldata
+    """
+
+    return SALE_SELECTOR + b'\x00' * 12 + Web3.to_bytes(hexstr=nft_address) + token_id.to_bytes(32, 'big')
+
+def decode_result(w3: AsyncWeb3, value_type: str, result: tuple[bool, bytes]) -> Any:
+    """ Decode the return data of one multicall call.
+
+    @param w3         Async Web3 provider
+    @param value_type ABI type of the returned value
+    @param result     Success and return data of the call
+
+    @return Decoded value, or None if the call failed or returned something else
+    """
+
+    success, return_data = result
+    if not success:
+        return None
+    try:
+        return w3.codec.decode([value_type], return_data)[0]
+    except Exception:
+        # Not a 1155 contract of the expected version
+        return None
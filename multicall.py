@@ -0,0 +1,94 @@
+"""! @brief Defines the Multicall3 methods."""
+##
+# @file multicall.py
+#
+# @brief Defines the Multicall3 methods.
+#
+# @section description_multicall Description
+# Defines methods that pack many read calls into a few Multicall3
+# aggregate3 calls, so data for all accounts is read in one round-trip.
+#
+# @section libraries_multicall Libraries/Modules
+# - access to Iterable and Union types
+# - access to web3
+# - access to helpers
+#
+# @section author_multicall Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Iterable, Union
+from web3 import AsyncWeb3, Web3
+from web3.types import BlockIdentifier
+import helpers
+
+# Global constants
+## Calls packed into one aggregate3 call.
+MULTICALL_CHUNK_SIZE = 500
+## Selector of aggregate3((address,bool,bytes)[]).
+AGGREGATE3_SELECTOR = Web3.keccak(text='aggregate3((address,bool,bytes)[])')[:4]
+## Selector of getEthBalance(address).
+GET_ETH_BALANCE_SELECTOR = Web3.keccak(text='getEthBalance(address)')[:4]
+
+# Functions
+async def aggregate(
+    w3: AsyncWeb3,
+    calls: list[tuple[str, Union[bytes, str]]],
+    block_identifier: BlockIdentifier = 'latest'
+) -> list[tuple[bool, bytes]]:
+    """ Run read calls through Multicall3 aggregate3, chunked.
+
+    Calldata is encoded with the codec directly, since the contract
+    machinery of web3 is slow on thousands of tuples.
+
+    @param w3               Async Web3 provider
+    @param calls            List of (target address, calldata)
+    @param block_identifier Block to read the state at
+
+    @return List of (success, return data) in the order of calls
+    """
+
+    multicall_address = Web3.to_checksum_address(helpers.get_multicall_address())
+    results = []
+
+    for start in range(0, len(calls), MULTICALL_CHUNK_SIZE):
+        chunk = [
+            (target, True, Web3.to_bytes(hexstr=calldata) if isinstance(calldata, str) else calldata)
+            for target, calldata in calls[start:start + MULTICALL_CHUNK_SIZE]
+        ]
+        return_data = await w3.eth.call({
+            'to':   multicall_address,
+            'data': Web3.to_hex(AGGREGATE3_SELECTOR + w3.codec.encode(['(address,bool,bytes)[]'], [chunk]))
+        }, block_identifier)
+        results.extend(w3.codec.decode(['(bool,bytes)[]'], return_data)[0])
+
+    return results
+
+async def get_eth_balances(
+    w3: AsyncWeb3,
+    addresses: Iterable[str],
+    block_identifier: BlockIdentifier = 'latest'
+) -> dict[str, int]:
+    """ Get ETH balances of many addresses with Multicall3 getEthBalance.
+
+    @param w3               Async Web3 provider
+    @param addresses        Addresses of accounts
+    @param block_identifier Block to read the balances at
+
+    @return Balance in wei by checksum address, failed calls are left out
+    """
+
+    multicall_address = helpers.get_multicall_address()
+    addresses = [Web3.to_checksum_address(address) for address in addresses]
+
+    # Calldata is the selector and the address padded to 32 bytes
+    calls = [
+        (multicall_address, GET_ETH_BALANCE_SELECTOR + b'\x00' * 12 + Web3.to_bytes(hexstr=address))
+        for address in addresses
+    ]
+
+    balances = {}
+    for address, (success, return_data) in zip(addresses, await aggregate(w3, calls, block_identifier)):
+        if success:
+            balances[address] = int.from_bytes(return_data, 'big')
+    return balances
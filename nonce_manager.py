@@ -0,0 +1,87 @@
+"""! @brief Defines the local nonce manager."""
+##
+# @file nonce_manager.py
+#
+# @brief Defines the local nonce manager.
+#
+# @section description_nonce_manager Description
+# Defines the nonce manager, which reads the pending nonce of an account
+# once and then hands out nonces locally, so an account can send several
+# transactions back to back without waiting for receipts.
+#
+# @section libraries_nonce_manager Libraries/Modules
+# - access to Optional type
+# - access to web3
+#
+# @section author_nonce_manager Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Optional
+from web3 import AsyncWeb3, Web3
+
+# Global constants
+## Nonce managers by RPC endpoint.
+nonce_managers: dict[str, 'NonceManager'] = {}
+
+class NonceManager:
+    """ Next nonces of accounts on one network."""
+
+    def __init__(self):
+        """ Create nonce manager."""
+
+        self.next_nonces: dict[str, int] = {}
+
+    async def get_nonce(self, w3: AsyncWeb3, address: str, known: Optional[int] = None) -> int:
+        """ Hand out the next nonce of an account.
+
+        @param w3      Async Web3 provider of the network
+        @param address Address of account
+        @param known   Nonce already read elsewhere (e.g. pre-flight snapshot), the higher one wins
+
+        @return Nonce for the next transaction
+        """
+
+        address = Web3.to_checksum_address(address)
+
+        if known is not None:
+            self.next_nonces[address] = max(known, self.next_nonces.get(address, known))
+        elif address not in self.next_nonces:
+            nonce = await w3.eth.get_transaction_count(address, 'pending')
+            # Another transaction of the account may have read it meanwhile
+            self.next_nonces.setdefault(address, nonce)
+
+        nonce = self.next_nonces[address]
+        self.next_nonces[address] = nonce + 1
+        return nonce
+
+    async def reconcile(self, w3: AsyncWeb3, address: str) -> None:
+        """ Re-read the pending nonce after a transaction was not sent, dropped or replaced.
+
+        @param w3      Async Web3 provider of the network
+        @param address Address of account
+        """
+
+        address = Web3.to_checksum_address(address)
+        self.next_nonces[address] = await w3.eth.get_transaction_count(address, 'pending')
+
+    def forget(self, address: str) -> None:
+        """ Forget the nonce of an account, e.g. after a transaction sent from elsewhere.
+
+        @param address Address of account
+        """
+
+        self.next_nonces.pop(Web3.to_checksum_address(address), None)
+
+# Functions
+def get_nonce_manager(rpc: str) -> NonceManager:
+    """ Get the nonce manager shared by every account using an endpoint.
+
+    @param rpc URL of the RPC endpoint
+
+    @return Nonce manager for the endpoint
+    """
+
+    if rpc not in nonce_managers:
+        nonce_managers[rpc] = NonceManager()
+    return nonce_managers[rpc]
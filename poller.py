@@ -0,0 +1,107 @@
+"""! @brief Defines the background poller base class."""
+##
+# @file poller.py
+#
+# @brief Defines the background poller base class.
+#
+# @section description_poller Description
+# Defines the poller base class for services shared by all accounts, which
+# poll an RPC endpoint in a background task of the running event loop while
+# someone is waiting on them, and stop when they become idle. Failed polls
+# are logged, and after several in a row the waiting accounts fail with the
+# error instead of waiting forever.
+#
+# @section libraries_poller Libraries/Modules
+# - access to Optional type
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - standart logging library (https://docs.python.org/3/library/logging.html)
+#
+# @section author_poller Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Optional
+import asyncio
+import logging
+
+# Global constants
+## Failed polls in a row after which the waiting accounts fail.
+MAX_POLL_FAILURES = 5
+
+## Logger of failed polls.
+poll_logger = logging.getLogger(__name__)
+
+class PollError(Exception):
+    """ Polling failed too many times in a row."""
+
+class Poller:
+    """ The background poller base class."""
+
+    def __init__(self, interval: float):
+        """ Create poller.
+
+        @param interval Seconds between two polls
+        """
+
+        self.interval = interval
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def ensure_running(self) -> None:
+        """ Start polling in the running event loop, unless it is already polling."""
+
+        loop = asyncio.get_running_loop()
+        if self.loop is loop and self.task is not None and not self.task.done():
+            return
+
+        self.loop = loop
+        self.reset()
+        self.task = loop.create_task(self.run())
+
+    async def run(self) -> None:
+        """ Poll every interval until the poller is idle.
+
+        A failed poll is logged and retried on the next interval. After
+        MAX_POLL_FAILURES in a row, everyone waiting gets the error.
+        """
+
+        failures = 0
+        while True:
+            try:
+                await self.poll()
+                failures = 0
+            except Exception as e:
+                failures += 1
+                poll_logger.warning(f'{type(self).__name__} poll failed ({failures} in a row): {e!r}')
+                if failures >= MAX_POLL_FAILURES:
+                    failures = 0
+                    error = PollError(f'{type(self).__name__} failed {MAX_POLL_FAILURES} polls in a row: {e}')
+                    error.__cause__ = e
+                    await self.fail(error)
+
+            if self.is_idle():
+                return
+
+            await asyncio.sleep(self.interval)
+
+    def reset(self) -> None:
+        """ Reset the state bound to the previous event loop before polling starts."""
+
+    async def fail(self, error: Exception) -> None:
+        """ Fail everyone waiting on the poller.
+
+        @param error Error passed to the waiters
+        """
+
+    async def poll(self) -> None:
+        """ Poll the endpoint once."""
+
+        raise NotImplementedError
+
+    def is_idle(self) -> bool:
+        """ Check whether nobody is waiting on the poller any more.
+
+        @return True if polling can stop
+        """
+
+        raise NotImplementedError
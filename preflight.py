@@ -0,0 +1,227 @@
+"""! @brief Defines the pre-flight snapshot."""
+##
+# @file preflight.py
+#
+# @brief Defines the pre-flight snapshot.
+#
+# @section description_preflight Description
+# Defines the pre-flight stage, which reads balances and nonces of all
+# accounts on Ethereum and Zora in a few Multicall3 and JSON-RPC batch
+# round-trips before any work starts, so the per-account logic does not
+# read them again. A streamed run reads them batch by batch, just ahead of
+# the jobs of each batch.
+#
+# @section libraries_preflight Libraries/Modules
+# - access to Any, AsyncIterator, Awaitable, Callable, Iterable, NamedTuple and Optional types
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - access to web3
+# - access to helpers
+# - access to multicall methods
+# - access to JSON-RPC batch methods
+# - access to Logger type
+#
+# @section author_preflight Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, NamedTuple, Optional
+import asyncio
+from web3 import Web3
+from Logger import Logger
+import helpers
+import multicall
+import rpc_batch
+
+# Global constants
+## Accounts read in one snapshot of a streamed run.
+SNAPSHOT_BATCH_SIZE = 500
+
+class AccountState(NamedTuple):
+    """ Balances and nonces of one account, None if they could not be read."""
+
+    eth_balance: Optional[int]
+    zora_balance: Optional[int]
+    eth_nonce: Optional[int]
+    zora_nonce: Optional[int]
+
+class Snapshot:
+    """ Balances and nonces of all accounts, read at one block of each network."""
+
+    def __init__(self, eth_block: Optional[int], zora_block: Optional[int], accounts: dict[str, AccountState]):
+        """ Create snapshot.
+
+        @param eth_block  Ethereum block the snapshot was read at, the latest batch of a streamed run
+        @param zora_block Zora block the snapshot was read at, the latest batch of a streamed run
+        @param accounts   Account state by checksum address
+        """
+
+        self.eth_block = eth_block
+        self.zora_block = zora_block
+        self.accounts = accounts
+
+    def get(self, address: str) -> Optional[AccountState]:
+        """ Get state of an account.
+
+        @param address Address of account
+
+        @return Account state, or None if the account is not in the snapshot
+        """
+
+        try:
+            return self.accounts.get(Web3.to_checksum_address(address))
+        except Exception:
+            # Left out of the snapshot, the account reads its state itself
+            return None
+
+    def add(self, snapshot: 'Snapshot') -> None:
+        """ Add the accounts of a snapshot of another batch.
+
+        @param snapshot Snapshot of other accounts
+        """
+
+        self.eth_block = snapshot.eth_block
+        self.zora_block = snapshot.zora_block
+        self.accounts.update(snapshot.accounts)
+
+# Functions
+async def read_network(rpc: str, addresses: list[str]) -> tuple[int, dict[str, int], list[Optional[int]]]:
+    """ Read balances and nonces of accounts on one network at its latest block.
+
+    @param rpc       URL of the RPC endpoint
+    @param addresses Checksum addresses of accounts
+
+    @return Block number, balances by address and nonces in the order of addresses
+    """
+
+    w3 = helpers.get_async_web3(rpc)
+    block = await w3.eth.block_number
+
+    balances, nonces = await asyncio.gather(
+        multicall.get_eth_balances(w3, addresses, block),
+        rpc_batch.batch_request(rpc, [('eth_getTransactionCount', [address, hex(block)]) for address in addresses])
+    )
+
+    return block, balances, [int(nonce, 16) if nonce is not None else None for nonce in nonces]
+
+async def take_snapshot(addresses: Iterable[str], eth_rpc: str, zora_rpc: str) -> Snapshot:
+    """ Read balances and nonces of accounts on Ethereum and Zora.
+
+    @param addresses Addresses of accounts
+    @param eth_rpc   URL of the Ethereum RPC endpoint
+    @param zora_rpc  URL of the Zora RPC endpoint
+
+    @return Snapshot of all accounts
+    """
+
+    addresses = [Web3.to_checksum_address(address) for address in addresses]
+
+    (eth_block, eth_balances, eth_nonces), (zora_block, zora_balances, zora_nonces) = await asyncio.gather(
+        read_network(eth_rpc, addresses),
+        read_network(zora_rpc, addresses)
+    )
+
+    accounts = {
+        address: AccountState(
+            eth_balance=  eth_balances.get(address),
+            zora_balance= zora_balances.get(address),
+            eth_nonce=    eth_nonce,
+            zora_nonce=   zora_nonce
+        )
+        for address, eth_nonce, zora_nonce in zip(addresses, eth_nonces, zora_nonces)
+    }
+
+    return Snapshot(eth_block, zora_block, accounts)
+
+async def prepare_snapshot(accounts: list[Any], eth_rpc: str, zora_rpc: str, logger: Logger) -> Optional[Snapshot]:
+    """ Take snapshot of accounts before a run.
+
+    A failed snapshot is logged, and accounts then read their state themselves.
+    Accounts with an invalid address are logged and left out.
+
+    @param accounts Rows from CSV with account data
+    @param eth_rpc  URL of the Ethereum RPC endpoint
+    @param zora_rpc URL of the Zora RPC endpoint
+    @param logger   Logger object for push messages in logger window
+
+    @return Snapshot of all accounts, or None if it failed
+    """
+
+    # One bad row must not fail the snapshot of every account
+    addresses = []
+    for account in accounts:
+        try:
+            addresses.append(Web3.to_checksum_address(account['address']))
+        except Exception:
+            logger.error_log(str(account['address']), f'Invalid address. Account left out of the pre-flight snapshot.')
+    if not addresses:
+        return None
+
+    try:
+        snapshot = await take_snapshot(addresses, eth_rpc, zora_rpc)
+    except Exception as e:
+        logger.all_error_log(f'Pre-flight snapshot failed: {e}')
+        return None
+
+    logger.all_info_log(f'Pre-flight snapshot of {len(addresses)} accounts at block {snapshot.eth_block} on Ethereum and {snapshot.zora_block} on Zora.')
+    return snapshot
+
+async def stream_snapshots(
+    accounts: Iterable[Any],
+    eth_rpc: str,
+    zora_rpc: str,
+    logger: Logger,
+    snapshot: Snapshot,
+    check_batch: Optional[Callable[[list[Any]], Awaitable[list[Any]]]] = None
+) -> AsyncIterator[Any]:
+    """ Stream accounts, adding every batch to the snapshot before its accounts are yielded.
+
+    Only one batch of a streamed account set is read ahead of the jobs.
+
+    @param accounts    Rows from CSV with account data
+    @param eth_rpc     URL of the Ethereum RPC endpoint
+    @param zora_rpc    URL of the Zora RPC endpoint
+    @param logger      Logger object for push messages in logger window
+    @param snapshot    Snapshot the batches are added to
+    @param check_batch Coroutine function leaving out accounts of a batch before its snapshot
+
+    @return Async iterator over the accounts
+    """
+
+    batch = []
+    for account in accounts:
+        batch.append(account)
+        if len(batch) == SNAPSHOT_BATCH_SIZE:
+            for account in await prepare_batch(batch, eth_rpc, zora_rpc, logger, snapshot, check_batch):
+                yield account
+            batch = []
+
+    for account in await prepare_batch(batch, eth_rpc, zora_rpc, logger, snapshot, check_batch):
+        yield account
+
+async def prepare_batch(
+    batch: list[Any],
+    eth_rpc: str,
+    zora_rpc: str,
+    logger: Logger,
+    snapshot: Snapshot,
+    check_batch: Optional[Callable[[list[Any]], Awaitable[list[Any]]]] = None
+) -> list[Any]:
+    """ Check a batch of accounts and add its snapshot.
+
+    @param batch       Rows from CSV with account data
+    @param eth_rpc     URL of the Ethereum RPC endpoint
+    @param zora_rpc    URL of the Zora RPC endpoint
+    @param logger      Logger object for push messages in logger window
+    @param snapshot    Snapshot the batch is added to
+    @param check_batch Coroutine function leaving out accounts of the batch
+
+    @return Accounts of the batch that go on to their jobs
+    """
+
+    if check_batch is not None and batch:
+        batch = await check_batch(batch)
+
+    batch_snapshot = await prepare_snapshot(batch, eth_rpc, zora_rpc, logger)
+    if batch_snapshot is not None:
+        snapshot.add(batch_snapshot)
+    return batch
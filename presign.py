@@ -0,0 +1,286 @@
+"""! @brief Defines the pre-signed mint methods."""
+##
+# @file presign.py
+#
+# @brief Defines the pre-signed mint methods.
+#
+# @section description_presign Description
+# Defines the prepare and fire modes for competitive drops. Prepare builds
+# and signs the mint transactions of every account ahead of the sale, with
+# signing spread over a process pool, and keeps them in a local store. Fire
+# broadcasts all of them in a burst at a block, at a time, or right away.
+#
+# @section libraries_presign Libraries/Modules
+# - access to Any and Optional types
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - standart concurrent.futures library (https://docs.python.org/3/library/concurrent.futures.html)
+# - standart json library (https://docs.python.org/3/library/json.html)
+# - standart os library (https://docs.python.org/3/library/os.html)
+# - standart time library (https://docs.python.org/3/library/time.html)
+# - access to eth_account (installed with web3)
+# - access to web3
+# - access to Logger type
+# - access to helpers
+# - access to accounts module
+# - access to account store
+# - access to mint calldata templates
+# - access to mint target
+# - access to JSON-RPC batch methods
+# - access to shared receipt tracker
+# - access to RPC client pool
+# - access to multi-endpoint RPC router
+# - access to mint logic
+#
+# @section author_presign Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, Optional
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import time
+from eth_account import Account
+from web3 import Web3
+from Logger import Logger
+import helpers
+from accounts import turn_off_account_mint
+from account_store import get_account_store
+from mint_calldata import build_mint_transaction
+from mint_target import get_mint_target
+import rpc_batch
+from receipt_tracker import get_receipt_tracker
+from client_pool import run_with_clients
+from rpc_router import set_broadcast
+from mint_logic import get_mint_count
+
+# Global constants
+## File with the pre-signed transactions.
+PRESIGNED_FILE = 'presigned.json'
+## Transactions signed by one process pool task.
+SIGN_CHUNK_SIZE = 200
+## Seconds between two block number requests while waiting to fire.
+FIRE_POLL_INTERVAL = 0.5
+
+# GUI callbacks
+def prepare_mint_callback(sender: Any, app_data: Any, user_data: Logger) -> None:
+    """ Prepare mint callback.
+
+    @param sender    Sender of the callback
+    @param app_data  Data from the callback
+    @param user_data User data from the callback
+    """
+
+    logger_mint = user_data
+    settings = helpers.get_settings()
+
+    accounts = list(get_account_store().get_eligible_accounts('mint'))
+    try:
+        count = run_with_clients(prepare_mint(accounts, settings, logger_mint))
+    except Exception as e:
+        logger_mint.all_error_log(f'Prepare failed: {e}')
+        return
+
+    logger_mint.all_info_log(f'{count} mint transactions signed and saved. Ready to fire.')
+
+def fire_mint_callback(sender: Any, app_data: Any, user_data: Logger) -> None:
+    """ Fire mint callback.
+
+    @param sender    Sender of the callback
+    @param app_data  Data from the callback
+    @param user_data User data from the callback
+    """
+
+    logger_mint = user_data
+    settings = helpers.get_settings()
+    set_broadcast(settings.get('broadcast_transactions'))
+
+    try:
+        run_with_clients(fire_mint(
+            logger_mint,
+            at_block=     get_optional_int(settings, 'fire_at_block'),
+            at_timestamp= get_optional_int(settings, 'fire_at_timestamp')
+        ))
+    except Exception as e:
+        logger_mint.all_error_log(f'Fire failed: {e}')
+        return
+
+    logger_mint.all_info_log('All pre-signed mints fired.')
+
+# Functions
+def get_optional_int(settings: Any, key: str) -> Optional[int]:
+    """ Get optional integer setting.
+
+    @param settings Global settings provided from UI
+    @param key      Name of the setting
+
+    @return Value of the setting, or None if it is empty or 0
+    """
+
+    try:
+        value = int(float(settings.get(key, 0)))
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+def sign_transactions(transactions: list[tuple[dict[str, Any], str]]) -> list[tuple[str, str]]:
+    """ Sign transactions, run in a worker process.
+
+    @param transactions List of (transaction, private key)
+
+    @return List of (raw transaction, transaction hash) as hex
+    """
+
+    signed = []
+    for transaction, private_key in transactions:
+        signed_transaction = Account.sign_transaction(transaction, private_key)
+        signed.append((Web3.to_hex(signed_transaction.rawTransaction), Web3.to_hex(signed_transaction.hash)))
+    return signed
+
+async def prepare_mint(accounts: list[Any], settings: Any, logger: Logger) -> int:
+    """ Build and sign the mint transactions of accounts and save them.
+
+    @param accounts Rows from CSV with account data
+    @param settings Global settings provided from UI
+    @param logger   Logger object for push messages in logger window
+
+    @return Number of signed transactions
+    """
+
+    rpc = helpers.get_zora_rpc_for_mint()
+    w3_zora = helpers.get_async_web3(rpc)
+    target = await get_mint_target(settings['nft_url'], w3_zora)
+    nft_address = target.nft_address
+
+    chain_id = await w3_zora.eth.chain_id
+    addresses = [Web3.to_checksum_address(account['address']) for account in accounts]
+    nonces = await rpc_batch.batch_request(rpc, [('eth_getTransactionCount', [address, 'pending']) for address in addresses])
+
+    logger.all_info_log(f'Building mint transactions for {len(accounts)} accounts.')
+
+    # Price and limit per address of the sale, known before it starts
+    mint_count = get_mint_count(settings, target.sale)
+    value = target.get_mint_value(target.sale, Web3.to_wei(settings['mint_price'], 'ether'))
+    gas = int(settings['gas_for_mint'])
+    gas_price = Web3.to_wei(settings['gas_price_for_mint'], 'gwei')
+
+    transactions = []
+    entries = []
+    for account, address, nonce in zip(accounts, addresses, nonces):
+        if nonce is None:
+            logger.error_log(account['address'], f'Nonce not received. Account skipped.')
+            continue
+
+        calldata = target.calldata.for_recipient(address)
+
+        for index in range(mint_count):
+            transactions.append((
+                build_mint_transaction(nft_address, calldata, value, gas, gas_price, int(nonce, 16) + index, chain_id),
+                account['private_key']
+            ))
+            entries.append({'account': int(account.name), 'address': address, 'nonce': int(nonce, 16) + index})
+
+    # Sign in worker processes
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor() as pool:
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(pool, sign_transactions, transactions[start:start + SIGN_CHUNK_SIZE])
+            for start in range(0, len(transactions), SIGN_CHUNK_SIZE)
+        ))
+
+    signed = [transaction for chunk in chunks for transaction in chunk]
+    for entry, (raw_transaction, transaction_hash) in zip(entries, signed):
+        entry['raw'] = raw_transaction
+        entry['hash'] = transaction_hash
+
+    save_presigned({
+        'nft_url':      settings['nft_url'],
+        'chain_id':     chain_id,
+        'rpc':          rpc,
+        'created':      int(time.time()),
+        'transactions': entries
+    })
+
+    return len(entries)
+
+async def fire_mint(logger: Logger, at_block: Optional[int] = None, at_timestamp: Optional[int] = None) -> None:
+    """ Broadcast the pre-signed mint transactions in a burst.
+
+    @param logger       Logger object for push messages in logger window
+    @param at_block     Fire once the chain reaches this block
+    @param at_timestamp Fire at this unix time
+    """
+
+    presigned = load_presigned()
+    rpc = presigned['rpc']
+    transactions = presigned['transactions']
+
+    # Also registers the endpoints of the network from settings
+    if helpers.get_zora_rpc_for_mint() != rpc:
+        logger.all_info_log('Network in settings changed since prepare. Firing through the prepared endpoint only.')
+
+    if at_timestamp is not None and at_timestamp > time.time():
+        logger.all_info_log(f'Waiting to fire {len(transactions)} mints at {time.ctime(at_timestamp)}.')
+        await asyncio.sleep(at_timestamp - time.time())
+
+    if at_block is not None:
+        logger.all_info_log(f'Waiting to fire {len(transactions)} mints at block {at_block}.')
+        w3_zora = helpers.get_async_web3(rpc)
+        while await w3_zora.eth.block_number < at_block:
+            await asyncio.sleep(FIRE_POLL_INTERVAL)
+
+    # Burst: all raw transactions go out in a few batch requests
+    logger.all_info_log(f'Firing {len(transactions)} mints.')
+    sent = await rpc_batch.batch_request(rpc, [('eth_sendRawTransaction', [transaction['raw']]) for transaction in transactions])
+
+    # Rejected transactions are not waited for
+    receipt_tracker = get_receipt_tracker(rpc)
+    results = await asyncio.gather(*(
+        receipt_tracker.wait_for_receipt(transaction['hash'], timeout=600) if transaction_hash is not None else asyncio.sleep(0)
+        for transaction, transaction_hash in zip(transactions, sent)
+    ), return_exceptions=True)
+
+    minted_accounts = set()
+    failed_accounts = set()
+    for transaction, result in zip(transactions, results):
+        if isinstance(result, dict) and result.get('status') == 1:
+            logger.info_log(transaction['address'], f'Transaction hash on Zora Network: {transaction["hash"]}')
+            minted_accounts.add((transaction['account'], transaction['address']))
+        else:
+            logger.error_log(transaction['address'], f'Pre-signed mint with nonce {transaction["nonce"]} failed on Zora Network.')
+            failed_accounts.add((transaction['account'], transaction['address']))
+
+    for account, address in minted_accounts - failed_accounts:
+        turn_off_account_mint(account, address)
+
+    remove_presigned()
+
+def save_presigned(presigned: dict[str, Any]) -> None:
+    """ Save pre-signed transactions to the local store.
+
+    @param presigned Pre-signed transactions with their campaign data
+    """
+
+    path = helpers.resource_path(PRESIGNED_FILE)
+    with open(path + '.tmp', 'w') as file:
+        json.dump(presigned, file)
+    os.replace(path + '.tmp', path)
+
+def load_presigned() -> dict[str, Any]:
+    """ Load pre-signed transactions from the local store.
+
+    @return Pre-signed transactions with their campaign data
+
+    @exception FileNotFoundError Nothing was prepared
+    """
+
+    with open(helpers.resource_path(PRESIGNED_FILE)) as file:
+        return json.load(file)
+
+def remove_presigned() -> None:
+    """ Remove the fired transactions from the local store."""
+
+    path = helpers.resource_path(PRESIGNED_FILE)
+    if os.path.exists(path):
+        os.remove(path)
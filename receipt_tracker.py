@@ -0,0 +1,212 @@
+"""! @brief Defines the shared receipt tracker."""
+##
+# @file receipt_tracker.py
+#
+# @brief Defines the shared receipt tracker.
+#
+# @section description_receipt_tracker Description
+# Defines the receipt tracker, which watches new blocks of a network once,
+# fetches their receipts in bulk and resolves a future for every tracked
+# transaction, so confirmation costs the same per block however many
+# transactions are outstanding.
+#
+# @section libraries_receipt_tracker Libraries/Modules
+# - access to Any and Optional types
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - access to HexBytes type
+# - access to web3
+# - access to helpers
+# - access to JSON-RPC batch methods
+# - access to Poller base class
+#
+# @section author_receipt_tracker Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, Optional
+import asyncio
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import TimeExhausted
+import helpers
+import rpc_batch
+from poller import Poller
+
+# Global constants
+## Seconds between two block number requests.
+BLOCK_POLL_INTERVAL = 2
+## Most blocks whose receipts are fetched in one poll.
+MAX_BLOCKS_PER_POLL = 20
+## Receipt fields that are quantities.
+RECEIPT_QUANTITIES = ('blockNumber', 'cumulativeGasUsed', 'effectiveGasPrice', 'gasUsed', 'status', 'transactionIndex', 'type')
+## JSON-RPC error code of a method the endpoint does not have.
+METHOD_NOT_FOUND_CODE = -32601
+## Error messages of a method the endpoint does not have.
+METHOD_NOT_FOUND_ERRORS = ('method not found', 'does not exist/is not available', 'not supported', 'unsupported method')
+
+## Receipt trackers by RPC endpoint.
+receipt_trackers: dict[str, 'ReceiptTracker'] = {}
+
+class ReceiptTracker(Poller):
+    """ Receipts of transactions sent to one network."""
+
+    def __init__(self, rpc: str, interval: float = BLOCK_POLL_INTERVAL):
+        """ Create receipt tracker.
+
+        @param rpc      URL of the RPC endpoint
+        @param interval Seconds between two block number requests
+        """
+
+        super().__init__(interval)
+        self.rpc = rpc
+        self.tracked: dict[str, asyncio.Future] = {}
+        self.waiters: dict[str, int] = {}
+        self.unchecked: set[str] = set()
+        self.last_block: Optional[int] = None
+        self.block_receipts_supported = True
+
+    async def wait_for_receipt(self, transaction_hash: Any, timeout: float = 600) -> dict[str, Any]:
+        """ Wait for the receipt of a transaction.
+
+        @param transaction_hash Hash of the transaction
+        @param timeout          Seconds to wait for the receipt
+
+        @return Transaction receipt
+
+        @exception TimeExhausted The transaction is not in a block after timeout
+        """
+
+        transaction_hash = Web3.to_hex(HexBytes(transaction_hash))
+        if transaction_hash not in self.tracked:
+            self.tracked[transaction_hash] = asyncio.get_running_loop().create_future()
+            # Check it directly once, it may be mined before the next block is polled
+            self.unchecked.add(transaction_hash)
+        self.waiters[transaction_hash] = self.waiters.get(transaction_hash, 0) + 1
+
+        try:
+            self.ensure_running()
+            return await asyncio.wait_for(asyncio.shield(self.tracked[transaction_hash]), timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(f'Transaction {transaction_hash} is not in the chain after {timeout} seconds')
+        finally:
+            self.waiters[transaction_hash] -= 1
+            if self.waiters[transaction_hash] == 0:
+                del self.waiters[transaction_hash]
+                del self.tracked[transaction_hash]
+                self.unchecked.discard(transaction_hash)
+
+    def reset(self) -> None:
+        self.last_block = None
+        self.unchecked = set(self.tracked)
+        self.w3 = helpers.get_async_web3(self.rpc)
+
+    async def poll(self) -> None:
+        if not self.tracked:
+            return
+
+        block = await self.w3.eth.block_number
+
+        if self.last_block is None or block - self.last_block > MAX_BLOCKS_PER_POLL:
+            # Receipts of the skipped blocks are not fetched, check every tracked transaction directly
+            self.unchecked.update(self.tracked)
+            self.last_block = block - 1
+
+        # Transactions that were never checked, or whose check failed
+        if self.unchecked:
+            unchecked = list(self.unchecked)
+            failed = await self.fetch_transaction_receipts(unchecked)
+            self.unchecked.difference_update(set(unchecked) - failed)
+
+        if block == self.last_block:
+            return
+
+        fetched_block = block
+        if self.block_receipts_supported:
+            blocks = list(range(self.last_block + 1, block + 1))
+            responses = await rpc_batch.batch_responses(self.rpc, [('eth_getBlockReceipts', [hex(number)]) for number in blocks])
+            for number, response in zip(blocks, responses):
+                if is_method_not_found(response.get('error')):
+                    # The endpoint has no eth_getBlockReceipts, ask for tracked receipts instead
+                    self.block_receipts_supported = False
+                    break
+                if response.get('result') is None:
+                    # A lagging endpoint or a failed request, the block is fetched again next poll
+                    fetched_block = number - 1
+                    break
+                for receipt in response['result']:
+                    self.resolve(receipt)
+
+        if not self.block_receipts_supported:
+            # Every tracked transaction is checked on every poll, nothing to retry
+            await self.fetch_transaction_receipts(list(self.tracked))
+
+        self.last_block = fetched_block
+
+    async def fetch_transaction_receipts(self, transaction_hashes: list[str]) -> set[str]:
+        """ Fetch receipts of transactions in one batch.
+
+        @param transaction_hashes Hashes of the transactions
+
+        @return Hashes of the transactions whose receipt request failed
+        """
+
+        responses = await rpc_batch.batch_responses(self.rpc, [('eth_getTransactionReceipt', [transaction_hash]) for transaction_hash in transaction_hashes])
+        failed = set()
+        for transaction_hash, response in zip(transaction_hashes, responses):
+            if 'result' not in response:
+                failed.add(transaction_hash)
+            elif response['result'] is not None:
+                self.resolve(response['result'])
+        return failed
+
+    def resolve(self, receipt: dict[str, Any]) -> None:
+        """ Resolve the future of a tracked transaction with its receipt.
+
+        @param receipt Raw receipt from the endpoint
+        """
+
+        future = self.tracked.get(str(receipt.get('transactionHash')).lower())
+        if future is None or future.done():
+            return
+
+        receipt = dict(receipt)
+        for field in RECEIPT_QUANTITIES:
+            if isinstance(receipt.get(field), str):
+                receipt[field] = int(receipt[field], 16)
+        future.set_result(receipt)
+
+    async def fail(self, error: Exception) -> None:
+        for future in self.tracked.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def is_idle(self) -> bool:
+        return not self.tracked
+
+# Functions
+def is_method_not_found(error: Any) -> bool:
+    """ Check whether an error means the endpoint does not have the method.
+
+    @param error JSON-RPC error
+
+    @return True if the method is not available on the endpoint
+    """
+
+    if error is None:
+        return False
+    if isinstance(error, dict) and error.get('code') == METHOD_NOT_FOUND_CODE:
+        return True
+    message = str(error.get('message', '') if isinstance(error, dict) else error).lower()
+    return any(text in message for text in METHOD_NOT_FOUND_ERRORS)
+
+def get_receipt_tracker(rpc: str) -> ReceiptTracker:
+    """ Get the receipt tracker shared by every account using an endpoint.
+
+    @param rpc URL of the RPC endpoint
+
+    @return Receipt tracker for the endpoint
+    """
+
+    if rpc not in receipt_trackers:
+        receipt_trackers[rpc] = ReceiptTracker(rpc)
+    return receipt_trackers[rpc]
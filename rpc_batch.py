@@ -0,0 +1,133 @@
+"""! @brief Defines the JSON-RPC batch methods."""
+##
+# @file rpc_batch.py
+#
+# @brief Defines the JSON-RPC batch methods.
+#
+# @section description_rpc_batch Description
+# Defines methods that send many JSON-RPC requests as batch arrays, so
+# reads for all accounts take a few HTTP round-trips. Batches of signed
+# transactions are broadcast to every endpoint of the network. Transient
+# failures of a batch are retried through the endpoint circuit breakers.
+#
+# @section libraries_rpc_batch Libraries/Modules
+# - access to Any type
+# - access to HexBytes type
+# - access to web3
+# - access to RPC client pool
+# - access to endpoint health
+# - access to per-endpoint RPC limits
+# - access to multi-endpoint RPC router
+#
+# @section author_rpc_batch Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any
+from hexbytes import HexBytes
+from web3 import Web3
+from client_pool import get_session
+from endpoint_health import call_endpoint, is_rejected, is_retryable, with_retries
+from rpc_limits import get_endpoint_semaphore
+from rpc_router import BROADCAST_METHOD, get_broadcast_router, get_router, is_already_known, is_read
+
+# Global constants
+## Requests sent in one batch array.
+BATCH_SIZE = 100
+
+# Functions
+async def batch_request(
+    rpc: str,
+    requests: list[tuple[str, list[Any]]],
+    proxy: Any = None
+) -> list[Any]:
+    """ Send JSON-RPC requests as batch arrays.
+
+    @param rpc      URL of the RPC endpoint
+    @param requests List of (method, params)
+    @param proxy    Proxy from account (like login:password@ip:port)
+
+    @return Results in the order of requests, None for failed requests
+    """
+
+    responses = await batch_responses(rpc, requests, proxy)
+    return [response.get('result') for response in responses]
+
+async def batch_responses(
+    rpc: str,
+    requests: list[tuple[str, list[Any]]],
+    proxy: Any = None
+) -> list[dict[str, Any]]:
+    """ Send JSON-RPC requests as batch arrays and keep their errors.
+
+    @param rpc      URL of the RPC endpoint
+    @param requests List of (method, params)
+    @param proxy    Proxy from account (like login:password@ip:port)
+
+    @return Responses in the order of requests, an empty dict for a missing response
+    """
+
+    results = []
+    router = get_router(rpc)
+
+    for start in range(0, len(requests), BATCH_SIZE):
+        chunk = requests[start:start + BATCH_SIZE]
+        payload = [
+            {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+            for request_id, (method, params) in enumerate(chunk)
+        ]
+
+        methods = [method for method, _ in chunk]
+        # A write is sent again only if it surely never reached the node
+        retryable = is_retryable if is_read(methods) else is_rejected
+        broadcast = all(method == BROADCAST_METHOD for method in methods)
+        broadcast_router = get_broadcast_router(rpc) if broadcast else None
+        if broadcast_router is not None:
+            body = merge_broadcast(await with_retries(lambda: broadcast_router.broadcast_all(lambda endpoint: post_batch(endpoint, payload, proxy)), retryable=retryable), chunk)
+        elif router is None:
+            body = await with_retries(lambda: call_endpoint(rpc, lambda: post_batch(rpc, payload, proxy)), retryable=retryable)
+        else:
+            body = await with_retries(lambda: router.request(lambda endpoint: post_batch(endpoint, payload, proxy), hedge=is_read(methods)), retryable=retryable)
+        if broadcast and broadcast_router is None:
+            # The node may already have a transaction from an earlier run or attempt
+            body = merge_broadcast([body], chunk)
+
+        # Responses of a batch may come in any order
+        responses = {item.get('id'): item for item in body} if isinstance(body, list) else {}
+        results.extend(responses.get(request_id, {}) for request_id in range(len(chunk)))
+
+    return results
+
+async def post_batch(rpc: str, payload: list[dict[str, Any]], proxy: Any = None) -> Any:
+    """ Post one batch array to an endpoint.
+
+    @param rpc     URL of the RPC endpoint
+    @param payload JSON-RPC requests of the batch
+    @param proxy   Proxy from account (like login:password@ip:port)
+
+    @return Decoded response body
+    """
+
+    session, proxy_url = get_session(rpc, proxy)
+    async with get_endpoint_semaphore(rpc):
+        async with session.post(rpc, json=payload, proxy=proxy_url) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+def merge_broadcast(bodies: list[Any], chunk: list[tuple[str, list[Any]]]) -> list[dict[str, Any]]:
+    """ Merge the responses of every endpoint to a broadcast batch of signed transactions.
+
+    @param bodies Response bodies of the endpoints that answered
+    @param chunk  List of (method, params) of the batch
+
+    @return Response of the batch, a transaction is sent if any endpoint accepted or already knew it
+    """
+
+    merged = []
+    for request_id, (_, params) in enumerate(chunk):
+        items = [item for body in bodies if isinstance(body, list) for item in body if item.get('id') == request_id]
+        accepted = next((item for item in items if 'result' in item), None)
+        if accepted is None and any(is_already_known(item.get('error')) for item in items):
+            accepted = {'id': request_id, 'result': Web3.to_hex(Web3.keccak(HexBytes(params[0])))}
+        merged.append(accepted if accepted is not None else {'id': request_id})
+    return merged
@@ -0,0 +1,216 @@
+"""! @brief Defines the read-through RPC cache."""
+##
+# @file rpc_cache.py
+#
+# @brief Defines the read-through RPC cache.
+#
+# @section description_rpc_cache Description
+# Defines an async web3 middleware with a cache shared by every client of a
+# network. Data that never changes (chain id, contract code, blocks by hash,
+# receipts deep enough in the chain) is cached for the whole run, and slow
+# changing values (gas price, sale config) for a few blocks.
+# Identical reads in flight at the same time share one request.
+#
+# @section libraries_rpc_cache Libraries/Modules
+# - access to Any, Callable and Optional types
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - standart copy library (https://docs.python.org/3/library/copy.html)
+# - standart json library (https://docs.python.org/3/library/json.html)
+# - standart time library (https://docs.python.org/3/library/time.html)
+# - standart weakref library (https://docs.python.org/3/library/weakref.html)
+# - access to web3
+# - access to multi-endpoint RPC router
+#
+# @section author_rpc_cache Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, Callable, Optional
+import asyncio
+import copy
+import json
+import time
+import weakref
+from web3 import Web3
+from rpc_router import is_read
+
+# Global constants
+## Methods whose result never changes.
+IMMUTABLE_METHODS = ('eth_chainId', 'net_version', 'eth_getBlockByHash')
+## Blocks a result of a slow changing method stays cached, by method.
+BLOCK_TTL_METHODS = {'eth_gasPrice': 1, 'eth_maxPriorityFeePerGas': 1}
+## Blocks an eth_call result stays cached, by selector of the called function.
+CALL_TTL_BLOCKS = {Web3.to_hex(Web3.keccak(text='sale(address,uint256)')[:4]): 5}
+## Blocks a receipt has to be behind the head to be cached.
+RECEIPT_CONFIRMATIONS = 12
+## Seconds the known head block is trusted before it is read again.
+HEAD_MAX_AGE = 2
+
+## Caches of every network, per event loop.
+rpc_caches: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+class RpcCache:
+    """ Cached responses and reads in flight of one network."""
+
+    def __init__(self):
+        """ Create RPC cache."""
+
+        self.responses: dict[str, tuple[Optional[int], dict[str, Any]]] = {}
+        self.in_flight: dict[str, asyncio.Future] = {}
+        self.head: Optional[int] = None
+        self.head_time = 0.0
+
+    async def request(self, make_request: Callable, method: str, params: Any) -> Any:
+        """ Send a request, answering reads from the cache when possible.
+
+        @param make_request Next request handler
+        @param method       JSON-RPC method
+        @param params       Params of the request
+
+        @return Response
+        """
+
+        if not is_read([method]):
+            return await make_request(method, params)
+
+        key = get_key(method, params)
+        cached = self.responses.get(key)
+        if cached is not None:
+            head = await self.get_head(make_request) if cached[0] is not None else None
+            if cached[0] is None or (head is not None and head < cached[0]):
+                return copy.deepcopy(cached[1])
+            self.responses.pop(key, None)
+
+        response = await self.share(key, lambda: make_request(method, params))
+
+        if method == 'eth_blockNumber' and 'result' in response:
+            self.set_head(int(response['result'], 16))
+        elif 'result' in response and response['result'] is not None:
+            await self.store(make_request, key, method, get_ttl(method, params), response)
+        return copy.deepcopy(response)
+
+    async def share(self, key: str, send: Callable) -> Any:
+        """ Send a read, or wait for the identical one already in flight.
+
+        @param key  Key of the read
+        @param send Coroutine function sending the read
+
+        @return Response
+        """
+
+        future = self.in_flight.get(key)
+        if future is None:
+            future = self.in_flight[key] = asyncio.ensure_future(send())
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        # One waiter giving up does not cancel the read for the others
+        return await asyncio.shield(future)
+
+    async def store(self, make_request: Callable, key: str, method: str, ttl: Optional[int], response: dict[str, Any]) -> None:
+        """ Cache a response if it is safe to reuse.
+
+        @param make_request Next request handler
+        @param key          Key of the read
+        @param method       JSON-RPC method
+        @param ttl          Blocks the response stays cached, None if it never changes
+        @param response     Response with a result
+        """
+
+        if method in IMMUTABLE_METHODS:
+            self.responses[key] = (None, response)
+        elif method == 'eth_getCode':
+            # An empty account may still get a contract
+            if response['result'] not in ('0x', '0x0'):
+                self.responses[key] = (None, response)
+        elif method == 'eth_getTransactionReceipt':
+            # Receipts near the head can still move with a reorg
+            block_number = response['result'].get('blockNumber')
+            head = await self.get_head(make_request) if block_number is not None else None
+            if head is not None and int(block_number, 16) + RECEIPT_CONFIRMATIONS <= head:
+                self.responses[key] = (None, response)
+        elif ttl is not None:
+            head = await self.get_head(make_request)
+            if head is not None:
+                self.responses[key] = (head + ttl, response)
+
+    async def get_head(self, make_request: Callable) -> Optional[int]:
+        """ Get the head block of the network, read again when it is older than HEAD_MAX_AGE.
+
+        @param make_request Next request handler
+
+        @return Block number, or None if it could not be read
+        """
+
+        if self.head is None or time.monotonic() - self.head_time > HEAD_MAX_AGE:
+            try:
+                response = await self.share(get_key('eth_blockNumber', []), lambda: make_request('eth_blockNumber', []))
+                self.set_head(int(response['result'], 16))
+            except Exception:
+                # Nothing cached by block is served or stored until the head is known
+                return None
+        return self.head
+
+    def set_head(self, block: int) -> None:
+        """ Remember the head block of the network.
+
+        @param block Block number
+        """
+
+        self.head = block if self.head is None else max(self.head, block)
+        self.head_time = time.monotonic()
+
+# Functions
+def get_key(method: str, params: Any) -> str:
+    """ Get the cache key of a request.
+
+    @param method JSON-RPC method
+    @param params Params of the request
+
+    @return Key
+    """
+
+    return json.dumps([method, params], sort_keys=True, default=str)
+
+def get_ttl(method: str, params: Any) -> Optional[int]:
+    """ Get the blocks a slow changing result stays cached.
+
+    @param method JSON-RPC method
+    @param params Params of the request
+
+    @return Blocks, or None if the result is not cached by block
+    """
+
+    if method == 'eth_call':
+        transaction = params[0] if params and isinstance(params[0], dict) else {}
+        data = transaction.get('data') or transaction.get('input') or ''
+        selector = Web3.to_hex(data)[:10] if isinstance(data, (bytes, bytearray)) else str(data)[:10]
+        return CALL_TTL_BLOCKS.get(selector.lower())
+    return BLOCK_TTL_METHODS.get(method)
+
+def get_rpc_cache(rpc: str) -> RpcCache:
+    """ Get the cache of a network in the running event loop.
+
+    @param rpc URL of the primary endpoint of the network
+
+    @return RPC cache shared by every client of the network
+    """
+
+    caches = rpc_caches.setdefault(asyncio.get_running_loop(), {})
+    if rpc not in caches:
+        caches[rpc] = RpcCache()
+    return caches[rpc]
+
+async def rpc_cache_middleware(make_request: Callable, w3: Any) -> Callable:
+    """ Async web3 middleware that answers reads from the cache of the network.
+
+    @param make_request Next request handler
+    @param w3           Web3 instance the middleware is added to
+
+    @return Request handler
+    """
+
+    rpc = str(w3.provider.endpoint_uri)
+
+    async def middleware(method: str, params: Any) -> Any:
+        return await get_rpc_cache(rpc).request(make_request, method, params)
+
+    return middleware
@@ -0,0 +1,62 @@
+"""! @brief Defines the per-endpoint RPC limits."""
+##
+# @file rpc_limits.py
+#
+# @brief Defines the per-endpoint RPC limits.
+#
+# @section description_rpc_limits Description
+# Defines the semaphores that cap the number of HTTP requests in flight to
+# every RPC endpoint, shared by all accounts of the event loop. A batch of
+# reads takes one slot.
+#
+# @section libraries_rpc_limits Libraries/Modules
+# - access to Any type
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - standart weakref library (https://docs.python.org/3/library/weakref.html)
+#
+# @section author_rpc_limits Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any
+import asyncio
+import weakref
+
+# Global constants
+## Default number of requests in flight to one endpoint.
+DEFAULT_ENDPOINT_LIMIT = 8
+
+endpoint_limit = DEFAULT_ENDPOINT_LIMIT
+## Semaphores of every endpoint, per event loop.
+endpoint_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Functions
+def set_endpoint_limit(limit: Any) -> None:
+    """ Set the number of requests in flight allowed to one endpoint.
+
+    @param limit Requests in flight per endpoint, invalid values fall back to default
+    """
+
+    global endpoint_limit
+
+    try:
+        limit = max(1, int(limit))
+    except (TypeError, ValueError):
+        limit = DEFAULT_ENDPOINT_LIMIT
+
+    if limit != endpoint_limit:
+        endpoint_limit = limit
+        endpoint_semaphores.clear()
+
+def get_endpoint_semaphore(endpoint_uri: str) -> asyncio.Semaphore:
+    """ Get the semaphore guarding an endpoint in the running event loop.
+
+    @param endpoint_uri URL of the RPC endpoint
+
+    @return Semaphore shared by every client of this endpoint
+    """
+
+    semaphores = endpoint_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if endpoint_uri not in semaphores:
+        semaphores[endpoint_uri] = asyncio.Semaphore(endpoint_limit)
+    return semaphores[endpoint_uri]
@@ -0,0 +1,264 @@
+"""! @brief Defines the multi-endpoint RPC router."""
+##
+# @file rpc_router.py
+#
+# @brief Defines the multi-endpoint RPC router.
+#
+# @section description_rpc_router Description
+# Defines the RPC router, which spreads the requests of one network over
+# several endpoints. From the latency and error rate of every endpoint it
+# sends each request to the fastest healthy one, fails over to the next
+# one when a request fails, and sends a hedged duplicate of a read to the
+# second endpoint when the first one is slower than usual. Signed
+# transactions can be broadcast to every endpoint at once instead.
+#
+# @section libraries_rpc_router Libraries/Modules
+# - access to Any, Awaitable, Callable and Optional types
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - access to HexBytes type
+# - access to web3
+# - access to endpoint health
+#
+# @section author_rpc_router Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, Awaitable, Callable, Optional
+import asyncio
+from hexbytes import HexBytes
+from web3 import Web3
+from endpoint_health import call_endpoint, get_health
+
+# Global constants
+## Percentile of latency after which a read is hedged.
+HEDGE_PERCENTILE = 95
+## Seconds after which a read is hedged while an endpoint has too few samples.
+DEFAULT_HEDGE_DELAY = 1.0
+## Methods that change the chain, never hedged.
+WRITE_METHODS = ('eth_sendRawTransaction', 'eth_sendTransaction')
+## Method broadcast to every endpoint.
+BROADCAST_METHOD = 'eth_sendRawTransaction'
+## Error messages of nodes that already have the transaction.
+ALREADY_KNOWN_ERRORS = ('already known', 'known transaction', 'already imported', 'alreadyknown', 'already exists')
+
+broadcast_transactions = True
+
+## Routers by primary endpoint.
+routers: dict[str, 'RpcRouter'] = {}
+
+class RpcRouter:
+    """ Requests of one network spread over its endpoints."""
+
+    def __init__(self, endpoints: list[str]):
+        """ Create RPC router.
+
+        @param endpoints URLs of the endpoints of one network
+        """
+
+        self.endpoints = endpoints
+        self.broadcasts: set[asyncio.Task] = set()
+
+    def ranked(self) -> list[str]:
+        """ Get endpoints from the best to the worst.
+
+        @return Healthy endpoints by median latency, then unhealthy ones by error rate
+        """
+
+        healthy = [endpoint for endpoint in self.endpoints if get_health(endpoint).is_healthy()]
+        unhealthy = [endpoint for endpoint in self.endpoints if not get_health(endpoint).is_healthy()]
+        return sorted(healthy, key=lambda endpoint: get_health(endpoint).median()) + sorted(unhealthy, key=lambda endpoint: get_health(endpoint).error_rate)
+
+    def call(self, endpoint: str, send: Callable[[str], Awaitable[Any]]) -> Awaitable[Any]:
+        """ Send a request to an endpoint through its circuit breaker.
+
+        @param endpoint URL of the endpoint
+        @param send     Coroutine function sending the request to an endpoint URL
+
+        @return Awaitable response of the endpoint
+        """
+
+        return call_endpoint(endpoint, lambda: send(endpoint))
+
+    async def request(self, send: Callable[[str], Awaitable[Any]], hedge: bool = True) -> Any:
+        """ Send a request to the best endpoint, failing over to the next ones.
+
+        @param send  Coroutine function sending the request to an endpoint URL
+        @param hedge Whether a slow request is duplicated to the next endpoint
+
+        @return First response received
+
+        @exception Exception Error of the last endpoint if all of them failed
+        """
+
+        remaining = self.ranked()
+        pending: set[asyncio.Task] = set()
+        error: Optional[BaseException] = None
+
+        try:
+            while remaining or pending:
+                if not pending:
+                    endpoint = remaining.pop(0)
+                    pending.add(asyncio.ensure_future(self.call(endpoint, send)))
+                    hedge_delay = (get_health(endpoint).percentile(HEDGE_PERCENTILE) or DEFAULT_HEDGE_DELAY) if hedge and remaining else None
+                else:
+                    hedge_delay = None
+
+                done, pending = await asyncio.wait(pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+
+                if not done and remaining:
+                    # Slower than usual, race the next endpoint
+                    endpoint = remaining.pop(0)
+                    pending.add(asyncio.ensure_future(self.call(endpoint, send)))
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise error
+
+    async def broadcast(self, send: Callable[[str], Awaitable[Any]], accepted: Callable[[Any], bool]) -> Any:
+        """ Send a request to every endpoint at once.
+
+        Returns as soon as one endpoint accepts, the others still get it.
+
+        @param send     Coroutine function sending the request to an endpoint URL
+        @param accepted Check whether a response accepts the request
+
+        @return First accepted response, or the last response if none accepted
+
+        @exception Exception Error of the last endpoint if all of them failed
+        """
+
+        tasks = self.start_broadcast(send)
+        response: Any = None
+        error: Optional[BaseException] = None
+
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                response = await next_done
+            except Exception as e:
+                error = e
+                continue
+            if accepted(response):
+                return response
+
+        if response is None:
+            raise error
+        return response
+
+    async def broadcast_all(self, send: Callable[[str], Awaitable[Any]]) -> list[Any]:
+        """ Send a request to every endpoint at once and wait for all of them.
+
+        @param send Coroutine function sending the request to an endpoint URL
+
+        @return Responses of the endpoints that answered
+
+        @exception Exception Error of the last endpoint if all of them failed
+        """
+
+        results = await asyncio.gather(*self.start_broadcast(send), return_exceptions=True)
+        responses = [result for result in results if not isinstance(result, BaseException)]
+        if not responses:
+            raise results[-1]
+        return responses
+
+    def start_broadcast(self, send: Callable[[str], Awaitable[Any]]) -> list[asyncio.Task]:
+        """ Start sending a request to every endpoint.
+
+        @param send Coroutine function sending the request to an endpoint URL
+
+        @return Tasks of the endpoints, kept alive until they finish
+        """
+
+        tasks = [asyncio.ensure_future(self.call(endpoint, send)) for endpoint in self.endpoints]
+        for task in tasks:
+            self.broadcasts.add(task)
+            task.add_done_callback(self.broadcasts.discard)
+        return tasks
+
+# Functions
+def set_broadcast(enabled: Any) -> None:
+    """ Set whether signed transactions go to every endpoint of a network.
+
+    @param enabled Broadcast, or send to the best endpoint only
+    """
+
+    global broadcast_transactions
+    broadcast_transactions = bool(enabled)
+
+def get_broadcast_router(rpc: str) -> Optional[RpcRouter]:
+    """ Get the router to broadcast signed transactions of a network with.
+
+    @param rpc URL of the primary endpoint
+
+    @return Router, or None if transactions go to one endpoint
+    """
+
+    return routers.get(rpc) if broadcast_transactions else None
+
+def is_already_known(error: Any) -> bool:
+    """ Check whether a send error means the node already has the transaction.
+
+    @param error JSON-RPC error
+
+    @return True if the transaction is already known
+    """
+
+    if error is None:
+        return False
+    message = str(error.get('message', '') if isinstance(error, dict) else error).lower()
+    return any(text in message for text in ALREADY_KNOWN_ERRORS)
+
+def get_sent_response(response: dict[str, Any], params: Any) -> dict[str, Any]:
+    """ Turn an already known error of a sent transaction into its hash.
+
+    The node may have taken the transaction from an earlier attempt or another endpoint.
+
+    @param response Response to eth_sendRawTransaction
+    @param params   Params of the request, the raw transaction
+
+    @return Response with the transaction hash if the node already knew it
+    """
+
+    if not is_already_known(response.get('error')):
+        return response
+    return {'jsonrpc': '2.0', 'id': response.get('id'), 'result': Web3.to_hex(Web3.keccak(HexBytes(params[0])))}
+
+def register_endpoints(endpoints: list[str]) -> str:
+    """ Route the requests of a network over its endpoints.
+
+    @param endpoints URLs of the endpoints of one network, the first one is primary
+
+    @return URL of the primary endpoint, which stands for the whole network
+    """
+
+    primary = endpoints[0]
+    if len(endpoints) > 1 and (primary not in routers or routers[primary].endpoints != endpoints):
+        routers[primary] = RpcRouter(endpoints)
+    elif len(endpoints) == 1:
+        routers.pop(primary, None)
+    return primary
+
+def get_router(rpc: str) -> Optional[RpcRouter]:
+    """ Get the router of a network.
+
+    @param rpc URL of the primary endpoint
+
+    @return Router, or None if the network has a single endpoint
+    """
+
+    return routers.get(rpc)
+
+def is_read(methods: list[str]) -> bool:
+    """ Check whether requests only read the chain and may be hedged.
+
+    @param methods JSON-RPC methods of the requests
+
+    @return True if there is no write method
+    """
+
+    return not any(method in WRITE_METHODS for method in methods)
@@ -0,0 +1,191 @@
+"""! @brief Defines the account runner."""
+##
+# @file runner.py
+#
+# @brief Defines the account runner.
+#
+# @section description_runner Description
+# Runs a job for every account as a coroutine on a single event loop, with
+# a bounded number of accounts at once, so slow accounts do not hold up the
+# rest and a failed account stops only its own job. The number of accounts
+# at once adapts to the RPC endpoints: it grows by one while their p95
+# latency and error rate stay healthy, and is halved on rate limits, server
+# errors or timeouts, up to the workers setting.
+#
+# @section libraries_runner Libraries/Modules
+# - access to Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Optional and Union types
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - standart collections library (https://docs.python.org/3/library/collections.html)
+# - access to Logger type
+# - access to endpoint health
+#
+# @section author_runner Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Optional, Union
+import asyncio
+from collections import deque
+from Logger import Logger
+from endpoint_health import get_recent_stats
+
+# Global constants
+## Seconds between two concurrency adjustments.
+ADJUST_INTERVAL = 2
+## Error rate of recent requests above which concurrency is halved.
+BACKOFF_ERROR_RATE = 0.05
+## Times the best p95 latency seen after which concurrency is halved.
+BACKOFF_LATENCY_FACTOR = 3
+## Seconds of p95 latency that never count as slow.
+MIN_BACKOFF_LATENCY = 1.0
+
+class ConcurrencyController:
+    """ Additive increase, multiplicative decrease limit of accounts at once."""
+
+    def __init__(self, max_workers: int):
+        """ Create concurrency controller.
+
+        @param max_workers Most accounts processed at once
+        """
+
+        self.max_workers = max_workers
+        self.limit = max(1, max_workers // 2)
+        self.active = 0
+        self.best_latency: Optional[float] = None
+        self.last_backoff = 0.0
+        self.waiters: deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        """ Wait until an account may start."""
+
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancel, pass it on
+                self.release()
+            else:
+                self.waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """ Let the next account start."""
+
+        self.active -= 1
+        self.wake()
+
+    def wake(self) -> None:
+        """ Hand the free slots to the longest waiting accounts, one waiter per slot."""
+
+        while self.waiters and self.active < self.limit:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+    def adjust(self) -> None:
+        """ Change the limit from the recent results of all endpoints."""
+
+        stats = get_recent_stats()
+        if stats.p95_latency is not None:
+            self.best_latency = stats.p95_latency if self.best_latency is None else min(self.best_latency, stats.p95_latency)
+
+        now = asyncio.get_running_loop().time()
+        slow = stats.p95_latency is not None and stats.p95_latency > max(MIN_BACKOFF_LATENCY, BACKOFF_LATENCY_FACTOR * self.best_latency)
+
+        if stats.error_rate > BACKOFF_ERROR_RATE or slow:
+            # The recent window still holds the results that caused the last backoff
+            if now - self.last_backoff >= ADJUST_INTERVAL * 2:
+                self.limit = max(1, self.limit // 2)
+                self.last_backoff = now
+        elif self.active >= self.limit and stats.requests > 0:
+            self.limit = min(self.max_workers, self.limit + 1)
+            self.wake()
+
+    async def run(self) -> None:
+        """ Adjust the limit until cancelled."""
+
+        while True:
+            await asyncio.sleep(ADJUST_INTERVAL)
+            self.adjust()
+
+# Functions
+def get_workers(settings: Any, key: str) -> int:
+    """ Get worker count from settings.
+
+    @param settings Global settings provided from UI
+    @param key      Name of the workers setting
+
+    @return Worker count, at least 1
+    """
+
+    try:
+        return max(1, int(settings.get(key, 1)))
+    except (TypeError, ValueError):
+        return 1
+
+async def run_accounts(
+    accounts: Union[Iterable[Any], AsyncIterable[Any]],
+    job: Callable[[Any], Awaitable[Any]],
+    workers: int,
+    logger: Logger
+) -> None:
+    """ Run a job for every account, at most workers accounts at once.
+
+    Fewer accounts run at once while the RPC endpoints are throttled or slow.
+    Accounts are taken from the iterator only when a slot is free, so a
+    streamed account set is never held in memory at once. An exception
+    raised by the job is logged against its account and does not stop the
+    other jobs.
+
+    @param accounts Rows from CSV with account data, or an async iterator over them
+    @param job      Coroutine function called with one account
+    @param workers  Maximum number of accounts processed at once
+    @param logger   Logger object for push messages in logger window
+    """
+
+    controller = ConcurrencyController(workers)
+    controller_task = asyncio.create_task(controller.run())
+    running: set[asyncio.Task] = set()
+
+    async def run_account(account: Any) -> None:
+        try:
+            await job(account)
+        except Exception as e:
+            # A row with an empty address is still logged against it
+            logger.error_log(str(account['address']), e)
+        finally:
+            controller.release()
+
+    try:
+        async for account in iterate(accounts):
+            await controller.acquire()
+            task = asyncio.create_task(run_account(account))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        await asyncio.gather(*running)
+    finally:
+        for task in running:
+            task.cancel()
+        controller_task.cancel()
+
+async def iterate(accounts: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    """ Iterate over accounts from a plain or an async iterator.
+
+    @param accounts Accounts
+
+    @return Async iterator over the accounts
+    """
+
+    if isinstance(accounts, AsyncIterable):
+        async for account in accounts:
+            yield account
+    else:
+        for account in accounts:
+            yield account
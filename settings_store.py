@@ -0,0 +1,225 @@
+"""! @brief Defines the cached settings."""
+##
+# @file settings_store.py
+#
+# @brief Defines the cached settings.
+#
+# @section description_settings_store Description
+# Defines the settings object, which parses settings.csv once into typed
+# and validated values and derives the RPC endpoints and contract
+# addresses from them. The parsed settings are cached and parsed again
+# only when the file changes or the settings are saved from the UI.
+#
+# @section libraries_settings_store Libraries/Modules
+# - access to Any type
+# - standart csv library (https://docs.python.org/3/library/csv.html)
+# - standart os library (https://docs.python.org/3/library/os.html)
+# - standart re library (https://docs.python.org/3/library/re.html)
+# - standart threading library (https://docs.python.org/3/library/threading.html)
+#
+# @section author_settings_store Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Any
+import csv
+import os
+import re
+import threading
+
+# Global constants
+## Separators of the endpoints in an endpoint list setting.
+ENDPOINT_SEPARATOR = re.compile(r'[\s,;]+')
+## Type and default value of every setting, None for required settings.
+SETTINGS_FIELDS: dict[str, tuple[type, Any]] = {
+    'nft_url':                (str, None),
+    'mint_price':             (float, None),
+    'gas_price_for_mint':     (float, None),
+    'gas_for_mint':           (int, None),
+    'is_testnet_mint':        (bool, False),
+    'max_gas_in_gwei':        (float, None),
+    'min_amount_for_bridge':  (float, None),
+    'max_amount_for_bridge':  (float, None),
+    'is_testnet_bridge':      (bool, False),
+    'mint_workers':           (int, 5),
+    'bridge_workers':         (int, 10),
+    'rpc_max_in_flight':      (int, 8),
+    'connections_per_client': (int, 10),
+    'client_idle_timeout':    (int, 300),
+    'rpc_batch_size':         (int, 100),
+    'rpc_batch_window_ms':    (int, 5),
+    'mints_per_account':      (int, 1),
+    'fire_at_block':          (int, 0),
+    'fire_at_timestamp':      (int, 0),
+    'account_backend':        (str, 'csv'),
+    'zora_rpc_urls':          (str, ''),
+    'eth_rpc_urls':           (str, ''),
+    'broadcast_transactions': (bool, True)
+}
+## Zora Network RPC endpoints by testnet flag.
+ZORA_RPC = {False: 'https://rpc.zora.energy', True: 'https://testnet.rpc.zora.energy'}
+## Ethereum RPC endpoints by testnet flag.
+ETH_RPC = {False: 'https://eth.llamarpc.com', True: 'https://rpc.ankr.com/eth_goerli'}
+## Bridge contract addresses by testnet flag.
+BRIDGE_CONTRACT_ADDRESS = {False: '0x1a0ad011913A150f69f6A19DF447A0CfD9551054', True: '0xDb9F51790365e7dc196e7D072728df39Be958ACe'}
+## Minter addresses by testnet flag.
+MINTER_ADDRESS = {False: '0x169d9147dfc9409afa4e558df2c9abeebc020182', True: '0xd81351363b7d80b06e4ec4de7989f0f91e41a846'}
+## Fixed price strategy addresses by testnet flag.
+PRICE_STRATEGY_ADDRESS = {False: '0x169d9147dfc9409afa4e558df2c9abeebc020182', True: '0xd81351363b7d80b06E4Ec4De7989f0f91e41A846'}
+
+## Lock for the cached settings.
+settings_lock = threading.Lock()
+## Cached settings by file path, with the modification time they were read at.
+cached_settings: dict[str, tuple[int, 'Settings']] = {}
+
+class Settings:
+    """ Typed settings from settings.csv."""
+
+    def __init__(self, values: dict[str, Any]):
+        """ Create settings.
+
+        @param values Raw values by column, as in settings.csv
+
+        @exception ValueError A setting is missing or has a wrong value
+        """
+
+        self.raw = dict(values)
+        self.values: dict[str, Any] = {}
+        for key, (value_type, default) in SETTINGS_FIELDS.items():
+            self.values[key] = parse_value(key, values.get(key), value_type, default)
+
+        # Derived once, used by every account
+        self.zora_rpcs_for_mint = get_endpoints(self.values['zora_rpc_urls'], ZORA_RPC, self.values['is_testnet_mint'])
+        self.eth_rpcs_for_mint = get_endpoints(self.values['eth_rpc_urls'], ETH_RPC, self.values['is_testnet_mint'])
+        self.zora_rpcs_for_bridge = get_endpoints(self.values['zora_rpc_urls'], ZORA_RPC, self.values['is_testnet_bridge'])
+        self.eth_rpcs_for_bridge = get_endpoints(self.values['eth_rpc_urls'], ETH_RPC, self.values['is_testnet_bridge'])
+        self.bridge_contract_address = BRIDGE_CONTRACT_ADDRESS[self.values['is_testnet_bridge']]
+        self.minter_address = MINTER_ADDRESS[self.values['is_testnet_mint']]
+        self.price_strategy_address = PRICE_STRATEGY_ADDRESS[self.values['is_testnet_mint']]
+
+    def __getitem__(self, key: str) -> Any:
+        return self.values[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """ Get setting.
+
+        @param key     Name of the setting
+        @param default Value if there is no such setting
+
+        @return Value of the setting
+        """
+
+        return self.values.get(key, default)
+
+    def with_values(self, values: dict[str, Any]) -> 'Settings':
+        """ Get settings with some values changed, without saving them.
+
+        @param values Changed values by column
+
+        @return New settings
+
+        @exception ValueError A setting has a wrong value
+        """
+
+        return Settings({**self.raw, **{key: str(value) for key, value in values.items()}})
+
+# Functions
+def parse_value(key: str, value: Any, value_type: type, default: Any) -> Any:
+    """ Parse setting value from settings.csv.
+
+    @param key        Name of the setting
+    @param value      Raw value
+    @param value_type Type of the setting
+    @param default    Value if the setting is empty, None if it is required
+
+    @return Value of the setting
+
+    @exception ValueError The setting is missing or has a wrong value
+    """
+
+    if value is None or str(value).strip() == '':
+        if default is None:
+            raise ValueError(f'Setting {key} is missing')
+        return default
+
+    value = str(value).strip()
+    try:
+        if value_type is bool:
+            if value.lower() not in ('true', 'false', '1', '0'):
+                raise ValueError(value)
+            return value.lower() in ('true', '1')
+        if value_type is int:
+            return int(float(value))
+        return value_type(value)
+    except ValueError:
+        raise ValueError(f'Setting {key} has a wrong value: {value}')
+
+def get_endpoints(endpoint_list: str, defaults: dict[bool, str], testnet: bool) -> list[str]:
+    """ Get the endpoints of a network.
+
+    @param endpoint_list Mainnet endpoints from settings, separated by spaces, commas or semicolons
+    @param defaults      Default endpoints by testnet flag
+    @param testnet       Use testnet, or no
+
+    @return Endpoint URLs, the first one is primary
+    """
+
+    endpoints = [endpoint for endpoint in ENDPOINT_SEPARATOR.split(endpoint_list) if endpoint != '']
+    if testnet or not endpoints:
+        return [defaults[testnet]]
+    return endpoints
+
+def read_settings_file(path: str) -> dict[str, str]:
+    """ Read raw values from settings.csv.
+
+    @param path Path to settings.csv
+
+    @return Raw values by column
+    """
+
+    with open(path, newline='') as file:
+        return next(csv.DictReader(file), {})
+
+def load_settings(path: str) -> Settings:
+    """ Get settings, parsing the file again only if it changed.
+
+    @param path Path to settings.csv
+
+    @return Settings
+    """
+
+    mtime = os.stat(path).st_mtime_ns
+    with settings_lock:
+        cached = cached_settings.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        settings = Settings(read_settings_file(path))
+        cached_settings[path] = (mtime, settings)
+        return settings
+
+def save_settings(path: str, values: dict[str, Any]) -> Settings:
+    """ Validate changed settings and write them to settings.csv.
+
+    @param path   Path to settings.csv
+    @param values Changed values by column
+
+    @return Settings after the change
+
+    @exception ValueError A setting has a wrong value, nothing is written
+    """
+
+    with settings_lock:
+        raw = read_settings_file(path)
+        raw.update({key: str(value) for key, value in values.items()})
+        settings = Settings(raw)
+
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(raw), lineterminator='\n')
+            writer.writeheader()
+            writer.writerow(raw)
+        os.replace(temporary_path, path)
+
+        cached_settings[path] = (os.stat(path).st_mtime_ns, settings)
+        return settings
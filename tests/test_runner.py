@@ -0,0 +1,64 @@
+"""! @brief Tests of the account runner."""
+##
+# @file test_runner.py
+#
+# @brief Tests of the account runner.
+#
+# @section description_test_runner Description
+# Checks that a failed account stops only its own job, also when its row
+# has no usable address. Run from the software folder:
+#
+#     python -m unittest discover tests
+#
+# @section libraries_test_runner Libraries/Modules
+# - standart asyncio library (https://docs.python.org/3/library/asyncio.html)
+# - standart os library (https://docs.python.org/3/library/os.html)
+# - standart tempfile library (https://docs.python.org/3/library/tempfile.html)
+# - standart unittest library (https://docs.python.org/3/library/unittest.html)
+# - access to Logger type
+# - access to account runner
+#
+# @section author_test_runner Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+import asyncio
+import os
+import tempfile
+import unittest
+from Logger import Logger
+from runner import run_accounts
+
+class RunAccountsTest(unittest.TestCase):
+    """ Tests of run_accounts."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.directory.name, 'logs.log')
+        self.logger = Logger()
+        self.logger.create_file_logger('test_runner', self.log_file)
+
+    def tearDown(self):
+        for handler in list(self.logger.file_logger.handlers):
+            self.logger.file_logger.removeHandler(handler)
+            handler.close()
+        self.directory.cleanup()
+
+    def test_bad_address_fails_only_its_own_job(self):
+        address = '0x0000000000000000000000000000000000000001'
+        accounts = [{'address': float('nan')}, {'address': None}, {'address': address}]
+        finished = []
+
+        async def job(account):
+            if not isinstance(account['address'], str):
+                raise ValueError('Invalid address')
+            finished.append(account['address'])
+
+        asyncio.run(run_accounts(accounts, job, 2, self.logger))
+
+        self.assertEqual(finished, [address])
+        with open(self.log_file) as log:
+            self.assertEqual(log.read().count('Invalid address'), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""! @brief Defines the headless command line entry point."""
+##
+# @file zora.py
+#
+# @brief Defines the headless command line entry point.
+#
+# @section description_zora Description
+# Runs mint or bridge for all eligible accounts from the terminal, without
+# loading or rendering the gui, so the software can run on servers and cron
+# hosts without a display. Messages go to the terminal and a log file.
+#
+#     python -m zora run mint --accounts accounts.csv --workers 20
+#
+# @section libraries_zora Libraries/Modules
+# - access to Optional type
+# - standart argparse library (https://docs.python.org/3/library/argparse.html)
+# - standart sys library (https://docs.python.org/3/library/sys.html)
+# - access to console logger
+# - access to account store
+# - access to lazy module imports
+#
+# @section author_zora Author(s)
+# - Created by mutedspectre.eth on 10/16/2026.
+
+# Imports
+from typing import Optional
+import argparse
+import sys
+from Logger import ConsoleLogger
+from account_store import set_accounts_file, uses_account_database
+from lazy_module import lazy_import
+
+bridge_logic = lazy_import('bridge_logic')
+mint_logic = lazy_import('mint_logic')
+
+# Functions
+def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
+    """ Parse command line arguments.
+
+    @param args Arguments without the program name, sys.argv if None
+
+    @return Parsed arguments
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m zora', description='Zora Software without gui.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run mint or bridge for all eligible accounts')
+    run.add_argument('job', choices=('mint', 'bridge'), help='what to run')
+    run.add_argument('--accounts', help='path to accounts.csv, the one next to the software by default (csv account backend only)')
+    run.add_argument('--workers', type=int, help='most accounts at once, the workers setting by default')
+    run.add_argument('--log-file', default='logs.log', help='path to the log file (default: logs.log)')
+
+    return parser.parse_args(args)
+
+def main(args: Optional[list[str]] = None) -> int:
+    """ Run the command from the command line.
+
+    @param args Arguments without the program name, sys.argv if None
+
+    @return Exit code, 0 if the run finished
+    """
+
+    args = parse_args(args)
+
+    if args.workers is not None and args.workers < 1:
+        print('--workers must be at least 1', file=sys.stderr)
+        return 2
+    if args.accounts is not None:
+        if uses_account_database():
+            # The database is filled from accounts.csv only once, another file would be ignored
+            print('--accounts needs the csv account backend, the sqlite backend uses accounts.db', file=sys.stderr)
+            return 2
+        set_accounts_file(args.accounts)
+
+    logger = ConsoleLogger()
+    logger.create_logger(args.job, args.log_file)
+
+    if args.job == 'mint':
+        finished = mint_logic.start_mint(logger, args.workers)
+    else:
+        finished = bridge_logic.start_bridge(logger, args.workers)
+
+    return 0 if finished else 1
+
+# script entry point
+if __name__ == '__main__':
+    sys.exit(main())